@@ -1,6 +1,8 @@
 """Shared test fixtures."""
 
-import asyncio
+import os
+import uuid
+from types import MappingProxyType
 
 import pytest
 import pytest_asyncio
@@ -21,34 +23,40 @@ class MockLLMPlugin(BaseEvalPlugin):
     plugin_id = "mock_llm"
     plugin_type = EvalPluginType.LLM
 
+    _INFO = EvalPluginMetadata(
+        name="Mock LLM Plugin",
+        plugin_id="mock_llm",
+        version="0.1.0",
+        description="Mock plugin for testing",
+        plugin_type=EvalPluginType.LLM,
+        supported_benchmarks=["mmlu", "hellaswag", "arc_easy"],
+    )
+    _BENCHMARKS = (
+        MappingProxyType({"id": "mmlu", "name": "MMLU", "metric": "accuracy"}),
+        MappingProxyType({"id": "hellaswag", "name": "HellaSwag", "metric": "accuracy"}),
+        MappingProxyType({"id": "arc_easy", "name": "ARC Easy", "metric": "accuracy"}),
+    )
+
     def get_plugin_info(self) -> EvalPluginMetadata:
-        return EvalPluginMetadata(
-            name="Mock LLM Plugin",
-            plugin_id="mock_llm",
-            version="0.1.0",
-            description="Mock plugin for testing",
-            plugin_type=EvalPluginType.LLM,
-            supported_benchmarks=["mmlu", "hellaswag", "arc_easy"],
-        )
+        return self._INFO
 
     def get_supported_benchmarks(self) -> list[dict]:
-        return [
-            {"id": "mmlu", "name": "MMLU", "metric": "accuracy"},
-            {"id": "hellaswag", "name": "HellaSwag", "metric": "accuracy"},
-            {"id": "arc_easy", "name": "ARC Easy", "metric": "accuracy"},
-        ]
+        return list(self._BENCHMARKS)
 
     async def run_evaluation(self, model_spec, benchmark_ids, config, progress_callback=None):
-        results = []
-        for i, bid in enumerate(benchmark_ids):
-            if progress_callback:
-                await progress_callback(bid, i, len(benchmark_ids), f"Evaluating {bid}")
-            results.append(self.make_result(
+        results = [
+            self.make_result(
                 task_id=bid,
                 score=75.0 + i * 5,
                 raw_score=0.75 + i * 0.05,
                 raw_metric_name="accuracy",
-            ))
+            )
+            for i, bid in enumerate(benchmark_ids)
+        ]
+        if progress_callback:
+            total = len(benchmark_ids)
+            for i, bid in enumerate(benchmark_ids):
+                await progress_callback(bid, i, total, f"Evaluating {bid}")
         return results
 
     def validate_model(self, model_spec):
@@ -57,37 +65,77 @@ class MockLLMPlugin(BaseEvalPlugin):
         return False, "Not an LLM model"
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def pytest_collection_modifyitems(items):
+    """Run async tests on the session loop shared with the session-scoped fixtures."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
-@pytest_asyncio.fixture
-async def storage(tmp_path):
-    """Create a temporary SQLite storage for testing."""
-    db_path = tmp_path / "test.db"
-    s = SQLiteStorage(db_path)
+async def _deferred_commit() -> None:
+    """Stand-in for ``commit()`` while a test runs inside a savepoint."""
+
+
+# Durability is irrelevant for tests: keep the journal and temp tables in RAM.
+TEST_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_storage():
+    """In-memory SQLite storage initialized and seeded once for the whole session.
+
+    The shared-cache database lives as long as the storage connection stays open.
+    Each pytest-xdist worker builds its own database.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    db_uri = f"file:teststorage_{worker}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    s = SQLiteStorage(db_uri, pragmas=TEST_PRAGMAS)
     await s.initialize()
+    await seed_builtin_suites(s)
     yield s
     await s.close()
 
 
+@pytest_asyncio.fixture
+async def storage(session_storage, monkeypatch):
+    """Session storage wrapped in a savepoint that is rolled back after each test.
+
+    Commits issued by the storage layer are deferred so every write a test
+    makes stays inside the savepoint, and rollbacks only unwind to it.
+    """
+    db = session_storage._db
+
+    async def _rollback_to_savepoint() -> None:
+        await db.execute("ROLLBACK TO test_sp")
+
+    monkeypatch.setattr(db, "commit", _deferred_commit)
+    monkeypatch.setattr(db, "rollback", _rollback_to_savepoint)
+    await db.execute("SAVEPOINT test_sp")
+    try:
+        yield session_storage
+    finally:
+        await db.execute("ROLLBACK TO test_sp")
+        await db.execute("RELEASE test_sp")
+
+
 @pytest_asyncio.fixture
 async def seeded_storage(storage):
-    """Storage with built-in suites seeded."""
-    await seed_builtin_suites(storage)
+    """Storage with built-in suites seeded (seeding happens once per session)."""
     return storage
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_plugin():
     """Create a mock LLM plugin."""
     return MockLLMPlugin()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plugin_registry(mock_plugin):
     """Create a registry with mock plugin."""
     registry = PluginRegistry()
@@ -95,21 +143,21 @@ def plugin_registry(mock_plugin):
     return registry
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_model():
-    """Sample model data for testing."""
-    return {
+    """Sample model data for testing (read-only; copy with dict() to modify)."""
+    return MappingProxyType({
         "name": "Test Model",
         "model_type": "llm",
         "source_type": "local",
         "deployment_target": "server",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_model_hf():
-    """Sample HuggingFace model data."""
-    return {
+    """Sample HuggingFace model data (read-only)."""
+    return MappingProxyType({
         "name": "Phi-3-mini",
         "model_type": "llm",
         "source_type": "huggingface",
@@ -117,4 +165,4 @@ def sample_model_hf():
         "deployment_target": "server",
         "parameter_count_b": 3.8,
         "context_window": 4096,
-    }
+    })
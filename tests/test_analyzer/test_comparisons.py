@@ -1,6 +1,7 @@
 """Tests for the analyzer.comparisons module."""
 
 from voicelearn_eval.analyzer.comparisons import (
+    _get_radar_dimensions,
     build_radar_data,
     compare_model_results,
 )
@@ -50,3 +51,12 @@ class TestBuildRadarData:
         assert data[0]["model_name"] == "A"
         assert len(data[0]["values"]) == 1
         assert data[0]["values"][0] == 85.0
+
+    def test_tier_dimensions_follow_curriculum_order(self):
+        mr = [
+            _make_model_results("A", "a", [80], tier="grad"),
+            _make_model_results("B", "b", [70], tier="elementary"),
+            _make_model_results("C", "c", [60], tier="highschool"),
+            _make_model_results("D", "d", [50], tier="undergrad"),
+        ]
+        assert _get_radar_dimensions(mr) == ["elementary", "highschool", "undergrad", "grad"]
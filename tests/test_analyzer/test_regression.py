@@ -1,5 +1,7 @@
 """Tests for the analyzer.regression module."""
 
+import pytest
+
 from voicelearn_eval.analyzer.regression import (
     RegressionSeverity,
     ci_exit_code,
@@ -15,28 +17,38 @@ class TestDetectRegressions:
         assert result["has_regression"] is False
         assert result["overall_severity"] == RegressionSeverity.NONE
 
-    def test_minor_regression(self):
-        baseline = [{"task_name": "math", "score": 80}]
-        current = [{"task_name": "math", "score": 77}]  # ~3.75% decline
-        result = detect_regressions(current, baseline)
-        assert result["has_regression"] is True
-        assert result["tasks"][0]["severity"] == RegressionSeverity.MINOR
-
-    def test_critical_regression(self):
-        """Dropping below the passing threshold is critical."""
-        baseline = [{"task_name": "math", "score": 75}]
-        current = [{"task_name": "math", "score": 65}]
-        result = detect_regressions(current, baseline, threshold=70.0)
+    @pytest.mark.parametrize(
+        "baseline_score, current_score, threshold, expected",
+        [
+            (80, 77, 70.0, RegressionSeverity.MINOR),  # ~3.75% decline
+            # Dropping below the passing threshold is critical
+            (75, 65, 70.0, RegressionSeverity.CRITICAL),
+            # Both scores above threshold so not critical, but >15% decline = severe
+            (90, 74, 70.0, RegressionSeverity.SEVERE),
+        ],
+    )
+    def test_regression_severity(self, baseline_score, current_score, threshold, expected):
+        baseline = [{"task_name": "math", "score": baseline_score}]
+        current = [{"task_name": "math", "score": current_score}]
+        result = detect_regressions(current, baseline, threshold=threshold)
         assert result["has_regression"] is True
-        assert result["tasks"][0]["severity"] == RegressionSeverity.CRITICAL
+        assert result["tasks"][0]["severity"] == expected
 
-    def test_severe_regression(self):
-        # Both scores above threshold so not critical, but >15% decline = severe
-        baseline = [{"task_name": "math", "score": 90}]
-        current = [{"task_name": "math", "score": 74}]  # ~17.8% decline, stays above 70
+    def test_tasks_sorted_worst_first(self):
+        baseline = [
+            {"task_name": "a", "score": 80},
+            {"task_name": "b", "score": 75},
+            {"task_name": "c", "score": 90},
+        ]
+        current = [
+            {"task_name": "a", "score": 77},
+            {"task_name": "b", "score": 65},
+            {"task_name": "c", "score": 95},
+        ]
         result = detect_regressions(current, baseline)
-        assert result["has_regression"] is True
-        assert result["tasks"][0]["severity"] == RegressionSeverity.SEVERE
+        assert [t["task_name"] for t in result["tasks"]] == ["b", "a", "c"]
+        assert result["overall_severity"] == RegressionSeverity.CRITICAL
+        assert result["regression_count"] == 2
 
     def test_unmatched_tasks_ignored(self):
         baseline = [{"task_name": "math", "score": 80}]
@@ -47,11 +59,13 @@ class TestDetectRegressions:
 
 
 class TestCiExitCode:
-    def test_clean(self):
-        assert ci_exit_code({"overall_severity": RegressionSeverity.NONE}) == 0
-
-    def test_minor(self):
-        assert ci_exit_code({"overall_severity": RegressionSeverity.MINOR}) == 1
-
-    def test_critical(self):
-        assert ci_exit_code({"overall_severity": RegressionSeverity.CRITICAL}) == 2
+    @pytest.mark.parametrize(
+        "severity, expected",
+        [
+            (RegressionSeverity.NONE, 0),
+            (RegressionSeverity.MINOR, 1),
+            (RegressionSeverity.CRITICAL, 2),
+        ],
+    )
+    def test_exit_code(self, severity, expected):
+        assert ci_exit_code({"overall_severity": severity}) == expected
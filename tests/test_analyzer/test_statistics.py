@@ -1,8 +1,10 @@
 """Tests for the analyzer.statistics module."""
 
+import pytest
 
 from voicelearn_eval.analyzer.statistics import (
     aggregate_scores,
+    aggregate_with_categories,
     percentile,
     score_by_category,
 )
@@ -61,15 +63,30 @@ class TestScoreByCategory:
         assert "unknown" in grouped
 
 
-class TestPercentile:
-    def test_median(self):
-        assert percentile([10, 20, 30, 40, 50], 50) == 30
-
-    def test_percentile_0(self):
-        assert percentile([10, 20, 30], 0) == 10
+class TestAggregateWithCategories:
+    def test_matches_separate_aggregations(self):
+        results = [
+            {"score": 80, "education_tier": "elementary"},
+            {"score": 90, "education_tier": "elementary"},
+            {"score": 60, "education_tier": "grad"},
+            {"score": None, "education_tier": "undergrad"},
+            {"score": 75},
+        ]
+        overall, by_tier = aggregate_with_categories(results, "education_tier")
+        assert overall == aggregate_scores(results)
+        assert by_tier == score_by_category(results, "education_tier")
+        assert by_tier["undergrad"]["count"] == 0
 
-    def test_percentile_100(self):
-        assert percentile([10, 20, 30], 100) == 30
 
-    def test_empty_list(self):
-        assert percentile([], 50) == 0.0
+class TestPercentile:
+    @pytest.mark.parametrize(
+        "scores, p, expected",
+        [
+            ([10, 20, 30, 40, 50], 50, 30),  # median
+            ([10, 20, 30], 0, 10),
+            ([10, 20, 30], 100, 30),
+            ([], 50, 0.0),
+        ],
+    )
+    def test_percentile(self, scores, p, expected):
+        assert percentile(scores, p) == expected
@@ -0,0 +1,64 @@
+"""Tests for the API response cache."""
+
+from types import SimpleNamespace
+
+from voicelearn_eval.api import cache as cache_module
+from voicelearn_eval.api.cache import ResponseCache
+from voicelearn_eval.api.routes.runs import delete_run
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    def test_entry_expires_after_ttl(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=clock))
+        cache = ResponseCache()
+        cache.set("trends", ("m1",), {"trends": []}, ttl=60)
+
+        clock.now += 59
+        assert cache.get("trends", ("m1",)) == {"trends": []}
+        clock.now += 1
+        assert cache.get("trends", ("m1",)) is None
+
+    def test_oldest_entry_is_evicted(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("suites", ("a",), 1, ttl=60)
+        cache.set("suites", ("b",), 2, ttl=60)
+        cache.set("suites", ("c",), 3, ttl=60)
+
+        assert cache.get("suites", ("a",)) is None
+        assert cache.get("suites", ("b",)) == 2
+        assert cache.get("suites", ("c",)) == 3
+
+    def test_clear_namespace(self):
+        cache = ResponseCache()
+        cache.set("trends", ("a",), 1, ttl=60)
+        cache.set("trends", ("b",), 2, ttl=60)
+        cache.set("suites", ("a",), 3, ttl=60)
+
+        cache.clear("trends")
+        assert cache.get("trends", ("a",)) is None
+        assert cache.get("trends", ("b",)) is None
+        assert cache.get("suites", ("a",)) == 3
+
+        cache.clear()
+        assert cache.get("suites", ("a",)) is None
+
+    async def test_deleting_a_run_clears_trends(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suite_id = (await seeded_storage.list_suites())[0]["id"]
+        run_id = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+        cache = ResponseCache()
+        cache.set("trends", (None, None, 20), {"trends": [run_id]}, ttl=60)
+        cache.set("suites", ("a",), 1, ttl=60)
+
+        await delete_run(run_id, storage=seeded_storage, cache=cache)
+        assert cache.get("trends", (None, None, 20)) is None
+        assert cache.get("suites", ("a",)) == 1
@@ -0,0 +1,61 @@
+"""Tests for the grade-level matrix endpoints."""
+
+import json
+
+from fastapi import BackgroundTasks
+
+from voicelearn_eval.api.routes.grade_matrix import get_grade_matrix
+
+
+async def _completed_run(storage, model_id, suite_id, scores):
+    run_id = await storage.create_run({"model_id": model_id, "suite_id": suite_id})
+    await storage.update_run(run_id, {"status": "completed", "overall_score": 80.0})
+    tasks = await storage.get_tasks_for_suite(suite_id)
+    await storage.create_task_results([
+        {"run_id": run_id, "task_id": task["id"], "score": score, "status": "completed"}
+        for task, score in zip(tasks, scores)
+    ])
+    return run_id
+
+
+async def _matrix(storage, model_id):
+    background = BackgroundTasks()
+    response = await get_grade_matrix(background, model_id=model_id, storage=storage)
+    return json.loads(response.body), background
+
+
+class TestGradeMatrix:
+    async def test_backfill_persists_rating_for_next_request(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suite_id = (await seeded_storage.get_suite_by_slug("quick_scan"))["id"]
+        run_id = await _completed_run(seeded_storage, model_id, suite_id, [80.0, 75.0, 90.0])
+
+        body, background = await _matrix(seeded_storage, model_id)
+        assert body["matrix"] == []
+        assert len(background.tasks) == 1
+        await background()
+
+        metrics = json.loads((await seeded_storage.get_run(run_id))["overall_metrics"])
+        assert metrics["grade_level"]["run_id"] == run_id
+
+        body, background = await _matrix(seeded_storage, model_id)
+        assert [row["run_id"] for row in body["matrix"]] == [run_id]
+        assert body["matrix"][0]["grade_level"] == metrics["grade_level"]
+        assert background.tasks == []
+
+    async def test_run_without_results_is_checked_once(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suite_id = (await seeded_storage.get_suite_by_slug("quick_scan"))["id"]
+        run_id = await _completed_run(seeded_storage, model_id, suite_id, [])
+
+        body, background = await _matrix(seeded_storage, model_id)
+        assert len(background.tasks) == 1
+        await background()
+
+        metrics = json.loads((await seeded_storage.get_run(run_id))["overall_metrics"])
+        assert metrics == {"grade_level": None, "grade_level_checked": True}
+
+        # Nothing to rate, so later requests neither list it nor reschedule it
+        body, background = await _matrix(seeded_storage, model_id)
+        assert body["matrix"] == []
+        assert background.tasks == []
@@ -0,0 +1,178 @@
+"""Tests for the HuggingFace Hub lookups behind model search and import."""
+
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import httpx
+import huggingface_hub
+import pytest
+from fastapi import HTTPException
+
+from voicelearn_eval.api import app as app_module
+from voicelearn_eval.api.routes import models as models_module
+from voicelearn_eval.api.routes.models import import_from_huggingface, search_huggingface
+from voicelearn_eval.core.schemas import HuggingFaceImport
+
+SEARCH_PAYLOAD = [
+    {
+        "id": "acme/tiny-llm",
+        "downloads": 12,
+        "likes": 3,
+        "pipeline_tag": "text-generation",
+        "tags": ["en"],
+        "lastModified": "2026-01-01T00:00:00.000Z",
+        "safetensors": {"parameters": {"BF16": 1_000_000_000, "F32": 240_000_000}},
+    },
+    {"downloads": 5},  # malformed: no id
+    "not-a-model",
+]
+
+
+@pytest.fixture(autouse=True)
+def _empty_hf_cache():
+    models_module._hf_cache.clear()
+    models_module._hf_inflight.clear()
+    yield
+    models_module._hf_cache.clear()
+    models_module._hf_inflight.clear()
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://huggingface.co")
+
+
+async def _search(client, q="tiny"):
+    return await search_huggingface(q=q, task=None, sort="downloads", limit=20, hf_client=client)
+
+
+class TestSearch:
+    async def test_maps_results_and_skips_malformed_entries(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+        async with _client(handler) as client:
+            page = await _search(client)
+
+        assert requests[0].url.path == "/api/models"
+        assert requests[0].url.params["search"] == "tiny"
+        assert page["items"] == [{
+            "repo_id": "acme/tiny-llm",
+            "name": "tiny-llm",
+            "author": "acme",
+            "downloads": 12,
+            "likes": 3,
+            "pipeline_tag": "text-generation",
+            "tags": ["en"],
+            "last_modified": "2026-01-01T00:00:00.000Z",
+            "parameter_count_b": 1.24,
+        }]
+
+    async def test_repeat_lookup_is_served_from_cache_until_ttl(self, monkeypatch):
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(models_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+        async with _client(handler) as client:
+            first = await _search(client)
+            clock.now += models_module._HF_CACHE_TTL - 1
+            assert await _search(client) == first
+            assert calls == 1
+            clock.now += 1
+            await _search(client)
+            assert calls == 2
+
+    async def test_concurrent_identical_lookups_share_one_request(self):
+        calls = 0
+        release = asyncio.Event()
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return httpx.Response(200, json=SEARCH_PAYLOAD)
+
+        async with _client(handler) as client:
+            pending = [asyncio.ensure_future(_search(client)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            release.set()
+            first, second = await asyncio.gather(*pending)
+
+        assert calls == 1
+        assert first == second
+        assert models_module._hf_inflight == {}
+
+    async def test_upstream_error_is_400(self):
+        async with _client(lambda request: httpx.Response(503)) as client:
+            with pytest.raises(HTTPException) as exc:
+                await _search(client)
+        assert exc.value.status_code == 400
+        assert models_module._hf_inflight == {}
+
+    async def test_failed_lookup_with_no_callers_left_is_retrieved(self):
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(503)
+
+        loop = asyncio.get_running_loop()
+        reported = []
+        previous = loop.get_exception_handler()
+        loop.set_exception_handler(lambda _loop, context: reported.append(context))
+        try:
+            async with _client(handler) as client:
+                caller = asyncio.ensure_future(_search(client))
+                await asyncio.sleep(0.01)
+                caller.cancel()
+                lookup = next(iter(models_module._hf_inflight.values()))
+                release.set()
+                await asyncio.wait([lookup])
+                del lookup
+                gc.collect()
+        finally:
+            loop.set_exception_handler(previous)
+        assert reported == []
+
+
+class TestImport:
+    @pytest.mark.parametrize("repo_id", ["../whoami-v2", "acme/tiny/../../x", "acme/tiny?x=1", "/acme"])
+    async def test_invalid_repo_id_is_rejected_before_any_request(self, storage, repo_id):
+        def handler(request):
+            raise AssertionError(f"unexpected Hub request: {request.url}")
+
+        body = HuggingFaceImport(repo_id=repo_id, model_type="llm")
+        async with _client(handler) as client:
+            with pytest.raises(HTTPException) as exc:
+                await import_from_huggingface(body, storage=storage, hf_client=client)
+        assert exc.value.status_code == 400
+
+    async def test_imports_model_info(self, storage):
+        def handler(request):
+            assert request.url.path == "/api/models/acme/tiny-llm"
+            return httpx.Response(200, json=SEARCH_PAYLOAD[0])
+
+        body = HuggingFaceImport(repo_id="acme/tiny-llm", model_type="llm")
+        async with _client(handler) as client:
+            model = await import_from_huggingface(body, storage=storage, hf_client=client)
+        assert model["source_uri"] == "acme/tiny-llm"
+        assert model["model_family"] == "acme"
+        assert model["parameter_count_b"] == 1.24
+
+
+class TestAuthHeaders:
+    def test_token_is_sent_when_logged_in(self, monkeypatch):
+        monkeypatch.setattr(huggingface_hub, "get_token", lambda: "hf_abc")
+        assert app_module._hf_auth_headers() == {"Authorization": "Bearer hf_abc"}
+
+    def test_anonymous_without_token(self, monkeypatch):
+        monkeypatch.setattr(huggingface_hub, "get_token", lambda: None)
+        assert app_module._hf_auth_headers() == {}
@@ -0,0 +1,61 @@
+"""Tests for list endpoint pagination."""
+
+import pytest
+from fastapi import HTTPException
+
+from voicelearn_eval.api.pagination import decode_cursor, encode_cursor, paginate, with_cursor
+
+ROWS = [{"id": f"row-{i}", "created_at": f"2026-01-{10 - i:02d} 00:00:00"} for i in range(5)]
+
+
+async def _count() -> int:
+    return len(ROWS)
+
+
+async def _fetch(limit: int, offset: int) -> list[dict]:
+    return ROWS[offset:offset + limit]
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor(ROWS[2])
+        assert decode_cursor(cursor) == (ROWS[2]["created_at"], ROWS[2]["id"])
+
+    @pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24=", "WzEsIDJd", "WyJhIl0="])
+    def test_malformed_cursor_is_400(self, cursor):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor)
+        assert exc.value.status_code == 400
+
+    def test_with_cursor(self):
+        filters = {"model_id": "m1"}
+        assert with_cursor(filters, None) is filters
+        cursor = encode_cursor(ROWS[0])
+        assert with_cursor(filters, cursor) == {"model_id": "m1", "after": (ROWS[0]["created_at"], ROWS[0]["id"])}
+        assert "after" not in filters
+
+
+class TestPaginate:
+    async def test_first_page_has_more(self):
+        page = await paginate(_fetch, _count, limit=2, offset=0)
+        assert page["items"] == ROWS[:2]
+        assert page["has_more"] is True
+        assert decode_cursor(page["next_cursor"]) == (ROWS[1]["created_at"], ROWS[1]["id"])
+        assert "total" not in page
+
+    async def test_last_page(self):
+        page = await paginate(_fetch, _count, limit=2, offset=4)
+        assert page["items"] == ROWS[4:]
+        assert page["has_more"] is False
+        assert page["next_cursor"] is None
+
+    async def test_exact_fit_is_last_page(self):
+        page = await paginate(_fetch, _count, limit=5, offset=0)
+        assert page["items"] == ROWS
+        assert page["has_more"] is False
+        assert page["next_cursor"] is None
+
+    async def test_with_total(self):
+        page = await paginate(_fetch, _count, limit=2, offset=0, with_total=True)
+        assert page["total"] == len(ROWS)
+        assert page["has_more"] is True
@@ -0,0 +1,137 @@
+"""Tests for the WebSocket connection manager."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from voicelearn_eval.api import websocket
+from voicelearn_eval.api.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent: list[dict] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(json.loads(message))
+
+
+def _update(percent: float, index: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        task_name=f"task {index}",
+        task_index=index,
+        total_tasks=10,
+        percent_complete=percent,
+        message=f"step {index}",
+    )
+
+
+async def _manager(*sockets: FakeWebSocket) -> ConnectionManager:
+    manager = ConnectionManager()
+    for ws in sockets:
+        await manager.connect(ws)
+    return manager
+
+
+class TestProgressCoalescing:
+    async def test_updates_in_window_arrive_as_one_batch(self):
+        ws = FakeWebSocket()
+        manager = await _manager(ws)
+
+        for i in range(3):
+            await manager.send_progress("run-1", _update(10.0 * (i + 1), i))
+        assert ws.sent == []
+
+        await asyncio.sleep(websocket._PROGRESS_FLUSH_DELAY * 3)
+        assert len(ws.sent) == 1
+        assert ws.sent[0]["type"] == "progress_batch"
+        assert [u["task_index"] for u in ws.sent[0]["updates"]] == [0, 1, 2]
+        assert ws.sent[0]["updates"][0] == {
+            "type": "progress",
+            "run_id": "run-1",
+            "task_name": "task 0",
+            "task_index": 0,
+            "total_tasks": 10,
+            "percent_complete": 10.0,
+            "message": "step 0",
+        }
+        assert manager._flush_task is None
+
+    async def test_completion_flushes_at_once_and_cancels_timer(self):
+        ws = FakeWebSocket()
+        manager = await _manager(ws)
+
+        await manager.send_progress("run-1", _update(50.0, 0))
+        timer = manager._flush_task
+        assert timer is not None
+
+        await manager.send_progress("run-1", _update(100.0, 1))
+        assert [[u["percent_complete"] for u in frame["updates"]] for frame in ws.sent] == [[50.0, 100.0]]
+        assert manager._flush_task is None
+        await asyncio.sleep(0)
+        assert timer.cancelled()
+
+        # The cancelled timer sends nothing more
+        await asyncio.sleep(websocket._PROGRESS_FLUSH_DELAY * 3)
+        assert len(ws.sent) == 1
+
+    async def test_no_update_is_lost_or_reordered_across_flushes(self):
+        ws = FakeWebSocket()
+        manager = await _manager(ws)
+
+        sent = []
+        for i in range(12):
+            percent = 100.0 if i in (4, 11) else 5.0 * i
+            await manager.send_progress(f"run-{i % 2}", _update(percent, i))
+            sent.append(i)
+            if i % 3 == 0:
+                await asyncio.sleep(websocket._PROGRESS_FLUSH_DELAY * 2)
+        await asyncio.sleep(websocket._PROGRESS_FLUSH_DELAY * 3)
+
+        received = [u["task_index"] for frame in ws.sent for u in frame["updates"]]
+        assert received == sent
+        assert len(ws.sent) > 1
+        assert all(frame["type"] == "progress_batch" for frame in ws.sent)
+
+
+class TestBroadcast:
+    async def test_single_connection_that_fails_is_dropped(self):
+        ws = FakeWebSocket(fail=True)
+        manager = await _manager(ws)
+
+        await manager.broadcast({"type": "ping"})
+        assert manager.active_connections == set()
+
+    async def test_single_connection_receives_message(self):
+        ws = FakeWebSocket()
+        manager = await _manager(ws)
+
+        await manager.broadcast({"type": "ping"})
+        assert ws.sent == [{"type": "ping"}]
+        assert manager.active_connections == {ws}
+
+    async def test_dead_sockets_are_swept_and_others_still_receive(self):
+        healthy = [FakeWebSocket() for _ in range(3)]
+        dead = FakeWebSocket(fail=True)
+        manager = await _manager(healthy[0], dead, *healthy[1:])
+
+        await manager.broadcast({"type": "ping"})
+        assert manager.active_connections == set(healthy)
+        assert all(ws.sent == [{"type": "ping"}] for ws in healthy)
+
+    async def test_sends_span_several_batches(self, monkeypatch):
+        monkeypatch.setattr(websocket, "_BROADCAST_BATCH", 2)
+        healthy = [FakeWebSocket() for _ in range(4)]
+        dead = [FakeWebSocket(fail=True) for _ in range(2)]
+        manager = await _manager(*healthy, *dead)
+
+        await manager.broadcast({"type": "ping"})
+        await manager.broadcast({"type": "pong"})
+        assert manager.active_connections == set(healthy)
+        assert all(ws.sent == [{"type": "ping"}, {"type": "pong"}] for ws in healthy)
@@ -0,0 +1,52 @@
+"""Tests for the shared CLI helpers."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+from click.testing import CliRunner
+
+from voicelearn_eval.cli import _helpers
+from voicelearn_eval.cli.main import cli
+
+
+class TestSharedStorage:
+    def test_invocations_reuse_one_connection(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("VOICELEARN_SHARED_STORAGE", "1")
+        db = str(tmp_path / "shared.db")
+        runner = CliRunner()
+        try:
+            result = runner.invoke(cli, ["--db", db, "model", "add", "--name", "Shared", "--type", "llm",
+                                         "--source", "local"])
+            assert result.exit_code == 0, result.output
+            storage, _ = _helpers._STORAGE_CACHE[(None, db)]
+            connection = storage._db
+
+            result = runner.invoke(cli, ["--db", db, "model", "info", "shared"])
+            assert result.exit_code == 0, result.output
+            assert "Shared" in result.output
+            assert list(_helpers._STORAGE_CACHE) == [(None, db)]
+            assert storage._db is connection
+        finally:
+            _helpers.close_shared_storage()
+        assert _helpers._STORAGE_CACHE == {}
+
+    def test_process_exits_without_explicit_close(self, tmp_path):
+        # Two commands in one process, then a normal interpreter exit: the
+        # exit hook must close the connection or its thread blocks shutdown
+        script = textwrap.dedent(f"""
+            from voicelearn_eval.cli.main import cli
+
+            for args in (["model", "add", "--name", "A", "--type", "llm", "--source", "local"],
+                         ["model", "info", "a"]):
+                try:
+                    cli(["--db", {str(tmp_path / "exit.db")!r}, *args])
+                except SystemExit as e:
+                    assert not e.code, e.code
+        """)
+        env = {**os.environ, "VOICELEARN_SHARED_STORAGE": "1"}
+        result = subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=30,
+        )
+        assert result.returncode == 0, result.stderr
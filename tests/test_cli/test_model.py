@@ -0,0 +1,67 @@
+"""Tests for the model CLI commands."""
+
+import sqlite3
+
+import huggingface_hub
+from click.testing import CliRunner
+from huggingface_hub.hf_api import ModelInfo
+
+from voicelearn_eval.cli import model as model_cli
+from voicelearn_eval.cli.main import cli
+
+
+def _hub_info() -> ModelInfo:
+    return ModelInfo(
+        id="acme/tiny-llm",
+        tags=["text-generation", "en"],
+        safetensors={"parameters": {"BF16": 1_240_000_000}, "total": 1_240_000_000},
+    )
+
+
+class StubHfApi:
+    """HfApi stand-in that records how the listing was requested."""
+
+    list_kwargs: dict = {}
+
+    def model_info(self, repo_id, timeout=None):
+        return _hub_info()
+
+    def list_models(self, **kwargs):
+        StubHfApi.list_kwargs = kwargs
+        return iter([_hub_info()])
+
+
+_RECORD_COLUMNS = (
+    "name, slug, model_type, source_type, source_uri, deployment_target,"
+    " model_family, tags, languages, parameter_count_b"
+)
+
+
+def _imported_record(tmp_path, name, args):
+    db = str(tmp_path / f"{name}.db")
+    result = CliRunner().invoke(cli, ["--db", db, "model", *args])
+    assert result.exit_code == 0, result.output
+    conn = sqlite3.connect(db)
+    try:
+        return conn.execute(f"SELECT {_RECORD_COLUMNS} FROM eval_models").fetchall()
+    finally:
+        conn.close()
+
+
+class TestImportHf:
+    def test_single_and_org_imports_build_the_same_record(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(huggingface_hub, "HfApi", StubHfApi)
+        model_cli._fetch_hf_model_info.cache_clear()
+        try:
+            single = _imported_record(tmp_path, "single", ["import-hf", "acme/tiny-llm", "--type", "llm"])
+            org = _imported_record(tmp_path, "org", ["import-hf-org", "--author", "acme", "--type", "llm"])
+        finally:
+            model_cli._fetch_hf_model_info.cache_clear()
+
+        assert len(single) == 1
+        assert single[0][-1] == 1.24
+        assert org == single
+        # The listing asks for the fields a record needs; expand excludes full/cardData
+        assert StubHfApi.list_kwargs["expand"] == ["safetensors", "tags"]
+        assert "full" not in StubHfApi.list_kwargs
+        assert "cardData" not in StubHfApi.list_kwargs
@@ -59,6 +59,21 @@ class TestModelSpec:
         spec = ModelSpec.from_dict(data)
         assert spec.name == "X"
 
+    def test_from_dict_decodes_json_list_fields(self):
+        data = {
+            "id": "x",
+            "name": "X",
+            "slug": "x",
+            "model_type": "llm",
+            "source_type": "local",
+            "tags": '["a", "b"]',
+            "subjects": "",
+        }
+        spec = ModelSpec.from_dict(data)
+        assert spec.tags == ["a", "b"]
+        assert spec.subjects == []
+        assert not hasattr(spec, "__dict__")
+
 
 class TestBenchmarkTask:
     def test_roundtrip(self):
@@ -1,5 +1,6 @@
 """Tests for grade-level scoring system."""
 
+import pytest
 
 from voicelearn_eval.grade_levels.scorer import (
     assess_tier,
@@ -7,6 +8,7 @@ from voicelearn_eval.grade_levels.scorer import (
     calculate_tier_score,
     compute_grade_level_rating,
     get_max_passing_tier,
+    stored_grade_level,
 )
 from voicelearn_eval.grade_levels.tiers import DEFAULT_THRESHOLD
 
@@ -49,18 +51,22 @@ class TestCalculateTierScore:
 
 
 class TestAssessTier:
-    def test_passing(self):
-        assert assess_tier(75.0) is True
-
-    def test_failing(self):
-        assert assess_tier(65.0) is False
-
-    def test_exact_threshold(self):
+    @pytest.mark.parametrize(
+        "score, threshold, expected",
+        [
+            (75.0, DEFAULT_THRESHOLD, True),
+            (65.0, DEFAULT_THRESHOLD, False),
+            (DEFAULT_THRESHOLD, DEFAULT_THRESHOLD, True),  # exact threshold passes
+            (50.0, 60.0, False),
+            (70.0, 60.0, True),
+        ],
+    )
+    def test_assess_tier(self, score, threshold, expected):
+        assert assess_tier(score, threshold=threshold) is expected
+
+    def test_default_threshold(self):
         assert assess_tier(DEFAULT_THRESHOLD) is True
-
-    def test_custom_threshold(self):
-        assert assess_tier(50.0, threshold=60.0) is False
-        assert assess_tier(70.0, threshold=60.0) is True
+        assert assess_tier(DEFAULT_THRESHOLD - 0.1) is False
 
 
 class TestGetMaxPassingTier:
@@ -121,3 +127,19 @@ class TestComputeGradeLevelRating:
         assert rating.max_passing_tier == "highschool"  # undergrad < 70
         assert rating.overall_education_score > 0
         assert "elementary" in rating.tier_details
+
+
+class TestStoredGradeLevel:
+    def test_json_text(self):
+        run = {"overall_metrics": '{"grade_level": {"max_passing_tier": "highschool"}}'}
+        assert stored_grade_level(run) == {"max_passing_tier": "highschool"}
+        assert stored_grade_level(dict(run)) is stored_grade_level(run)  # parsed once
+
+    def test_dict_metrics(self):
+        assert stored_grade_level({"overall_metrics": {"grade_level": {"a": 1}}}) == {"a": 1}
+
+    def test_missing_or_invalid(self):
+        assert stored_grade_level({}) is None
+        assert stored_grade_level({"overall_metrics": None}) is None
+        assert stored_grade_level({"overall_metrics": "not json"}) is None
+        assert stored_grade_level({"overall_metrics": "[1, 2]"}) is None
@@ -20,6 +20,11 @@ class TestGetPlatformInfo:
         assert "cpu_count" in info
         assert isinstance(info["cpu_count"], int)
 
+    def test_cached_but_returns_copies(self):
+        first = get_platform_info()
+        first["system"] = "mutated"
+        assert get_platform_info()["system"] != "mutated"
+
 
 class TestAggregateSnapshots:
     def test_empty_snapshots(self):
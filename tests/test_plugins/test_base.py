@@ -1,30 +1,29 @@
 """Tests for plugin system."""
 
+import pytest
 
 from voicelearn_eval.plugins.base import (
     BaseEvalPlugin,
+    EvalPluginType,
     PluginRegistry,
 )
 
 
 class TestNormalizeScore:
-    def test_accuracy_0_to_1(self):
-        assert BaseEvalPlugin.normalize_score(0.85, "accuracy") == 85.0
-
-    def test_accuracy_already_percent(self):
-        assert BaseEvalPlugin.normalize_score(85.0, "accuracy") == 85.0
-
-    def test_wer_inverted(self):
-        assert BaseEvalPlugin.normalize_score(0.15, "wer") == 85.0
-
-    def test_mos_scaling(self):
-        # MOS 5.0 -> 100, MOS 1.0 -> 0
-        assert BaseEvalPlugin.normalize_score(5.0, "mos") == 100.0
-        assert BaseEvalPlugin.normalize_score(1.0, "mos") == 0.0
-        assert BaseEvalPlugin.normalize_score(3.0, "mos") == 50.0
-
-    def test_per_inverted(self):
-        assert BaseEvalPlugin.normalize_score(0.1, "per") == 90.0
+    @pytest.mark.parametrize(
+        "raw, metric, expected",
+        [
+            (0.85, "accuracy", 85.0),  # 0-1 accuracy
+            (85.0, "accuracy", 85.0),  # already a percentage
+            (0.15, "wer", 85.0),  # inverted
+            (5.0, "mos", 100.0),  # MOS 5.0 -> 100
+            (1.0, "mos", 0.0),  # MOS 1.0 -> 0
+            (3.0, "mos", 50.0),
+            (0.1, "per", 90.0),  # inverted
+        ],
+    )
+    def test_normalize(self, raw, metric, expected):
+        assert BaseEvalPlugin.normalize_score(raw, metric) == expected
 
 
 class TestMakeResult:
@@ -67,6 +66,10 @@ class TestPluginRegistry:
         ids = [b["id"] for b in benchmarks]
         assert "mmlu" in ids
 
+    def test_get_all_benchmarks_returns_copy(self, plugin_registry):
+        plugin_registry.get_all_benchmarks().clear()
+        assert len(plugin_registry.get_all_benchmarks()) == 3
+
     def test_find_plugin_for_benchmark(self, plugin_registry):
         plugin = plugin_registry.find_plugin_for_benchmark("mmlu")
         assert plugin is not None
@@ -82,3 +85,8 @@ class TestPluginRegistry:
 
         plugin = plugin_registry.find_plugin_for_model_type("stt")
         assert plugin is None
+
+    def test_find_plugin_for_model_type_enum(self, plugin_registry):
+        plugin = plugin_registry.find_plugin_for_model_type(EvalPluginType.LLM)
+        assert plugin is not None
+        assert plugin_registry.get_plugins_for_type(EvalPluginType.LLM) == [plugin]
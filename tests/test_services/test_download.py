@@ -0,0 +1,72 @@
+"""Tests for the model download service."""
+
+import asyncio
+
+from voicelearn_eval.services import download
+from voicelearn_eval.services.download import DownloadService
+
+
+class RecordingWSManager:
+    def __init__(self):
+        self.events = []
+
+    async def broadcast(self, event):
+        self.events.append(event)
+
+
+async def _subscribe(service: DownloadService, idle_timeout: float | None = None):
+    """Open a subscription and return it with a task awaiting its first event.
+
+    The subscriber's queue is only registered once the generator starts, so
+    the task is given a turn of the event loop before returning.
+    """
+    subscription = service.subscribe(idle_timeout=idle_timeout)
+    subscribers = len(service._subscribers)
+    first = asyncio.ensure_future(anext(subscription))
+    while len(service._subscribers) == subscribers:
+        await asyncio.sleep(0)
+    return subscription, first
+
+
+class TestSubscribe:
+    async def test_events_fan_out_to_every_subscriber(self):
+        ws = RecordingWSManager()
+        service = DownloadService(storage=None, ws_manager=ws)
+        (sub_a, first_a), (sub_b, first_b) = [await _subscribe(service) for _ in range(2)]
+
+        await service._broadcast("m1", 0, "Starting download...")
+        await service._broadcast("m1", 100, "Download complete")
+
+        for subscription, first in ((sub_a, first_a), (sub_b, first_b)):
+            assert (await first)["percent"] == 0
+            assert await anext(subscription) == {
+                "type": "download_progress",
+                "model_id": "m1",
+                "percent": 100,
+                "message": "Download complete",
+            }
+        assert [e["percent"] for e in ws.events] == [0, 100]
+
+        await sub_a.aclose()
+        await sub_b.aclose()
+        assert service._subscribers == set()
+
+    async def test_slow_subscriber_drops_events(self):
+        ws = RecordingWSManager()
+        service = DownloadService(storage=None, ws_manager=ws)
+        subscription, first = await _subscribe(service, idle_timeout=0.01)
+
+        sent = download._SUBSCRIBER_QUEUE_SIZE + 5
+        for i in range(sent):
+            await service._broadcast("m1", i, f"step {i}")
+
+        received = [(await first)["percent"]]
+        while (event := await anext(subscription)) is not None:
+            received.append(event["percent"])
+        # The subscriber keeps the oldest queued events; the overflow is dropped
+        # without blocking the broadcast, and the WebSocket still gets everything
+        assert received == list(range(download._SUBSCRIBER_QUEUE_SIZE))
+        assert len(ws.events) == sent
+
+        await subscription.aclose()
+        assert service._subscribers == set()
@@ -1,9 +1,13 @@
 """Tests for SQLite storage backend."""
 
+import sqlite3
+
 import pytest
 
+from voicelearn_eval.storage.seed import BUILTIN_SEED_VERSION, seed_builtin_suites
+from voicelearn_eval.storage.sqlite_storage import SQLiteStorage
+
 
-@pytest.mark.asyncio
 class TestModelCRUD:
     async def test_create_and_get_model(self, storage, sample_model):
         model_id = await storage.create_model(sample_model)
@@ -15,6 +19,24 @@ class TestModelCRUD:
         assert model["model_type"] == "llm"
         assert model["slug"] == "test-model"
 
+    async def test_get_model_by_id_or_slug(self, storage, sample_model):
+        model_id = await storage.create_model(sample_model)
+        assert (await storage.get_model_by_id_or_slug(model_id))["id"] == model_id
+        assert (await storage.get_model_by_id_or_slug("test-model"))["id"] == model_id
+        assert await storage.get_model_by_id_or_slug("missing") is None
+
+        # An ID match wins over another model whose slug equals that ID
+        other_id = await storage.create_model({**sample_model, "name": "Other", "slug": model_id})
+        assert (await storage.get_model_by_id_or_slug(model_id))["id"] == model_id
+        assert other_id != model_id
+
+    async def test_list_model_slugs(self, storage, sample_model):
+        model_id = await storage.create_model(sample_model)
+        await storage.create_model({**sample_model, "name": "Other"})
+        await storage.delete_model(model_id)
+        # Removed models keep their slug reserved
+        assert {"test-model", "other"} <= await storage.list_model_slugs()
+
     async def test_list_models(self, storage, sample_model):
         await storage.create_model(sample_model)
         models = await storage.list_models()
@@ -33,9 +55,10 @@ class TestModelCRUD:
 
     async def test_delete_model(self, storage, sample_model):
         model_id = await storage.create_model(sample_model)
-        await storage.delete_model(model_id)
+        assert await storage.delete_model(model_id) is True
         model = await storage.get_model(model_id)
         assert model is None
+        assert await storage.delete_model(model_id) is False
 
     async def test_get_model_by_slug(self, storage, sample_model):
         await storage.create_model(sample_model)
@@ -53,8 +76,39 @@ class TestModelCRUD:
         llm_models = await storage.list_models(filters={"model_type": "llm"})
         assert all(m["model_type"] == "llm" for m in llm_models)
 
+    async def test_get_models_by_ids(self, storage, sample_model, sample_model_hf):
+        first = await storage.create_model(sample_model)
+        second = await storage.create_model(sample_model_hf)
+        await storage.delete_model(second)
+
+        models = await storage.get_models_by_ids([first, second, first, "missing"])
+        assert list(models) == [first]
+        assert models[first]["name"] == "Test Model"
+        assert await storage.get_models_by_ids([]) == {}
+
+
+class TestConnection:
+    async def test_initialize_reuses_open_connection(self, storage):
+        db = storage._db
+        await storage.initialize()
+        assert storage._db is db
+
+    async def test_file_database_pragmas(self, tmp_path):
+        file_storage = SQLiteStorage(tmp_path / "eval.db")
+        await file_storage.initialize()
+        try:
+            async def pragma(name):
+                cursor = await file_storage._db.execute(f"PRAGMA {name}")
+                return (await cursor.fetchone())[0]
+
+            assert await pragma("journal_mode") == "wal"
+            assert await pragma("synchronous") == 1  # NORMAL
+            assert await pragma("foreign_keys") == 1
+            assert await pragma("cache_size") == -64000
+        finally:
+            await file_storage.close()
+
 
-@pytest.mark.asyncio
 class TestSuiteCRUD:
     async def test_seeded_suites(self, seeded_storage):
         suites = await seeded_storage.list_suites()
@@ -71,8 +125,52 @@ class TestSuiteCRUD:
         assert "tasks" in suite
         assert len(suite["tasks"]) > 0
 
+    async def test_get_suites_by_ids(self, seeded_storage):
+        suites = await seeded_storage.list_suites()
+        ids = [s["id"] for s in suites[:2]]
+        by_id = await seeded_storage.get_suites_by_ids(ids + ["missing"])
+        assert set(by_id) == set(ids)
+        assert by_id[ids[0]]["name"] == suites[0]["name"]
+
+    async def test_reseeding_is_noop(self, seeded_storage):
+        before = await seeded_storage.list_suites()
+        await seed_builtin_suites(seeded_storage)
+        after = await seeded_storage.list_suites()
+        assert [s["id"] for s in after] == [s["id"] for s in before]
+        assert [s["task_count"] for s in after] == [s["task_count"] for s in before]
+
+    async def test_seeding_records_version(self, seeded_storage):
+        assert await seeded_storage.get_meta("builtin_seed_version") == BUILTIN_SEED_VERSION
+
+        # A stale version re-runs the (idempotent) seeding and records the current one
+        await seeded_storage.set_meta("builtin_seed_version", "stale")
+        before = await seeded_storage.list_suites()
+        await seed_builtin_suites(seeded_storage)
+        assert len(await seeded_storage.list_suites()) == len(before)
+        assert await seeded_storage.get_meta("builtin_seed_version") == BUILTIN_SEED_VERSION
+
+    async def test_update_suite_if_editable(self, seeded_storage):
+        suite_id = await seeded_storage.create_suite({"name": "Custom Suite", "model_type": "llm"})
+        suite = await seeded_storage.update_suite_if_editable(suite_id, {"description": "edited"})
+        assert suite["description"] == "edited"
+        assert suite["tasks"] == []
+
+        builtin = await seeded_storage.get_suite_by_slug("quick_scan")
+        assert await seeded_storage.update_suite_if_editable(builtin["id"], {"description": "x"}) is None
+        assert (await seeded_storage.get_suite(builtin["id"]))["description"] == builtin["description"]
+        assert await seeded_storage.update_suite_if_editable("missing", {"description": "x"}) is None
+
+    async def test_delete_suite_if_editable(self, seeded_storage):
+        suite_id = await seeded_storage.create_suite({"name": "Custom Suite", "model_type": "llm"})
+        assert await seeded_storage.delete_suite_if_editable(suite_id) is True
+        assert await seeded_storage.get_suite(suite_id) is None
+        assert await seeded_storage.delete_suite_if_editable(suite_id) is False
+
+        builtin = await seeded_storage.get_suite_by_slug("quick_scan")
+        assert await seeded_storage.delete_suite_if_editable(builtin["id"]) is False
+        assert await seeded_storage.get_suite(builtin["id"]) is not None
+
 
-@pytest.mark.asyncio
 class TestRunCRUD:
     async def test_create_and_get_run(self, seeded_storage, sample_model):
         model_id = await seeded_storage.create_model(sample_model)
@@ -114,8 +212,82 @@ class TestRunCRUD:
         assert len(runs) >= 1
         assert all(r["model_id"] == model_id for r in runs)
 
+    async def test_list_runs_group_by_model(self, seeded_storage, sample_model, sample_model_hf):
+        model_ids = sorted([
+            await seeded_storage.create_model(sample_model),
+            await seeded_storage.create_model(sample_model_hf),
+        ])
+        suites = await seeded_storage.list_suites()
+        for i, completed_at in enumerate(["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-04"]):
+            run_id = await seeded_storage.create_run({"model_id": model_ids[i % 2], "suite_id": suites[0]["id"]})
+            await seeded_storage.update_run(run_id, {"completed_at": completed_at})
+
+        runs = await seeded_storage.list_runs(filters={"status": "pending", "group_by_model": True})
+        assert [(r["model_id"], r["completed_at"]) for r in runs] == [
+            (model_ids[0], "2024-01-02"),
+            (model_ids[0], "2024-01-03"),
+            (model_ids[1], "2024-01-01"),
+            (model_ids[1], "2024-01-04"),
+        ]
+
+    async def test_delete_run(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suites = await seeded_storage.list_suites()
+        run_id = await seeded_storage.create_run({"model_id": model_id, "suite_id": suites[0]["id"]})
+
+        assert await seeded_storage.delete_run(run_id) is True
+        assert await seeded_storage.get_run(run_id) is None
+        assert await seeded_storage.delete_run(run_id) is False
+
+    async def test_list_runs_after_cursor(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suites = await seeded_storage.list_suites()
+        for _ in range(3):
+            run_id = await seeded_storage.create_run({"model_id": model_id, "suite_id": suites[0]["id"]})
+            await seeded_storage.update_run(run_id, {"created_at": "2024-01-01T00:00:00"})
+
+        filters = {"model_id": model_id}
+        runs = await seeded_storage.list_runs(filters=filters)
+        assert len(runs) == 3
+        cursor = (runs[0]["created_at"], runs[0]["id"])
+        rest = await seeded_storage.list_runs(filters={**filters, "after": cursor})
+        assert [r["id"] for r in rest] == [r["id"] for r in runs[1:]]
+
+        with pytest.raises(ValueError):
+            await seeded_storage.list_runs(filters={**filters, "after": cursor, "sort": "score_high"})
+
+    async def test_get_latest_completed_runs(self, seeded_storage, sample_model, sample_model_hf):
+        model_id = await seeded_storage.create_model(sample_model)
+        other_id = await seeded_storage.create_model(sample_model_hf)
+        suites = await seeded_storage.list_suites()
+        suite_id = suites[0]["id"]
+
+        run_ids = {}
+        for name, status, created_at in [
+            ("old", "completed", "2024-01-01T00:00:00"),
+            ("new", "completed", "2024-02-01T00:00:00"),
+            ("pending", "pending", "2024-03-01T00:00:00"),
+        ]:
+            run_ids[name] = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+            await seeded_storage.update_run(run_ids[name], {"status": status, "created_at": created_at})
+
+        latest = await seeded_storage.get_latest_completed_runs([model_id, other_id, model_id])
+        assert list(latest) == [model_id]
+        assert latest[model_id]["id"] == run_ids["new"]
+        assert await seeded_storage.get_latest_completed_runs([model_id], suite_id=suites[1]["id"]) == {}
+
+    async def test_latest_completed_run_ties_break_like_list_runs(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suite_id = (await seeded_storage.list_suites())[0]["id"]
+        for run_id in ("run-b", "run-c", "run-a"):
+            await seeded_storage.create_run({"id": run_id, "model_id": model_id, "suite_id": suite_id})
+            await seeded_storage.update_run(run_id, {"status": "completed", "created_at": "2024-01-01T00:00:00"})
+
+        latest = await seeded_storage.get_latest_completed_runs([model_id])
+        listed = await seeded_storage.list_runs(filters={"model_id": model_id, "status": "completed"}, limit=1)
+        assert latest[model_id]["id"] == listed[0]["id"] == "run-c"
+
 
-@pytest.mark.asyncio
 class TestTaskResults:
     async def test_create_and_get_results(self, seeded_storage, sample_model):
         model_id = await seeded_storage.create_model(sample_model)
@@ -141,3 +313,114 @@ class TestTaskResults:
         results = await seeded_storage.get_results_for_run(run_id)
         assert len(results) == 1
         assert results[0]["score"] == 85.0
+
+    async def test_create_task_results(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suites = await seeded_storage.list_suites()
+        suite_id = suites[0]["id"]
+        tasks = await seeded_storage.get_tasks_for_suite(suite_id)
+        run_id = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+
+        ids = await seeded_storage.create_task_results([
+            {"run_id": run_id, "task_id": task["id"], "score": 60.0 + i} for i, task in enumerate(tasks[:3])
+        ])
+        assert len(set(ids)) == 3
+        results = await seeded_storage.get_results_for_run(run_id)
+        assert sorted(r["id"] for r in results) == sorted(ids)
+        assert [r["score"] for r in results] == [60.0, 61.0, 62.0]
+        assert await seeded_storage.create_task_results([]) == []
+
+    async def test_create_task_results_rolls_back_on_error(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suite_id = (await seeded_storage.list_suites())[0]["id"]
+        task_id = (await seeded_storage.get_tasks_for_suite(suite_id))[0]["id"]
+        run_id = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await seeded_storage.create_task_results([
+                {"id": "dup", "run_id": run_id, "task_id": task_id},
+                {"id": "dup", "run_id": run_id, "task_id": task_id},
+            ])
+        # Nothing from the failed batch is left behind
+        assert await seeded_storage.get_results_for_run(run_id) == []
+
+    async def test_get_results_for_runs(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suites = await seeded_storage.list_suites()
+        suite_id = suites[0]["id"]
+        tasks = await seeded_storage.get_tasks_for_suite(suite_id)
+
+        scored = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+        empty = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+        for task, score in zip(tasks[:2], (70.0, 90.0)):
+            await seeded_storage.create_task_result({
+                "run_id": scored,
+                "task_id": task["id"],
+                "score": score,
+                "status": "completed",
+            })
+
+        by_run = await seeded_storage.get_results_for_runs([scored, empty])
+        assert [r["score"] for r in by_run[scored]] == [70.0, 90.0]
+        assert by_run[empty] == []
+        assert by_run[scored] == await seeded_storage.get_results_for_run(scored)
+
+
+class TestBaselines:
+    async def test_delete_baseline_reports_missing(self, seeded_storage, sample_model):
+        model_id = await seeded_storage.create_model(sample_model)
+        suites = await seeded_storage.list_suites()
+        suite_id = suites[0]["id"]
+        run_id = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+
+        baseline_id = await seeded_storage.create_baseline({
+            "name": "v1",
+            "model_id": model_id,
+            "run_id": run_id,
+            "suite_id": suite_id,
+            "overall_score": 80.0,
+        })
+        assert await seeded_storage.delete_baseline(baseline_id) is True
+        assert await seeded_storage.get_baseline(baseline_id) is None
+        assert await seeded_storage.delete_baseline(baseline_id) is False
+
+
+class TestMigrations:
+    async def test_statements_after_comments_are_applied(self, storage):
+        cursor = await storage._db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name IN "
+            "('idx_eval_runs_model_status_created', 'idx_eval_runs_created_id')"
+        )
+        assert len(await cursor.fetchall()) == 2
+
+        cursor = await storage._db.execute("PRAGMA table_info(eval_models)")
+        assert "download_status" in [row["name"] for row in await cursor.fetchall()]
+
+
+class TestSharedReports:
+    async def test_shared_report_keeps_expiry_timestamp(self, storage):
+        token = await storage.create_shared_report({
+            "share_token": "tok-1",
+            "report_type": "run",
+            "report_config": {"run_id": "r1"},
+            "expires_at": "2030-01-01T00:00:00",
+            "expires_at_ts": 1893456000,
+        })
+        assert token == "tok-1"
+
+        report = await storage.get_shared_report("tok-1")
+        assert report["expires_at_ts"] == 1893456000
+
+    async def test_fetch_and_bump_share(self, storage):
+        await storage.create_shared_report({
+            "share_token": "tok-2",
+            "report_type": "run",
+            "report_config": {},
+            "expires_at_ts": 2000,
+        })
+
+        report = await storage.fetch_and_bump_share("tok-2", now_ts=1000)
+        assert report["view_count"] == 1
+        assert await storage.fetch_and_bump_share("tok-2", now_ts=3000) is None
+        assert await storage.fetch_and_bump_share("missing", now_ts=1000) is None
+        assert (await storage.get_shared_report("tok-2"))["view_count"] == 1
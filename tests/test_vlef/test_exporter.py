@@ -0,0 +1,39 @@
+"""Tests for VLEF export."""
+
+import json
+
+import pytest
+
+from voicelearn_eval.vlef import exporter
+from voicelearn_eval.vlef.exporter import export_vlef, stream_vlef
+
+
+async def _streamed(storage, **kwargs) -> dict:
+    chunks = [chunk async for chunk in stream_vlef(storage, **kwargs)]
+    return json.loads(b"".join(chunks))
+
+
+def _comparable(doc: dict) -> dict:
+    # Round-trip through JSON so both sides compare as decoded documents
+    doc = json.loads(json.dumps(doc))
+    doc.pop("exported_at")
+    return doc
+
+
+class TestStreamVlef:
+    @pytest.mark.parametrize("run_count", [0, 1, exporter._STREAM_BATCH + 3])
+    async def test_stream_matches_export(self, seeded_storage, sample_model, run_count):
+        model_id = await seeded_storage.create_model(sample_model)
+        suite_id = (await seeded_storage.list_suites())[0]["id"]
+        tasks = await seeded_storage.get_tasks_for_suite(suite_id)
+        for i in range(run_count):
+            run_id = await seeded_storage.create_run({"model_id": model_id, "suite_id": suite_id})
+            await seeded_storage.create_task_results([
+                {"run_id": run_id, "task_id": task["id"], "score": 50.0 + i} for task in tasks[:2]
+            ])
+
+        streamed = await _streamed(seeded_storage, model_id=model_id)
+        exported = await export_vlef(seeded_storage, model_id=model_id)
+
+        assert len(streamed["runs"]) == run_count
+        assert _comparable(streamed) == _comparable(exported)
@@ -1,6 +1,13 @@
 """Multi-model comparison analysis."""
 
-from .statistics import aggregate_scores, score_by_category
+from operator import itemgetter
+
+from voicelearn_eval.grade_levels.tiers import TIER_ORDER
+
+from .statistics import aggregate_with_categories
+
+# Education tier value -> position in the curriculum (unknown tiers sort last)
+_TIER_RANK = {tier.value: i for i, tier in enumerate(TIER_ORDER)}
 
 
 def compare_model_results(
@@ -25,16 +32,21 @@ def compare_model_results(
         "summary": {},
     }
 
+    # Aggregate each model once (overall and per tier); the reference delta reuses these
+    aggregated = [aggregate_with_categories(mr["results"], "education_tier") for mr in model_results]
+
     # Find reference model if any
-    for mr in model_results:
+    ref_mean = None
+    for mr, (stats, _) in zip(model_results, aggregated):
         if mr["model"].get("is_reference"):
             comparison["reference_model_id"] = mr["model"]["id"]
+            ref_mean = stats["mean"]
             break
+    ref_id = comparison["reference_model_id"]
 
-    ref_stats = None
-    for mr in model_results:
-        stats = aggregate_scores(mr["results"])
-        by_tier = score_by_category(mr["results"], "education_tier")
+    keyed_entries = []  # (sort key, entry); the key is computed once per model
+    for mr, (stats, by_tier) in zip(model_results, aggregated):
+        run = mr.get("run")
 
         model_entry = {
             "model_id": mr["model"]["id"],
@@ -43,28 +55,19 @@ def compare_model_results(
             "overall": stats,
             "by_tier": by_tier,
             "parameter_count_b": mr["model"].get("parameter_count_b"),
-            "run_id": mr.get("run", {}).get("id") if mr.get("run") else None,
-            "overall_score": mr.get("run", {}).get("overall_score") if mr.get("run") else stats.get("mean"),
+            "run_id": run.get("id") if run else None,
+            "overall_score": run.get("overall_score") if run else stats.get("mean"),
         }
 
         # Delta from reference
-        if comparison["reference_model_id"] and mr["model"]["id"] != comparison["reference_model_id"]:
-            if ref_stats is None:
-                # Find reference stats
-                for ref_mr in model_results:
-                    if ref_mr["model"]["id"] == comparison["reference_model_id"]:
-                        ref_stats = aggregate_scores(ref_mr["results"])
-                        break
-            if ref_stats and ref_stats["mean"] is not None and stats["mean"] is not None:
-                model_entry["delta_from_reference"] = round(stats["mean"] - ref_stats["mean"], 2)
-
-        comparison["models"].append(model_entry)
+        if ref_mean is not None and stats["mean"] is not None and mr["model"]["id"] != ref_id:
+            model_entry["delta_from_reference"] = round(stats["mean"] - ref_mean, 2)
+
+        keyed_entries.append((model_entry["overall_score"] or stats["mean"] or 0, model_entry))
 
     # Sort by overall score descending
-    comparison["models"].sort(
-        key=lambda m: m.get("overall_score") or m["overall"]["mean"] or 0,
-        reverse=True,
-    )
+    keyed_entries.sort(key=itemgetter(0), reverse=True)
+    comparison["models"] = [entry for _, entry in keyed_entries]
 
     # Summary
     if comparison["models"]:
@@ -83,23 +86,20 @@ def _get_radar_dimensions(model_results: list[dict]) -> list[str]:
     Uses education tiers as primary dimensions, falling back to task names.
     """
     tiers = set()
+    task_names = set()
     for mr in model_results:
         for r in mr["results"]:
             tier = r.get("education_tier")
             if tier:
                 tiers.add(tier)
+            name = r.get("task_name")
+            if name:
+                task_names.add(name)
 
     if tiers:
-        order = ["elementary", "high_school", "undergraduate", "graduate"]
-        return sorted(tiers, key=lambda t: order.index(t) if t in order else 99)
+        return sorted(tiers, key=lambda t: (_TIER_RANK.get(t, len(_TIER_RANK)), t))
 
     # Fallback to task names
-    task_names = set()
-    for mr in model_results:
-        for r in mr["results"]:
-            name = r.get("task_name")
-            if name:
-                task_names.add(name)
     return sorted(task_names)
 
 
@@ -108,24 +108,25 @@ def build_radar_data(model_results: list[dict], dimensions: list[str]) -> list[d
 
     Returns list of {model_name, model_id, values: [score_per_dimension]}.
     """
+    dim_index = {d: i for i, d in enumerate(dimensions)}
     radar_data = []
     for mr in model_results:
-        # Group scores by dimension
-        dim_scores: dict[str, list[float]] = {d: [] for d in dimensions}
+        # Running sum/count per dimension slot (tier, else task name)
+        sums = [0.0] * len(dimensions)
+        counts = [0] * len(dimensions)
         for r in mr["results"]:
-            dim = r.get("education_tier") or r.get("task_name", "")
-            if dim in dim_scores and r.get("score") is not None:
-                dim_scores[dim].append(r["score"])
-
-        values = []
-        for d in dimensions:
-            scores = dim_scores.get(d, [])
-            values.append(round(sum(scores) / len(scores), 1) if scores else 0)
+            score = r.get("score")
+            if score is None:
+                continue
+            i = dim_index.get(r.get("education_tier") or r.get("task_name", ""))
+            if i is not None:
+                sums[i] += score
+                counts[i] += 1
 
         radar_data.append({
             "model_name": mr["model"]["name"],
             "model_id": mr["model"]["id"],
-            "values": values,
+            "values": [round(total / n, 1) if n else 0 for total, n in zip(sums, counts)],
         })
 
     return radar_data
@@ -1,5 +1,6 @@
 """Automated deployment recommendations based on evaluation results."""
 
+from voicelearn_eval.grade_levels.tiers import TIER_LABELS
 
 DEPLOYMENT_TARGETS = {
     "on-device": {
@@ -22,6 +23,15 @@ DEPLOYMENT_TARGETS = {
     },
 }
 
+# Flattened (target, max_params_b, max_size_gb, min_score, description) rows
+_TARGET_ROWS = tuple(
+    (name, c["max_params_b"], c["max_size_gb"], c["min_score"], c["description"])
+    for name, c in DEPLOYMENT_TARGETS.items()
+)
+
+# Tier labels keyed by the stored tier string (enum members hash by name)
+_TIER_LABELS = {tier.value: label for tier, label in TIER_LABELS.items()}
+
 
 def recommend_deployment(
     model: dict,
@@ -49,37 +59,29 @@ def recommend_deployment(
     warnings = []
     rationale = []
 
-    for target, constraints in DEPLOYMENT_TARGETS.items():
+    for target, max_params, max_size, min_score, description in _TARGET_ROWS:
         suitability = 100.0
         target_warnings = []
 
         # Check parameter count
-        if params and constraints["max_params_b"] is not None:
-            if params > constraints["max_params_b"]:
-                suitability -= 40
-                target_warnings.append(
-                    f"Model has {params}B params, target max is {constraints['max_params_b']}B"
-                )
+        if params and max_params is not None and params > max_params:
+            suitability -= 40
+            target_warnings.append(f"Model has {params}B params, target max is {max_params}B")
 
         # Check model size
-        if size and constraints["max_size_gb"] is not None:
-            if size > constraints["max_size_gb"]:
-                suitability -= 30
-                target_warnings.append(
-                    f"Model is {size}GB, target max is {constraints['max_size_gb']}GB"
-                )
+        if size and max_size is not None and size > max_size:
+            suitability -= 30
+            target_warnings.append(f"Model is {size}GB, target max is {max_size}GB")
 
         # Check score threshold
-        if score < constraints["min_score"]:
+        if score < min_score:
             suitability -= 30
-            target_warnings.append(
-                f"Score {score:.1f} below target minimum {constraints['min_score']}"
-            )
+            target_warnings.append(f"Score {score:.1f} below target minimum {min_score}")
 
         suitable_targets.append({
             "target": target,
             "suitability": max(0, round(suitability, 1)),
-            "description": constraints["description"],
+            "description": description,
             "warnings": target_warnings,
         })
 
@@ -89,13 +91,7 @@ def recommend_deployment(
 
     # Grade-level specific recommendations
     if max_tier:
-        tier_labels = {
-            "elementary": "Elementary (Gr 5-8)",
-            "high_school": "High School (Gr 9-12)",
-            "undergraduate": "Undergraduate",
-            "graduate": "Graduate",
-        }
-        rationale.append(f"Certified up to {tier_labels.get(max_tier, max_tier)} level")
+        rationale.append(f"Certified up to {_TIER_LABELS.get(max_tier, max_tier)} level")
     else:
         warnings.append("Model has not passed any education tier threshold")
 
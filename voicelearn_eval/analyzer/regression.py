@@ -10,6 +10,17 @@ class RegressionSeverity:
     CRITICAL = "critical"  # Dropped below passing threshold
 
 
+# Internal integer ranks (worst first) and their labels
+_CRITICAL, _SEVERE, _MODERATE, _MINOR, _NONE = range(5)
+_SEVERITY_LABELS = (
+    RegressionSeverity.CRITICAL,
+    RegressionSeverity.SEVERE,
+    RegressionSeverity.MODERATE,
+    RegressionSeverity.MINOR,
+    RegressionSeverity.NONE,
+)
+
+
 def detect_regressions(
     current_results: list[dict],
     baseline_results: list[dict],
@@ -32,9 +43,10 @@ def detect_regressions(
         if key:
             baseline_by_task[key] = r
 
-    task_regressions = []
+    ranked = []  # (severity rank, task entry)
     total_delta = 0.0
     regression_count = 0
+    worst = _NONE
 
     for result in current_results:
         key = result.get("task_name") or result.get("benchmark_id") or ""
@@ -48,42 +60,35 @@ def detect_regressions(
 
         baseline_score = baseline["score"]
         delta = current_score - baseline_score
+        delta_pct = (delta / baseline_score) * 100 if baseline_score != 0 else 0
         total_delta += delta
 
-        severity = _classify_severity(current_score, baseline_score, threshold)
-
-        if severity != RegressionSeverity.NONE:
+        rank = _classify_severity(current_score, baseline_score, threshold, -delta_pct)
+        if rank != _NONE:
             regression_count += 1
+        if rank < worst:
+            worst = rank
 
-        task_regressions.append({
+        ranked.append((rank, {
             "task_name": key,
             "current_score": round(current_score, 2),
             "baseline_score": round(baseline_score, 2),
             "delta": round(delta, 2),
-            "delta_percent": round((delta / baseline_score) * 100, 1) if baseline_score != 0 else 0,
-            "severity": severity,
+            "delta_percent": round(delta_pct, 1),
+            "severity": _SEVERITY_LABELS[rank],
             "education_tier": result.get("education_tier"),
-        })
-
-    # Sort by severity (worst first)
-    severity_order = {
-        RegressionSeverity.CRITICAL: 0,
-        RegressionSeverity.SEVERE: 1,
-        RegressionSeverity.MODERATE: 2,
-        RegressionSeverity.MINOR: 3,
-        RegressionSeverity.NONE: 4,
-    }
-    task_regressions.sort(key=lambda t: severity_order.get(t["severity"], 99))
+        }))
+
+    # Sort by severity (worst first); stable, so ties keep input order
+    ranked.sort(key=lambda item: item[0])
+    task_regressions = [entry for _, entry in ranked]
 
     matched_count = len(task_regressions)
     avg_delta = round(total_delta / matched_count, 2) if matched_count > 0 else 0
 
     # Overall severity
-    severities = [t["severity"] for t in task_regressions]
-    if RegressionSeverity.CRITICAL in severities:
-        overall_severity = RegressionSeverity.CRITICAL
-    elif RegressionSeverity.SEVERE in severities:
-        overall_severity = RegressionSeverity.SEVERE
+    if worst <= _SEVERE:
+        overall_severity = _SEVERITY_LABELS[worst]
     elif regression_count > matched_count * 0.5:
         overall_severity = RegressionSeverity.MODERATE
     elif regression_count > 0:
@@ -102,26 +107,28 @@ def detect_regressions(
 
 
 def _classify_severity(
-    current: float, baseline: float, threshold: float
-) -> str:
-    """Classify regression severity for a single task."""
-    if current >= baseline:
-        return RegressionSeverity.NONE
+    current: float, baseline: float, threshold: float, delta_pct: float
+) -> int:
+    """Classify regression severity for a single task as a rank (0 = worst).
 
-    delta_pct = ((baseline - current) / baseline) * 100 if baseline != 0 else 0
+    ``delta_pct`` is the decline relative to baseline, in percent
+    (positive when the score dropped). Map to a label via ``_SEVERITY_LABELS``.
+    """
+    if current >= baseline:
+        return _NONE
 
     # Critical: dropped below passing threshold when baseline was above
     if baseline >= threshold and current < threshold:
-        return RegressionSeverity.CRITICAL
+        return _CRITICAL
 
     if delta_pct > 15:
-        return RegressionSeverity.SEVERE
+        return _SEVERE
     elif delta_pct > 5:
-        return RegressionSeverity.MODERATE
+        return _MODERATE
     elif delta_pct > 0:
-        return RegressionSeverity.MINOR
+        return _MINOR
 
-    return RegressionSeverity.NONE
+    return _NONE
 
 
 def ci_exit_code(regression_result: dict) -> int:
@@ -1,6 +1,63 @@
 """Statistical aggregation for evaluation results."""
 
 import math
+from collections import defaultdict
+
+
+class _ScoreAccumulator:
+    """Running stats for one group of scores (Welford update plus the raw values)."""
+
+    __slots__ = ("scores", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.scores: list[float] = []
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, score: float) -> None:
+        self.scores.append(score)
+        delta = score - self.mean
+        self.mean += delta / len(self.scores)
+        self.m2 += delta * (score - self.mean)
+
+    def summary(self) -> dict:
+        scores = self.scores
+        if not scores:
+            return {
+                "mean": None,
+                "median": None,
+                "std_dev": None,
+                "min": None,
+                "max": None,
+                "count": 0,
+                "confidence_interval_95": None,
+            }
+
+        n = len(scores)
+        scores.sort()  # one sort serves median, min and max
+        mean = self.mean
+
+        if n % 2 == 0:
+            median = (scores[n // 2 - 1] + scores[n // 2]) / 2
+        else:
+            median = scores[n // 2]
+
+        variance = self.m2 / max(n - 1, 1)
+        std_dev = math.sqrt(variance)
+
+        # 95% confidence interval (using z=1.96 for large samples)
+        margin = 1.96 * std_dev / math.sqrt(n) if n > 1 else 0
+        ci_95 = (round(mean - margin, 2), round(mean + margin, 2))
+
+        return {
+            "mean": round(mean, 2),
+            "median": round(median, 2),
+            "std_dev": round(std_dev, 2),
+            "min": round(scores[0], 2),
+            "max": round(scores[-1], 2),
+            "count": n,
+            "confidence_interval_95": ci_95,
+        }
 
 
 def aggregate_scores(results: list[dict]) -> dict:
@@ -9,43 +66,30 @@ def aggregate_scores(results: list[dict]) -> dict:
     Each result dict should have at least 'score' (float or None).
     Returns dict with mean, median, std_dev, min, max, count, and confidence_interval_95.
     """
-    scores = [r["score"] for r in results if r.get("score") is not None]
-    if not scores:
-        return {
-            "mean": None,
-            "median": None,
-            "std_dev": None,
-            "min": None,
-            "max": None,
-            "count": 0,
-            "confidence_interval_95": None,
-        }
-
-    n = len(scores)
-    mean = sum(scores) / n
-    sorted_scores = sorted(scores)
-
-    if n % 2 == 0:
-        median = (sorted_scores[n // 2 - 1] + sorted_scores[n // 2]) / 2
-    else:
-        median = sorted_scores[n // 2]
+    acc = _ScoreAccumulator()
+    for r in results:
+        s = r.get("score")
+        if s is not None:
+            acc.add(s)
+    return acc.summary()
 
-    variance = sum((s - mean) ** 2 for s in scores) / max(n - 1, 1)
-    std_dev = math.sqrt(variance)
 
-    # 95% confidence interval (using z=1.96 for large samples)
-    margin = 1.96 * std_dev / math.sqrt(n) if n > 1 else 0
-    ci_95 = (round(mean - margin, 2), round(mean + margin, 2))
+def aggregate_with_categories(
+    results: list[dict], category_key: str = "education_tier"
+) -> tuple[dict, dict[str, dict]]:
+    """Compute overall stats and per-category stats in a single walk.
 
-    return {
-        "mean": round(mean, 2),
-        "median": round(median, 2),
-        "std_dev": round(std_dev, 2),
-        "min": round(min(scores), 2),
-        "max": round(max(scores), 2),
-        "count": n,
-        "confidence_interval_95": ci_95,
-    }
+    Equivalent to ``(aggregate_scores(results), score_by_category(results, category_key))``.
+    """
+    overall = _ScoreAccumulator()
+    groups: dict[str, _ScoreAccumulator] = defaultdict(_ScoreAccumulator)
+    for r in results:
+        group = groups[r.get(category_key, "unknown")]  # categories with no scores still appear
+        s = r.get("score")
+        if s is not None:
+            overall.add(s)
+            group.add(s)
+    return overall.summary(), {cat: acc.summary() for cat, acc in groups.items()}
 
 
 def score_by_category(results: list[dict], category_key: str = "education_tier") -> dict[str, dict]:
@@ -58,12 +102,9 @@ def score_by_category(results: list[dict], category_key: str = "education_tier")
     Returns:
         Dict mapping category values to aggregate stats.
     """
-    groups: dict[str, list[dict]] = {}
+    groups: dict[str, list[dict]] = defaultdict(list)
     for r in results:
-        cat = r.get(category_key, "unknown")
-        if cat not in groups:
-            groups[cat] = []
-        groups[cat].append(r)
+        groups[r.get(category_key, "unknown")].append(r)
 
     return {cat: aggregate_scores(items) for cat, items in groups.items()}
 
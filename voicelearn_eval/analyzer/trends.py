@@ -1,5 +1,7 @@
 """Historical trend analysis for model performance over time."""
 
+import math
+from collections import defaultdict
 
 
 def analyze_trends(
@@ -17,20 +19,22 @@ def analyze_trends(
         Dict with trend data per model including direction, moving average, etc.
     """
     # Group by model
-    by_model: dict[str, list[dict]] = {}
+    by_model: dict[str, list[dict]] = defaultdict(list)
     for run in runs:
-        mid = run.get("model_id", "unknown")
-        if mid not in by_model:
-            by_model[mid] = []
-        by_model[mid].append(run)
+        by_model[run.get("model_id", "unknown")].append(run)
 
     trends = {}
     for model_id, model_runs in by_model.items():
         # Sort by completion date
         model_runs.sort(key=lambda r: r.get("completed_at") or "")
 
-        scores = [r.get("overall_score") for r in model_runs if r.get("overall_score") is not None]
-        dates = [r.get("completed_at") for r in model_runs if r.get("overall_score") is not None]
+        scores = []
+        dates = []
+        for r in model_runs:
+            score = r.get("overall_score")
+            if score is not None:
+                scores.append(score)
+                dates.append(r.get("completed_at"))
 
         if len(scores) < 2:
             trends[model_id] = {
@@ -60,8 +64,9 @@ def analyze_trends(
         else:
             direction = "stable"
 
-        change = round(scores[-1] - scores[0], 2)
-        change_pct = round((change / scores[0]) * 100, 1) if scores[0] != 0 else 0
+        first, latest = scores[0], scores[-1]
+        change = round(latest - first, 2)
+        change_pct = round((change / first) * 100, 1) if first != 0 else 0
 
         trends[model_id] = {
             "direction": direction,
@@ -71,23 +76,22 @@ def analyze_trends(
             "moving_average": moving_avg,
             "change": change,
             "change_percent": change_pct,
-            "latest_score": scores[-1],
-            "first_score": scores[0],
+            "latest_score": latest,
+            "first_score": first,
         }
 
     return trends
 
 
 def _moving_average(values: list[float], window: int) -> list[float]:
-    """Calculate simple moving average."""
-    if len(values) <= window:
-        return [round(sum(values[:i+1]) / (i+1), 2) for i in range(len(values))]
-
+    """Calculate simple moving average (trailing window, shorter at the start)."""
     result = []
-    for i in range(len(values)):
-        start = max(0, i - window + 1)
-        window_vals = values[start:i + 1]
-        result.append(round(sum(window_vals) / len(window_vals), 2))
+    total = 0.0
+    for i, v in enumerate(values):
+        total += v
+        if i >= window:
+            total -= values[i - window]  # slide: drop the value leaving the window
+        result.append(round(total / min(i + 1, window), 2))
     return result
 
 
@@ -107,25 +111,24 @@ def detect_anomalies(
     if len(scores) < 4:
         return []
 
-    import math
-
-    mean = sum(scores) / len(scores)
-    variance = sum((s - mean) ** 2 for s in scores) / (len(scores) - 1)
-    std = math.sqrt(variance)
+    n = len(scores)
+    mean = math.fsum(scores) / n
+    std = math.sqrt(math.fsum((s - mean) ** 2 for s in scores) / (n - 1))
 
     if std == 0:
         return []
 
-    anomalies = []
-    for i, score in enumerate(scores):
-        deviation = abs(score - mean) / std
-        if deviation > std_threshold:
-            anomalies.append({
-                "index": i,
-                "score": score,
-                "expected": round(mean, 2),
-                "deviation_std": round(deviation, 2),
-                "direction": "above" if score > mean else "below",
-            })
-
-    return anomalies
+    # Compare against the absolute cutoff; only anomalies pay for the division
+    cutoff = std_threshold * std
+    expected = round(mean, 2)
+    return [
+        {
+            "index": i,
+            "score": score,
+            "expected": expected,
+            "deviation_std": round(abs(score - mean) / std, 2),
+            "direction": "above" if score > mean else "below",
+        }
+        for i, score in enumerate(scores)
+        if abs(score - mean) > cutoff
+    ]
@@ -4,9 +4,12 @@ import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import httpx
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
+from voicelearn_eval.api.cache import ResponseCache
+from voicelearn_eval.api.responses import FastJSONResponse
 from voicelearn_eval.core.config import ensure_data_dir, load_config
 from voicelearn_eval.core.orchestrator import EvalOrchestrator
 from voicelearn_eval.plugins.base import PluginRegistry
@@ -17,6 +20,18 @@ from voicelearn_eval.storage.seed import seed_builtin_suites
 from voicelearn_eval.storage.sqlite_storage import SQLiteStorage
 
 
+def _hf_auth_headers() -> dict[str, str]:
+    """Authorization for Hub requests from HF_TOKEN or a cached ``huggingface-cli login``.
+
+    HfApi sends this on its own; the raw client has to, or gated and private
+    repos answer 401 and anonymous rate limits apply.
+    """
+    from huggingface_hub import get_token
+
+    token = get_token()
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup application state."""
@@ -52,6 +67,14 @@ async def lifespan(app: FastAPI):
     download_service = DownloadService(storage, ws_manager)
     await download_service.reset_stale_downloads()
 
+    # Shared HuggingFace Hub API client (connection pooling across requests)
+    hf_client = httpx.AsyncClient(
+        base_url="https://huggingface.co",
+        headers=_hf_auth_headers(),
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=32),
+    )
+
     # Store on app state
     app.state.config = config
     app.state.storage = storage
@@ -59,10 +82,13 @@ async def lifespan(app: FastAPI):
     app.state.orchestrator = orchestrator
     app.state.ws_manager = ws_manager
     app.state.download_service = download_service
+    app.state.hf_client = hf_client
+    app.state.response_cache = ResponseCache()
 
     yield
 
     # Cleanup
+    await hf_client.aclose()
     await storage.close()
 
 
@@ -73,6 +99,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         description="Unified AI model evaluation for educational voice interaction",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     app.add_middleware(
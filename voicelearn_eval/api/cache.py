@@ -0,0 +1,40 @@
+"""In-memory TTL cache for slowly changing listing responses."""
+
+import time
+from typing import Any
+
+
+class ResponseCache:
+    """Caches response payloads per namespace, keyed by the request's query params.
+
+    Entries expire after their TTL; write endpoints call ``clear`` on their
+    namespace so changes show up on the next read. Cached payloads are shared
+    between requests and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, tuple], tuple[float, Any]] = {}
+
+    def get(self, namespace: str, key: tuple) -> Any | None:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[(namespace, key)]
+            return None
+        return value
+
+    def set(self, namespace: str, key: tuple, value: Any, ttl: float) -> None:
+        if len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so this drops the oldest entry
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[(namespace, key)] = (time.monotonic() + ttl, value)
+
+    def clear(self, namespace: str | None = None) -> None:
+        if namespace is None:
+            self._entries.clear()
+            return
+        for cache_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[cache_key]
@@ -1,7 +1,9 @@
 """FastAPI dependency injection helpers."""
 
+import httpx
 from fastapi import Request
 
+from voicelearn_eval.api.cache import ResponseCache
 from voicelearn_eval.core.config import AppConfig
 from voicelearn_eval.core.orchestrator import EvalOrchestrator
 from voicelearn_eval.plugins.base import PluginRegistry
@@ -26,3 +28,11 @@ def get_orchestrator(request: Request) -> EvalOrchestrator:
 
 def get_download_service(request: Request):
     return request.app.state.download_service
+
+
+def get_hf_client(request: Request) -> httpx.AsyncClient:
+    return request.app.state.hf_client
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    return request.app.state.response_cache
@@ -0,0 +1,61 @@
+"""Pagination shared by the list endpoints."""
+
+import asyncio
+import base64
+import json
+from collections.abc import Awaitable, Callable
+
+from fastapi import HTTPException
+
+
+def encode_cursor(row: dict) -> str:
+    """Opaque cursor for the keyset ``(created_at, id)`` of a listed row."""
+    return base64.urlsafe_b64encode(json.dumps([row["created_at"], row["id"]]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(400, f"Invalid cursor: {cursor}")
+    if not isinstance(created_at, str) or not isinstance(row_id, str):
+        raise HTTPException(400, f"Invalid cursor: {cursor}")
+    return created_at, row_id
+
+
+def with_cursor(filters: dict, after: str | None) -> dict:
+    """Copy of ``filters`` restricted to rows after the ``after`` cursor, if given."""
+    return {**filters, "after": decode_cursor(after)} if after else filters
+
+
+async def paginate(
+    fetch: Callable[[int, int], Awaitable[list[dict]]],
+    count: Callable[[], Awaitable[int]],
+    limit: int,
+    offset: int,
+    with_total: bool = False,
+) -> dict:
+    """Fetch one page as ``{"items", "limit", "offset", "has_more", "next_cursor"}``.
+
+    ``fetch(limit, offset)`` loads rows and ``count()`` the total. One extra
+    row is fetched to tell whether another page exists; COUNT(*) is only run
+    when ``with_total`` is set, alongside the page query, adding a ``"total"``
+    key. Pass ``next_cursor`` back as ``after`` to get the following page
+    without an OFFSET scan.
+    """
+    if with_total:
+        items, total = await asyncio.gather(fetch(limit + 1, offset), count())
+    else:
+        items = await fetch(limit + 1, offset)
+    has_more = len(items) > limit
+    items = items[:limit]
+    page = {"items": items}
+    if with_total:
+        page["total"] = total
+    page.update({
+        "limit": limit,
+        "offset": offset,
+        "has_more": has_more,
+        "next_cursor": encode_cursor(items[-1]) if has_more else None,
+    })
+    return page
@@ -0,0 +1,24 @@
+"""Shared response classes."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed.
+
+    Returning an instance directly from an endpoint also skips FastAPI's
+    ``jsonable_encoder`` pass, so only do that with JSON-native payloads
+    such as storage rows.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,8 +1,10 @@
 """Baseline management endpoints."""
 
+import asyncio
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from voicelearn_eval.analyzer.regression import ci_exit_code, detect_regressions
 from voicelearn_eval.api.dependencies import get_storage
 from voicelearn_eval.core.schemas import BaselineCreate
 from voicelearn_eval.storage.base import BaseStorage
@@ -26,11 +28,9 @@ async def create_baseline(
     storage: BaseStorage = Depends(get_storage),
 ):
     # Validate references
-    model = await storage.get_model(body.model_id)
+    model, run = await asyncio.gather(storage.get_model(body.model_id), storage.get_run(body.run_id))
     if not model:
         raise HTTPException(404, f"Model not found: {body.model_id}")
-
-    run = await storage.get_run(body.run_id)
     if not run:
         raise HTTPException(404, f"Run not found: {body.run_id}")
 
@@ -55,10 +55,8 @@ async def delete_baseline(
     baseline_id: str,
     storage: BaseStorage = Depends(get_storage),
 ):
-    baseline = await storage.get_baseline(baseline_id)
-    if not baseline:
+    if not await storage.delete_baseline(baseline_id):
         raise HTTPException(404, f"Baseline not found: {baseline_id}")
-    await storage.delete_baseline(baseline_id)
     return {"status": "deleted", "id": baseline_id}
 
 
@@ -69,11 +67,9 @@ async def check_regression(
     storage: BaseStorage = Depends(get_storage),
 ):
     """Check a run against a baseline for regressions."""
-    baseline = await storage.get_baseline(baseline_id)
+    baseline, run = await asyncio.gather(storage.get_baseline(baseline_id), storage.get_run(run_id))
     if not baseline:
         raise HTTPException(404, f"Baseline not found: {baseline_id}")
-
-    run = await storage.get_run(run_id)
     if not run:
         raise HTTPException(404, f"Run not found: {run_id}")
 
@@ -81,12 +77,11 @@ async def check_regression(
     if not baseline_run_id:
         raise HTTPException(400, "Baseline has no associated run")
 
-    baseline_results = await storage.get_results_for_run(baseline_run_id)
-    current_results = await storage.get_results_for_run(run_id)
-
-    from voicelearn_eval.analyzer.regression import ci_exit_code, detect_regressions
+    results_by_run = await storage.get_results_for_runs([baseline_run_id, run_id])
+    baseline_results = results_by_run[baseline_run_id]
+    current_results = results_by_run[run_id]
 
-    regression = detect_regressions(current_results, baseline_results)
+    regression = await asyncio.to_thread(detect_regressions, current_results, baseline_results)
     regression["exit_code"] = ci_exit_code(regression)
 
     return regression
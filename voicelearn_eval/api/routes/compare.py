@@ -1,122 +1,125 @@
 """Model comparison endpoints."""
 
-import json
+import asyncio
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from voicelearn_eval.analyzer.comparisons import build_radar_data, compare_model_results
+from voicelearn_eval.analyzer.recommendations import compare_recommendations as summarize_recommendations
+from voicelearn_eval.analyzer.recommendations import recommend_deployment
 from voicelearn_eval.api.dependencies import get_storage
+from voicelearn_eval.api.responses import FastJSONResponse
+from voicelearn_eval.grade_levels.scorer import stored_grade_level
 from voicelearn_eval.storage.base import BaseStorage
 
 router = APIRouter()
 
+# ID lists are validated at parse time: at most five comma-separated IDs
+_IDS_PATTERN = r"^[A-Za-z0-9_\-]+(,[A-Za-z0-9_\-]+){0,4}$"
+_IDS_MAX_LENGTH = 256
+
 
 @router.get("/compare")
 async def compare_runs(
-    run_ids: str = Query(..., description="Comma-separated run IDs"),
+    run_ids: str = Query(
+        ..., max_length=_IDS_MAX_LENGTH, pattern=_IDS_PATTERN, description="Comma-separated run IDs (up to 5)"
+    ),
     storage: BaseStorage = Depends(get_storage),
 ):
     """Compare results across multiple evaluation runs."""
-    ids = [r.strip() for r in run_ids.split(",") if r.strip()]
+    ids = run_ids.split(",")
     if len(ids) < 2:
         raise HTTPException(400, "At least 2 run IDs required for comparison")
-    if len(ids) > 5:
-        raise HTTPException(400, "Maximum 5 runs can be compared at once")
 
-    comparisons = []
-    for run_id in ids:
-        run = await storage.get_run(run_id)
+    runs, results_by_run = await asyncio.gather(
+        asyncio.gather(*(storage.get_run(run_id) for run_id in ids)),
+        storage.get_results_for_runs(ids),
+    )
+    for run_id, run in zip(ids, runs):
         if not run:
             raise HTTPException(404, f"Run not found: {run_id}")
-        results = await storage.get_results_for_run(run_id)
-        model = await storage.get_model(run["model_id"]) if run.get("model_id") else None
-        comparisons.append({
-            "run": run,
-            "model": model,
-            "results": results,
-        })
 
-    return {"comparisons": comparisons, "run_count": len(comparisons)}
+    # One batched lookup for every run's model
+    models = await storage.get_models_by_ids([run["model_id"] for run in runs if run.get("model_id")])
+    comparisons = [
+        {"run": run, "model": models.get(run.get("model_id")), "results": results_by_run[run_id]}
+        for run_id, run in zip(ids, runs)
+    ]
+
+    return FastJSONResponse({"comparisons": comparisons, "run_count": len(comparisons)})
 
 
 @router.get("/compare/models")
 async def compare_models(
-    model_ids: str = Query(..., description="Comma-separated model IDs"),
+    model_ids: str = Query(
+        ..., max_length=_IDS_MAX_LENGTH, pattern=_IDS_PATTERN, description="Comma-separated model IDs (up to 5)"
+    ),
     suite_id: str | None = Query(None, description="Filter by suite"),
     storage: BaseStorage = Depends(get_storage),
 ):
     """Compare latest results for multiple models."""
-    ids = [m.strip() for m in model_ids.split(",") if m.strip()]
+    ids = model_ids.split(",")
     if len(ids) < 2:
         raise HTTPException(400, "At least 2 model IDs required")
 
-    comparisons = []
+    models, latest_runs = await asyncio.gather(
+        storage.get_models_by_ids(ids),
+        storage.get_latest_completed_runs(ids, suite_id=suite_id),
+    )
     for model_id in ids:
-        model = await storage.get_model(model_id)
-        if not model:
+        if model_id not in models:
             raise HTTPException(404, f"Model not found: {model_id}")
+    results_by_run = await storage.get_results_for_runs([run["id"] for run in latest_runs.values()])
 
-        filters = {"model_id": model_id, "status": "completed"}
-        if suite_id:
-            filters["suite_id"] = suite_id
-        runs = await storage.list_runs(filters=filters, limit=1)
-        latest_run = runs[0] if runs else None
-        results = []
-        if latest_run:
-            results = await storage.get_results_for_run(latest_run["id"])
-
+    comparisons = []
+    for model_id in ids:
+        latest_run = latest_runs.get(model_id)
         comparisons.append({
-            "model": model,
+            "model": models[model_id],
             "latest_run": latest_run,
-            "results": results,
+            "results": results_by_run.get(latest_run["id"], []) if latest_run else [],
         })
 
     # Use analyzer for structured comparison
-    from voicelearn_eval.analyzer.comparisons import build_radar_data, compare_model_results
-
     analysis = compare_model_results(comparisons)
     radar = build_radar_data(comparisons, analysis.get("radar_dimensions", []))
 
-    return {
+    return FastJSONResponse({
         "comparisons": comparisons,
         "model_count": len(comparisons),
         "analysis": analysis,
         "radar": radar,
-    }
+    })
 
 
 @router.get("/compare/recommendations")
 async def compare_recommendations(
-    model_ids: str = Query(..., description="Comma-separated model IDs"),
+    model_ids: str = Query(
+        ..., max_length=_IDS_MAX_LENGTH, pattern=_IDS_PATTERN, description="Comma-separated model IDs (up to 5)"
+    ),
     storage: BaseStorage = Depends(get_storage),
 ):
     """Get deployment recommendations for multiple models."""
-    ids = [m.strip() for m in model_ids.split(",") if m.strip()]
+    ids = model_ids.split(",")
 
-    from voicelearn_eval.analyzer.recommendations import compare_recommendations, recommend_deployment
+    models, latest_runs = await asyncio.gather(
+        storage.get_models_by_ids(ids),
+        storage.get_latest_completed_runs(ids),
+    )
 
     recs = []
     for model_id in ids:
-        model = await storage.get_model(model_id)
+        model = models.get(model_id)
         if not model:
             raise HTTPException(404, f"Model not found: {model_id}")
+        run = latest_runs.get(model_id)
 
-        runs = await storage.list_runs(filters={"model_id": model_id, "status": "completed"}, limit=1)
-        run = runs[0] if runs else None
-
-        grade_rating = None
-        if run:
-            metrics = run.get("overall_metrics")
-            if isinstance(metrics, str):
-                try:
-                    metrics = json.loads(metrics)
-                except (json.JSONDecodeError, TypeError):
-                    metrics = {}
-            grade_rating = metrics.get("grade_level") if metrics else None
+        grade_rating = stored_grade_level(run) if run else None
 
         rec = recommend_deployment(model=model, run=run, grade_rating=grade_rating)
         rec["model_name"] = model["name"]
         rec["model_id"] = model["id"]
         recs.append(rec)
 
-    summary = compare_recommendations(recs)
+    summary = summarize_recommendations(recs)
     return {"recommendations": recs, "summary": summary}
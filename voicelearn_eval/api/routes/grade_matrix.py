@@ -1,22 +1,72 @@
 """Grade-level matrix endpoints."""
 
+import asyncio
 import json
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 
 from voicelearn_eval.api.dependencies import get_storage
-from voicelearn_eval.grade_levels.scorer import compute_grade_level_rating
+from voicelearn_eval.api.responses import FastJSONResponse
+from voicelearn_eval.grade_levels.scorer import compute_grade_level_rating, stored_grade_level
 from voicelearn_eval.storage.base import BaseStorage
 
 router = APIRouter()
 
 
+def _rate_runs(jobs: list[tuple[str, str, list[dict]]]) -> dict[str, dict]:
+    """Rate each ``(model_id, run_id, results)`` job that has results, keyed by run ID.
+
+    CPU-bound; callers run it in a worker thread to keep the event loop free.
+    """
+    return {
+        run_id: compute_grade_level_rating(model_id=model_id, run_id=run_id, task_results=results).to_dict()
+        for model_id, run_id, results in jobs
+        if results
+    }
+
+
+def _decoded_metrics(run: dict) -> dict:
+    metrics = run.get("overall_metrics") or {}
+    if isinstance(metrics, str):
+        try:
+            metrics = json.loads(metrics)
+        except json.JSONDecodeError:
+            metrics = {}
+    return metrics if isinstance(metrics, dict) else {}
+
+
+def _grade_level_checked(run: dict) -> bool:
+    """Whether a backfill already tried to rate ``run``, even if it found nothing to rate."""
+    return bool(_decoded_metrics(run).get("grade_level_checked"))
+
+
+async def _backfill_grade_levels(storage: BaseStorage, runs: list[dict]) -> None:
+    """Rate runs that predate stored grade levels and save the rating on each run.
+
+    Scheduled as a background task so the matrix response doesn't wait on it.
+    Runs with no task results to rate (e.g. imported without them) are marked
+    as checked instead, so they are not picked up again on every request.
+    """
+    results_by_run = await storage.get_results_for_runs([run["id"] for run in runs])
+    ratings = await asyncio.to_thread(
+        _rate_runs, [(run["model_id"], run["id"], results_by_run[run["id"]]) for run in runs]
+    )
+    for run in runs:
+        metrics = {**_decoded_metrics(run), "grade_level": ratings.get(run["id"]), "grade_level_checked": True}
+        await storage.update_run(run["id"], {"overall_metrics": metrics})
+
+
 @router.get("/grade-matrix")
 async def get_grade_matrix(
+    background_tasks: BackgroundTasks,
     model_id: str | None = None,
     storage: BaseStorage = Depends(get_storage),
 ):
-    """Get grade-level matrix for one or all models."""
+    """Get grade-level matrix for one or all models.
+
+    Runs whose grade level was never stored are left out and rated in the
+    background, so they appear on a later request.
+    """
     if model_id:
         model = await storage.get_model(model_id)
         if not model:
@@ -25,37 +75,23 @@ async def get_grade_matrix(
     else:
         models = await storage.list_models(limit=50)
 
+    latest_runs = await storage.get_latest_completed_runs([model["id"] for model in models])
+
+    # Completed runs carry their grade info in overall_metrics
+    grade_infos = {run["id"]: stored_grade_level(run) for run in latest_runs.values()}
+
+    # Older runs without it are backfilled after the response goes out
+    missing = [run for run in latest_runs.values() if not grade_infos[run["id"]] and not _grade_level_checked(run)]
+    if missing:
+        background_tasks.add_task(_backfill_grade_levels, storage, missing)
+
     matrix = []
     for model in models:
-        runs = await storage.list_runs(
-            filters={"model_id": model["id"], "status": "completed"},
-            limit=1,
-        )
-        if not runs:
+        run = latest_runs.get(model["id"])
+        if not run:
             continue
 
-        run = runs[0]
-        # Try to get grade info from overall_metrics
-        metrics = run.get("overall_metrics")
-        if isinstance(metrics, str):
-            try:
-                metrics = json.loads(metrics)
-            except (json.JSONDecodeError, TypeError):
-                metrics = {}
-
-        grade_info = metrics.get("grade_level") if metrics else None
-
-        if not grade_info:
-            # Recompute from results
-            results = await storage.get_results_for_run(run["id"])
-            if results:
-                rating = compute_grade_level_rating(
-                    model_id=model["id"],
-                    run_id=run["id"],
-                    task_results=results,
-                )
-                grade_info = rating.to_dict()
-
+        grade_info = grade_infos[run["id"]]
         if grade_info:
             matrix.append({
                 "model": model,
@@ -64,7 +100,7 @@ async def get_grade_matrix(
                 "overall_score": run.get("overall_score"),
             })
 
-    return {"matrix": matrix, "total": len(matrix)}
+    return FastJSONResponse({"matrix": matrix, "total": len(matrix)})
 
 
 @router.get("/grade-matrix/{model_id}")
@@ -82,20 +118,20 @@ async def get_model_grade_detail(
         limit=5,
     )
 
-    history = []
-    for run in runs:
-        results = await storage.get_results_for_run(run["id"])
-        if results:
-            rating = compute_grade_level_rating(
-                model_id=model_id,
-                run_id=run["id"],
-                task_results=results,
-            )
-            history.append({
-                "run_id": run["id"],
-                "completed_at": run.get("completed_at"),
-                "grade_level": rating.to_dict(),
-                "overall_score": run.get("overall_score"),
-            })
+    results_by_run = await storage.get_results_for_runs([run["id"] for run in runs])
+    ratings = await asyncio.to_thread(
+        _rate_runs, [(model_id, run["id"], results_by_run[run["id"]]) for run in runs]
+    )
 
-    return {"model": model, "history": history}
+    history = [
+        {
+            "run_id": run["id"],
+            "completed_at": run.get("completed_at"),
+            "grade_level": ratings[run["id"]],
+            "overall_score": run.get("overall_score"),
+        }
+        for run in runs
+        if run["id"] in ratings
+    ]
+
+    return FastJSONResponse({"model": model, "history": history})
@@ -1,9 +1,18 @@
 """Model management endpoints."""
 
-
+import asyncio
+import functools
+import json
+import re
+import time
+from typing import Any
+
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
-from voicelearn_eval.api.dependencies import get_storage
+from voicelearn_eval.api.dependencies import get_hf_client, get_storage
+from voicelearn_eval.api.pagination import paginate, with_cursor
 from voicelearn_eval.core.schemas import HuggingFaceImport, ModelCreate, ModelUpdate
 from voicelearn_eval.storage.base import BaseStorage
 
@@ -14,15 +23,22 @@ router = APIRouter()
 async def list_models(
     model_type: str | None = None,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True, description="Prefer the after cursor"),
+    after: str | None = Query(None, description="next_cursor from the previous page"),
+    with_total: bool = Query(False, description="Also count all matching models"),
     storage: BaseStorage = Depends(get_storage),
 ):
     filters = {}
     if model_type:
         filters["model_type"] = model_type
-    models = await storage.list_models(filters=filters, limit=limit, offset=offset)
-    total = await storage.count_models(filters=filters)
-    return {"items": models, "total": total, "limit": limit, "offset": offset}
+    page_filters = with_cursor(filters, after)
+    return await paginate(
+        lambda lim, off: storage.list_models(filters=page_filters, limit=lim, offset=off),
+        lambda: storage.count_models(filters=filters),
+        limit,
+        offset,
+        with_total,
+    )
 
 
 @router.post("/models", status_code=201)
@@ -37,6 +53,58 @@ async def create_model(
 
 # --- HuggingFace search (must come before {model_id} routes) ---
 
+# HuggingFace Hub lookups are slow network round-trips; answers are reused
+# for a few minutes, and identical lookups already in flight share one
+# upstream request. Requests go through the app's shared async client, whose
+# connection limit also caps concurrent upstream calls.
+_HF_CACHE_TTL = 300.0
+_HF_CACHE_MAX = 512
+_HF_SEARCH_FIELDS = ("downloads", "likes", "pipeline_tag", "tags", "lastModified", "safetensors")
+_hf_cache: dict[tuple, tuple[float, Any]] = {}
+_hf_inflight: dict[tuple, asyncio.Task] = {}
+# Hub repo ids: an optional owner and a name, each starting alphanumeric
+_HF_REPO_ID_RE = re.compile(r"(?:[A-Za-z0-9][\w.-]*/)?[A-Za-z0-9][\w.-]*")
+
+
+async def _fetch_hf(client: httpx.AsyncClient, key: tuple, path: str, params: dict | None) -> Any:
+    response = await client.get(path, params=params)
+    response.raise_for_status()
+    value = response.json()
+    _hf_cache.pop(key, None)
+    if len(_hf_cache) >= _HF_CACHE_MAX:
+        _hf_cache.pop(next(iter(_hf_cache)))  # oldest insertion
+    _hf_cache[key] = (time.monotonic() + _HF_CACHE_TTL, value)
+    return value
+
+
+def _finish_hf_lookup(key: tuple, task: asyncio.Task) -> None:
+    _hf_inflight.pop(key, None)
+    # Retrieve the error so it is not reported as never retrieved when every
+    # caller has already gone away
+    if not task.cancelled():
+        task.exception()
+
+
+async def _cached_hf_get(client: httpx.AsyncClient, path: str, params: dict | None = None) -> Any:
+    """GET a Hub API path and decode the JSON, caching the result for _HF_CACHE_TTL."""
+    key = (path, tuple(sorted((params or {}).items())))
+    entry = _hf_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    task = _hf_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_hf(client, key, path, params))
+        _hf_inflight[key] = task
+        task.add_done_callback(functools.partial(_finish_hf_lookup, key))
+    # Shielded so one caller disconnecting does not cancel the lookup for the rest
+    return await asyncio.shield(task)
+
+
+def _parameter_count_b(info: dict) -> float | None:
+    safetensors = info.get("safetensors") or {}
+    total_params = sum(safetensors.get("parameters", {}).values())
+    return round(total_params / 1e9, 2) if total_params else None
+
 
 @router.get("/models/search-hf")
 async def search_huggingface(
@@ -44,81 +112,68 @@ async def search_huggingface(
     task: str | None = None,
     sort: str = Query("downloads"),
     limit: int = Query(20, ge=1, le=50),
+    hf_client: httpx.AsyncClient = Depends(get_hf_client),
 ):
     """Search HuggingFace Hub for models."""
+    params: dict = {"search": q, "sort": sort, "limit": limit, "direction": -1, "expand": _HF_SEARCH_FIELDS}
+    if task:
+        params["pipeline_tag"] = task
+
     try:
-        from huggingface_hub import HfApi
-
-        hf_api = HfApi()
-        kwargs: dict = {"search": q, "sort": sort, "limit": limit, "direction": -1}
-        if task:
-            kwargs["pipeline_tag"] = task
-
-        models = list(hf_api.list_models(**kwargs))
-        results = []
-        for m in models:
-            size_b = None
-            if m.safetensors:
-                total_params = sum(m.safetensors.get("parameters", {}).values())
-                if total_params:
-                    size_b = round(total_params / 1e9, 2)
-
-            results.append({
-                "repo_id": m.modelId,
-                "name": m.modelId.split("/")[-1] if "/" in m.modelId else m.modelId,
-                "author": m.modelId.split("/")[0] if "/" in m.modelId else None,
-                "downloads": m.downloads or 0,
-                "likes": m.likes or 0,
-                "pipeline_tag": m.pipeline_tag,
-                "tags": list(m.tags or [])[:10],
-                "last_modified": m.lastModified.isoformat() if m.lastModified else None,
-                "parameter_count_b": size_b,
-            })
-
-        return {"items": results, "total": len(results), "query": q}
-
-    except ImportError:
-        raise HTTPException(501, "huggingface_hub not installed")
-    except Exception as e:
+        models = await _cached_hf_get(hf_client, "/api/models", params)
+    except (httpx.HTTPError, ValueError) as e:
         raise HTTPException(400, f"HuggingFace search failed: {e}")
 
+    results = []
+    for m in models:
+        repo_id = m.get("id") if isinstance(m, dict) else None
+        if not isinstance(repo_id, str):
+            continue  # skip malformed Hub entries
+        results.append({
+            "repo_id": repo_id,
+            "name": repo_id.split("/")[-1] if "/" in repo_id else repo_id,
+            "author": repo_id.split("/")[0] if "/" in repo_id else None,
+            "downloads": m.get("downloads") or 0,
+            "likes": m.get("likes") or 0,
+            "pipeline_tag": m.get("pipeline_tag"),
+            "tags": list(m.get("tags") or [])[:10],
+            "last_modified": m.get("lastModified"),
+            "parameter_count_b": _parameter_count_b(m),
+        })
+
+    return {"items": results, "total": len(results), "query": q}
+
 
 @router.post("/models/import-hf", status_code=201)
 async def import_from_huggingface(
     body: HuggingFaceImport,
     storage: BaseStorage = Depends(get_storage),
+    hf_client: httpx.AsyncClient = Depends(get_hf_client),
 ):
+    if not _HF_REPO_ID_RE.fullmatch(body.repo_id):
+        raise HTTPException(400, f"Invalid HuggingFace repo id: {body.repo_id}")
     try:
-        from huggingface_hub import HfApi
-        api = HfApi()
-        info = api.model_info(body.repo_id)
-
-        model_data = {
-            "name": info.modelId.split("/")[-1] if "/" in info.modelId else info.modelId,
-            "model_type": body.model_type,
-            "source_type": "huggingface",
-            "source_uri": body.repo_id,
-            "deployment_target": body.deployment_target,
-            "model_family": info.modelId.split("/")[0] if "/" in info.modelId else None,
-            "tags": list(info.tags or [])[:20],
-        }
-
-        if info.safetensors:
-            total_params = sum(info.safetensors.get("parameters", {}).values())
-            if total_params:
-                model_data["parameter_count_b"] = round(total_params / 1e9, 2)
-
-        model_id = await storage.create_model(model_data)
-        return await storage.get_model(model_id)
-
-    except ImportError:
-        raise HTTPException(
-            501,
-            "huggingface_hub not installed. Run: pip install huggingface_hub",
-        )
-    except Exception as e:
+        info = await _cached_hf_get(hf_client, f"/api/models/{body.repo_id}")
+    except (httpx.HTTPError, ValueError) as e:
         raise HTTPException(400, f"Failed to import from HuggingFace: {e}")
 
+    repo_id = info.get("id") or body.repo_id
+    model_data = {
+        "name": repo_id.split("/")[-1] if "/" in repo_id else repo_id,
+        "model_type": body.model_type,
+        "source_type": "huggingface",
+        "source_uri": body.repo_id,
+        "deployment_target": body.deployment_target,
+        "model_family": repo_id.split("/")[0] if "/" in repo_id else None,
+        "tags": list(info.get("tags") or [])[:20],
+    }
+    parameter_count_b = _parameter_count_b(info)
+    if parameter_count_b:
+        model_data["parameter_count_b"] = parameter_count_b
+
+    model_id = await storage.create_model(model_data)
+    return await storage.get_model(model_id)
+
 
 # --- Model CRUD (parameterized routes) ---
 
@@ -156,10 +211,8 @@ async def delete_model(
     model_id: str,
     storage: BaseStorage = Depends(get_storage),
 ):
-    model = await storage.get_model(model_id)
-    if not model:
+    if not await storage.delete_model(model_id):
         raise HTTPException(404, f"Model not found: {model_id}")
-    await storage.delete_model(model_id)
     return {"status": "deleted", "id": model_id}
 
 
@@ -167,19 +220,32 @@ async def delete_model(
 async def get_model_runs(
     model_id: str,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True, description="Prefer the after cursor"),
+    after: str | None = Query(None, description="next_cursor from the previous page"),
+    with_total: bool = Query(False, description="Also count all of the model's runs"),
     storage: BaseStorage = Depends(get_storage),
 ):
-    model = await storage.get_model(model_id)
+    filters = {"model_id": model_id}
+    page_filters = with_cursor(filters, after)
+    model, page = await asyncio.gather(
+        storage.get_model(model_id),
+        paginate(
+            lambda lim, off: storage.list_runs(filters=page_filters, limit=lim, offset=off),
+            lambda: storage.count_runs(filters=filters),
+            limit,
+            offset,
+            with_total,
+        ),
+    )
     if not model:
         raise HTTPException(404, f"Model not found: {model_id}")
-    runs = await storage.list_runs(filters={"model_id": model_id}, limit=limit, offset=offset)
-    total = await storage.count_runs(filters={"model_id": model_id})
-    return {"items": runs, "total": total, "limit": limit, "offset": offset}
+    return page
 
 
 # --- Download management ---
 
+_SSE_KEEPALIVE_SECONDS = 15.0
+
 
 @router.post("/models/{model_id}/download")
 async def start_download(
@@ -200,13 +266,37 @@ async def start_download(
         raise HTTPException(400, str(e))
 
 
-@router.get("/models/{model_id}/download-status")
+@router.get("/models/downloads/stream")
+async def stream_download_status(request: Request):
+    """Stream download progress events for all models as Server-Sent Events."""
+    download_service = request.app.state.download_service
+
+    async def events():
+        subscription = download_service.subscribe(idle_timeout=_SSE_KEEPALIVE_SECONDS)
+        try:
+            async for event in subscription:
+                if event is not None:
+                    yield f"data: {json.dumps(event)}\n\n"
+                elif await request.is_disconnected():
+                    break
+                else:
+                    yield ": keepalive\n\n"
+        finally:
+            await subscription.aclose()
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@router.get("/models/{model_id}/download-status", deprecated=True)
 async def get_download_status(
     model_id: str,
     request: Request,
     storage: BaseStorage = Depends(get_storage),
 ):
-    """Check download status for a model."""
+    """Check download status for a model.
+
+    Prefer ``GET /models/downloads/stream`` over polling this endpoint.
+    """
     download_service = request.app.state.download_service
     try:
         return await download_service.get_status(model_id)
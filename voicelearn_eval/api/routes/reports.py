@@ -1,11 +1,13 @@
 """Report generation and export endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
-from voicelearn_eval.api.dependencies import get_storage
+from voicelearn_eval.api.cache import ResponseCache
+from voicelearn_eval.api.dependencies import get_response_cache, get_storage
 from voicelearn_eval.core.schemas import ExportRequest
 from voicelearn_eval.storage.base import BaseStorage
-from voicelearn_eval.vlef.exporter import export_vlef
+from voicelearn_eval.vlef.exporter import stream_vlef
 from voicelearn_eval.vlef.importer import import_vlef
 
 router = APIRouter()
@@ -20,13 +22,13 @@ async def export_data(
     if body.format != "vlef":
         raise HTTPException(400, f"Unsupported format: {body.format}. Use 'vlef'.")
 
-    data = await export_vlef(
+    chunks = stream_vlef(
         storage=storage,
         run_ids=body.run_ids,
         model_id=body.model_id,
         export_all=not body.run_ids and not body.model_id,
     )
-    return data
+    return StreamingResponse(chunks, media_type="application/json")
 
 
 @router.post("/import")
@@ -34,10 +36,13 @@ async def import_data(
     data: dict,
     merge: bool = False,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
     """Import evaluation data from VLEF format."""
     if not data.get("format_version"):
         raise HTTPException(400, "Invalid VLEF data: missing format_version")
 
     summary = await import_vlef(storage=storage, data=data, merge=merge)
+    # Imports can add suites and runs
+    cache.clear()
     return {"status": "imported", "summary": summary}
@@ -1,10 +1,13 @@
 """Evaluation run endpoints."""
 
-
+import asyncio
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from voicelearn_eval.api.dependencies import get_orchestrator, get_storage
+from voicelearn_eval.api.cache import ResponseCache
+from voicelearn_eval.api.dependencies import get_orchestrator, get_response_cache, get_storage
+from voicelearn_eval.api.pagination import paginate, with_cursor
+from voicelearn_eval.api.responses import FastJSONResponse
 from voicelearn_eval.core.orchestrator import EvalOrchestrator
 from voicelearn_eval.core.schemas import RunCreate
 from voicelearn_eval.storage.base import BaseStorage
@@ -18,7 +21,9 @@ async def list_runs(
     suite_id: str | None = None,
     status: str | None = None,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True, description="Prefer the after cursor"),
+    after: str | None = Query(None, description="next_cursor from the previous page"),
+    with_total: bool = Query(False, description="Also count all matching runs"),
     storage: BaseStorage = Depends(get_storage),
 ):
     filters = {}
@@ -28,17 +33,28 @@ async def list_runs(
         filters["suite_id"] = suite_id
     if status:
         filters["status"] = status
-    runs = await storage.list_runs(filters=filters, limit=limit, offset=offset)
-    # Enrich runs with model/suite names for display
+    page_filters = with_cursor(filters, after)
+    page = await paginate(
+        lambda lim, off: storage.list_runs(filters=page_filters, limit=lim, offset=off),
+        lambda: storage.count_runs(filters=filters),
+        limit,
+        offset,
+        with_total,
+    )
+    runs = page["items"]
+    # Enrich runs with model/suite names for display: one batched query per table
+    models, suites = await asyncio.gather(
+        storage.get_models_by_ids([r["model_id"] for r in runs if r.get("model_id")]),
+        storage.get_suites_by_ids([r["suite_id"] for r in runs if r.get("suite_id")]),
+    )
     for run in runs:
         if run.get("model_id"):
-            model = await storage.get_model(run["model_id"])
+            model = models.get(run["model_id"])
             run["model_name"] = model["name"] if model else "Unknown"
         if run.get("suite_id"):
-            suite = await storage.get_suite(run["suite_id"])
+            suite = suites.get(run["suite_id"])
             run["suite_name"] = suite["name"] if suite else "Unknown"
-    total = await storage.count_runs(filters=filters)
-    return {"items": runs, "total": total, "limit": limit, "offset": offset}
+    return page
 
 
 @router.post("/runs", status_code=201)
@@ -79,7 +95,7 @@ async def get_run_results(
     if not run:
         raise HTTPException(404, f"Run not found: {run_id}")
     results = await storage.get_results_for_run(run_id)
-    return {"items": results, "total": len(results), "run_id": run_id}
+    return FastJSONResponse({"items": results, "total": len(results), "run_id": run_id})
 
 
 @router.post("/runs/{run_id}/cancel")
@@ -99,11 +115,11 @@ async def cancel_run(
 async def delete_run(
     run_id: str,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
-    run = await storage.get_run(run_id)
-    if not run:
+    if not await storage.delete_run(run_id):
         raise HTTPException(404, f"Run not found: {run_id}")
-    await storage.delete_run(run_id)
+    cache.clear("trends")
     return {"status": "deleted", "id": run_id}
 
 
@@ -1,9 +1,11 @@
 """Shared report endpoints."""
 
 import secrets
+import time
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic_core import to_json
 
 from voicelearn_eval.api.dependencies import get_storage
 from voicelearn_eval.core.schemas import ShareCreate
@@ -20,16 +22,20 @@ async def create_share_link(
     """Create a shareable link for a report."""
     token = secrets.token_urlsafe(24)
     expires_at = None
+    expires_at_ts = None
     if body.expires_in_days:
         expires_at = (
             datetime.utcnow() + timedelta(days=body.expires_in_days)
         ).isoformat()
+        expires_at_ts = int(time.time()) + body.expires_in_days * 86400
 
     report_id = await storage.create_shared_report({
-        "token": token,
+        "share_token": token,
         "report_type": body.report_type,
-        "report_config": body.report_config,
+        # Encode straight from the validated body; storage keeps it as-is
+        "report_config": to_json(body.report_config),
         "expires_at": expires_at,
+        "expires_at_ts": expires_at_ts,
     })
 
     return {
@@ -46,19 +52,11 @@ async def get_shared_report(
     storage: BaseStorage = Depends(get_storage),
 ):
     """Access a shared report by token."""
-    report = await storage.get_shared_report(token)
-    if not report:
-        raise HTTPException(404, "Shared report not found or expired")
-
-    # Check expiry
-    expires_at = report.get("expires_at")
-    if expires_at:
-        try:
-            exp = datetime.fromisoformat(expires_at)
-            if datetime.utcnow() > exp:
-                raise HTTPException(410, "This shared report has expired")
-        except ValueError:
-            pass
-
-    await storage.increment_share_views(token)
-    return report
+    report = await storage.fetch_and_bump_share(token, int(time.time()))
+    if report:
+        return report
+
+    # Not served: tell an expired link apart from an unknown one
+    if await storage.get_shared_report(token):
+        raise HTTPException(410, "This shared report has expired")
+    raise HTTPException(404, "Shared report not found or expired")
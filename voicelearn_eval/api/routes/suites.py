@@ -2,27 +2,39 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from voicelearn_eval.api.dependencies import get_storage
+from voicelearn_eval.api.cache import ResponseCache
+from voicelearn_eval.api.dependencies import get_response_cache, get_storage
 from voicelearn_eval.core.schemas import SuiteCreate, SuiteUpdate
 from voicelearn_eval.storage.base import BaseStorage
 
 router = APIRouter()
 
+# Suites are mostly built-in; writes below clear the cached listing
+_SUITES_CACHE_TTL = 300
+
 
 @router.get("/suites")
 async def list_suites(
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
+    cached = cache.get("suites", ())
+    if cached is not None:
+        return cached
     suites = await storage.list_suites()
-    return {"items": suites, "total": len(suites)}
+    response = {"items": suites, "total": len(suites)}
+    cache.set("suites", (), response, _SUITES_CACHE_TTL)
+    return response
 
 
 @router.post("/suites", status_code=201)
 async def create_suite(
     body: SuiteCreate,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
     suite_id = await storage.create_suite(body.model_dump())
+    cache.clear("suites")
     suite = await storage.get_suite(suite_id)
     return suite
 
@@ -45,29 +57,35 @@ async def update_suite(
     suite_id: str,
     body: SuiteUpdate,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
+    updates = body.model_dump(exclude_unset=True)
+    if updates:
+        suite = await storage.update_suite_if_editable(suite_id, updates)
+        if suite:
+            cache.clear("suites")
+            return suite
+    # Nothing was written: an empty patch, a missing suite, or a built-in one
     suite = await storage.get_suite(suite_id)
     if not suite:
         raise HTTPException(404, f"Suite not found: {suite_id}")
     if suite.get("is_builtin"):
         raise HTTPException(400, "Cannot modify built-in suites")
-    updates = body.model_dump(exclude_unset=True)
-    if updates:
-        await storage.update_suite(suite_id, updates)
-    return await storage.get_suite(suite_id)
+    return suite
 
 
 @router.delete("/suites/{suite_id}")
 async def delete_suite(
     suite_id: str,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
-    suite = await storage.get_suite(suite_id)
-    if not suite:
-        raise HTTPException(404, f"Suite not found: {suite_id}")
-    if suite.get("is_builtin"):
+    if not await storage.delete_suite_if_editable(suite_id):
+        suite = await storage.get_suite(suite_id)
+        if not suite:
+            raise HTTPException(404, f"Suite not found: {suite_id}")
         raise HTTPException(400, "Cannot delete built-in suites")
-    await storage.delete_suite(suite_id)
+    cache.clear("suites")
     return {"status": "deleted", "id": suite_id}
 
 
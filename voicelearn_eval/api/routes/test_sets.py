@@ -3,28 +3,40 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from voicelearn_eval.api.dependencies import get_storage
+from voicelearn_eval.api.cache import ResponseCache
+from voicelearn_eval.api.dependencies import get_response_cache, get_storage
 from voicelearn_eval.core.schemas import CustomTestSetCreate
 from voicelearn_eval.storage.base import BaseStorage
 
 router = APIRouter()
 
+# Writes below clear the cached listings
+_TEST_SETS_CACHE_TTL = 300
+
 
 @router.get("/test-sets")
 async def list_test_sets(
     model_type: str | None = None,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
+    cached = cache.get("test_sets", (model_type,))
+    if cached is not None:
+        return cached
     test_sets = await storage.list_test_sets(model_type=model_type)
-    return {"items": test_sets, "total": len(test_sets)}
+    response = {"items": test_sets, "total": len(test_sets)}
+    cache.set("test_sets", (model_type,), response, _TEST_SETS_CACHE_TTL)
+    return response
 
 
 @router.post("/test-sets", status_code=201)
 async def create_test_set(
     body: CustomTestSetCreate,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
     ts_id = await storage.create_test_set(body.model_dump())
+    cache.clear("test_sets")
     ts = await storage.get_test_set(ts_id)
     return ts
 
@@ -44,9 +56,11 @@ async def get_test_set(
 async def delete_test_set(
     test_set_id: str,
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
     ts = await storage.get_test_set(test_set_id)
     if not ts:
         raise HTTPException(404, f"Test set not found: {test_set_id}")
     await storage.delete_test_set(test_set_id)
+    cache.clear("test_sets")
     return {"status": "deleted", "id": test_set_id}
@@ -1,14 +1,21 @@
 """Trend analysis endpoints."""
 
-import json
+from itertools import groupby
+from operator import itemgetter
 
 from fastapi import APIRouter, Depends, Query
 
-from voicelearn_eval.api.dependencies import get_storage
+from voicelearn_eval.api.cache import ResponseCache
+from voicelearn_eval.api.dependencies import get_response_cache, get_storage
+from voicelearn_eval.grade_levels.scorer import stored_grade_level
 from voicelearn_eval.storage.base import BaseStorage
 
 router = APIRouter()
 
+# Newly completed runs may take up to a minute to appear; deleting a run
+# clears the cache, so removed runs never linger
+_TRENDS_CACHE_TTL = 60
+
 
 @router.get("/trends")
 async def get_trends(
@@ -16,40 +23,37 @@ async def get_trends(
     suite_id: str | None = None,
     limit: int = Query(20, ge=1, le=100),
     storage: BaseStorage = Depends(get_storage),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
     """Get score trends over time for models."""
-    filters = {"status": "completed"}
+    cache_key = (model_id, suite_id, limit)
+    cached = cache.get("trends", cache_key)
+    if cached is not None:
+        return cached
+
+    filters = {"status": "completed", "group_by_model": True}
     if model_id:
         filters["model_id"] = model_id
     if suite_id:
         filters["suite_id"] = suite_id
 
+    # Rows come back grouped by model, each model's runs in completion order
     runs = await storage.list_runs(filters=filters, limit=limit)
 
-    # Group by model
-    by_model: dict[str, list] = {}
-    for run in runs:
-        mid = run.get("model_id", "unknown")
-        if mid not in by_model:
-            by_model[mid] = []
-
-        metrics = run.get("overall_metrics")
-        if isinstance(metrics, str):
-            try:
-                metrics = json.loads(metrics)
-            except (json.JSONDecodeError, TypeError):
-                metrics = {}
-
-        by_model[mid].append({
-            "run_id": run["id"],
-            "score": run.get("overall_score"),
-            "completed_at": run.get("completed_at"),
-            "suite_id": run.get("suite_id"),
-            "grade_level": metrics.get("grade_level") if metrics else None,
-        })
-
-    # Sort each model's runs by date
-    for mid in by_model:
-        by_model[mid].sort(key=lambda r: r.get("completed_at") or "")
-
-    return {"trends": by_model, "model_count": len(by_model)}
+    by_model = {
+        mid: [
+            {
+                "run_id": run["id"],
+                "score": run.get("overall_score"),
+                "completed_at": run.get("completed_at"),
+                "suite_id": run.get("suite_id"),
+                "grade_level": stored_grade_level(run),
+            }
+            for run in model_runs
+        ]
+        for mid, model_runs in groupby(runs, key=itemgetter("model_id"))
+    }
+
+    response = {"trends": by_model, "model_count": len(by_model)}
+    cache.set("trends", cache_key, response, _TRENDS_CACHE_TTL)
+    return response
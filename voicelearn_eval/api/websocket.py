@@ -1,44 +1,75 @@
 """WebSocket connection manager for live progress updates."""
 
+import asyncio
 import json
 import logging
 from typing import Any
 
 from fastapi import WebSocket
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Sends are issued concurrently in batches of this size, yielding to the
+# event loop between batches so a large fan-out doesn't monopolise it.
+_BROADCAST_BATCH = 50
+
+# Progress updates arriving within this window go out as one frame.
+_PROGRESS_FLUSH_DELAY = 0.025
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time run progress."""
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
+        self._pending: list[dict[str, Any]] = []
+        self._flush_task: asyncio.Task | None = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections = [
-            ws for ws in self.active_connections if ws != websocket
-        ]
+        self.active_connections.discard(websocket)
 
     async def broadcast(self, data: dict[str, Any]):
         """Send data to all connected clients."""
-        message = json.dumps(data)
-        dead = []
-        for ws in self.active_connections:
+        message = _dumps(data)
+        connections = list(self.active_connections)
+        if len(connections) == 1:
             try:
-                await ws.send_text(message)
+                await connections[0].send_text(message)
             except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws)
+                self.active_connections.discard(connections[0])
+            return
+
+        dead = []
+        for start in range(0, len(connections), _BROADCAST_BATCH):
+            if start:
+                await asyncio.sleep(0)
+            batch = connections[start:start + _BROADCAST_BATCH]
+            results = await asyncio.gather(*(ws.send_text(message) for ws in batch), return_exceptions=True)
+            dead.extend(ws for ws, result in zip(batch, results) if isinstance(result, Exception))
+        self.active_connections.difference_update(dead)
 
     async def send_progress(self, run_id: str, update) -> None:
-        """Progress listener callback for the orchestrator."""
-        await self.broadcast({
+        """Progress listener callback for the orchestrator.
+
+        Updates are buffered briefly and sent as one ``progress_batch``
+        message; a run reaching 100% is flushed straight away.
+        """
+        self._pending.append({
             "type": "progress",
             "run_id": run_id,
             "task_name": update.task_name,
@@ -47,3 +78,24 @@ class ConnectionManager:
             "percent_complete": update.percent_complete,
             "message": update.message,
         })
+        if update.percent_complete >= 100:
+            await self.flush_now()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(_PROGRESS_FLUSH_DELAY))
+
+    async def flush_now(self) -> None:
+        """Send any buffered progress updates immediately."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._flush()
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        if pending:
+            await self.broadcast({"type": "progress_batch", "updates": pending})
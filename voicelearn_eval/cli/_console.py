@@ -0,0 +1,21 @@
+"""Rich console shared by the CLI commands, created on first use."""
+
+
+class _LazyConsole:
+    """Forward attribute access to a rich ``Console`` built on first use.
+
+    Importing rich costs tens of milliseconds that ``--help`` and shell
+    completion would otherwise pay on every invocation.
+    """
+
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
@@ -1,8 +1,18 @@
 """Shared CLI helpers for async operations and output formatting."""
 
 import asyncio
+import atexit
+import functools
+import json
+import os
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import click
+from rich.console import Console
+
 from voicelearn_eval.core.config import AppConfig, ensure_data_dir, load_config
 from voicelearn_eval.core.orchestrator import EvalOrchestrator
 from voicelearn_eval.plugins.base import PluginRegistry
@@ -10,14 +20,32 @@ from voicelearn_eval.plugins.llm.lm_eval_harness import LMEvalHarnessPlugin
 from voicelearn_eval.storage.seed import seed_builtin_suites
 from voicelearn_eval.storage.sqlite_storage import SQLiteStorage
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 
 def run_sync(coro):
-    """Run an async function synchronously for CLI commands."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    """Run an async function synchronously for CLI commands.
+
+    ``asyncio.run`` also cancels leftover tasks and shuts down async
+    generators and the default executor before closing the loop.
+    """
+    return asyncio.run(coro)
+
+
+def print_json(console: Console, obj) -> None:
+    """Print ``obj`` as indented JSON for ``--format json`` output.
+
+    Markup and line wrapping are off so the output stays valid JSON when
+    piped.
+    """
+    if orjson is not None:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    else:
+        text = json.dumps(obj, indent=2)
+    console.print(text, markup=False, soft_wrap=True)
 
 
 async def get_initialized_storage(
@@ -35,8 +63,88 @@ async def get_initialized_storage(
     return storage, config
 
 
+# Storage kept open for the life of the process, keyed by (config_path, db_path).
+# Only used when VOICELEARN_SHARED_STORAGE=1, for processes that run many
+# commands (scripts, tests); a normal CLI call opens and closes its own.
+_STORAGE_CACHE: dict[tuple, tuple[SQLiteStorage, AppConfig]] = {}
+
+# Each aiosqlite connection runs a non-daemon thread, and the interpreter joins
+# those before ``atexit`` handlers run, so the close has to be hooked in ahead
+# of that join. ``threading._register_atexit`` is CPython's undocumented hook
+# for exactly that; where it is missing, plain ``atexit`` is the fallback, and
+# since it runs too late to unblock the join, callers there must call
+# ``close_shared_storage`` themselves before exiting.
+_register_exit_hook = getattr(threading, "_register_atexit", atexit.register)
+
+
+async def get_shared_storage(
+    config_path: str | None = None, db_path: str | None = None
+) -> tuple[SQLiteStorage, AppConfig]:
+    """Return process-wide initialized storage, creating it on first use."""
+    key = (config_path, db_path)
+    if key not in _STORAGE_CACHE:
+        if not _STORAGE_CACHE:
+            _register_exit_hook(close_shared_storage)
+        _STORAGE_CACHE[key] = await get_initialized_storage(config_path, db_path)
+    return _STORAGE_CACHE[key]
+
+
+def close_shared_storage() -> None:
+    """Close all process-wide storage (also done automatically at exit)."""
+
+    async def _close_all():
+        for storage, _ in _STORAGE_CACHE.values():
+            await storage.close()
+
+    if _STORAGE_CACHE:
+        asyncio.run(_close_all())
+        _STORAGE_CACHE.clear()
+
+
+@asynccontextmanager
+async def storage_session(
+    config_path: str | None = None, db_path: str | None = None
+) -> AsyncIterator[tuple[SQLiteStorage, AppConfig]]:
+    """Provide storage for one command, closing it afterwards unless it is shared."""
+    if os.environ.get("VOICELEARN_SHARED_STORAGE") == "1":
+        yield await get_shared_storage(config_path, db_path)
+        return
+    storage, config = await get_initialized_storage(config_path, db_path)
+    try:
+        yield storage, config
+    finally:
+        await storage.close()
+
+
+async def resolve_model(ctx: click.Context, storage: SQLiteStorage, key: str) -> dict | None:
+    """Look up a model by ID, falling back to slug.
+
+    Results (including misses) are memoized on ``ctx.obj`` for the rest of the
+    invocation; commands that add or remove models call ``forget_models``.
+    """
+    cache = ctx.obj.setdefault("model_cache", {})
+    if key not in cache:
+        model = await storage.get_model_by_id_or_slug(key)
+        cache[key] = model
+        if model:
+            cache.setdefault(model["id"], model)
+            cache.setdefault(model["slug"], model)
+    return cache[key]
+
+
+def forget_models(ctx: click.Context) -> None:
+    """Drop memoized model lookups after the registry changes."""
+    ctx.obj.pop("model_cache", None)
+
+
+@functools.lru_cache(maxsize=1)
 def get_plugin_registry() -> PluginRegistry:
-    """Create and populate plugin registry."""
+    """Create and populate plugin registry.
+
+    Built once per process, since plugin discovery scans entry points; treat
+    the result as read-only and use ``get_plugin_registry.cache_clear()`` to
+    force a rebuild.
+    """
     registry = PluginRegistry()
     # Register built-in plugins
     registry.register(LMEvalHarnessPlugin())
@@ -45,11 +153,10 @@ def get_plugin_registry() -> PluginRegistry:
     return registry
 
 
-async def get_orchestrator(
+@asynccontextmanager
+async def orchestrator_session(
     config_path: str | None = None, db_path: str | None = None
-) -> tuple[EvalOrchestrator, SQLiteStorage, AppConfig]:
-    """Get a fully initialized orchestrator."""
-    storage, config = await get_initialized_storage(config_path, db_path)
-    registry = get_plugin_registry()
-    orchestrator = EvalOrchestrator(storage, registry)
-    return orchestrator, storage, config
+) -> AsyncIterator[tuple[EvalOrchestrator, SQLiteStorage, AppConfig]]:
+    """Like ``storage_session``, with an orchestrator bound to the storage."""
+    async with storage_session(config_path, db_path) as (storage, config):
+        yield EvalOrchestrator(storage, get_plugin_registry()), storage, config
@@ -1,9 +1,10 @@
 """voicelearn-eval compare: Compare models."""
 
+import asyncio
+
 import click
-from rich.console import Console
 
-console = Console()
+from ._console import console
 
 
 @click.command("compare")
@@ -14,7 +15,7 @@ console = Console()
 def compare_cmd(ctx, models, suite, fmt):
     """Compare 2-5 models side by side."""
 
-    from ._helpers import get_initialized_storage, run_sync
+    from ._helpers import resolve_model, run_sync, storage_session
 
     model_ids = [m.strip() for m in models.split(",")]
     if len(model_ids) < 2 or len(model_ids) > 5:
@@ -22,30 +23,23 @@ def compare_cmd(ctx, models, suite, fmt):
         raise SystemExit(3)
 
     async def _compare():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             from rich.table import Table
 
             table = Table(title="Model Comparison")
             table.add_column("Metric", style="bold")
 
-            resolved_models = []
-            for mid in model_ids:
-                m = await storage.get_model(mid) or await storage.get_model_by_slug(mid)
+            resolved_models = await asyncio.gather(*(resolve_model(ctx, storage, mid) for mid in model_ids))
+            for mid, m in zip(model_ids, resolved_models):
                 if not m:
                     console.print(f"[red]Model not found: {mid}[/red]")
                     raise SystemExit(4)
-                resolved_models.append(m)
                 table.add_column(m["name"][:20])
 
-            # Get latest runs for each model
+            # Get latest runs for all models in one query
+            latest = await storage.get_latest_completed_runs([m["id"] for m in resolved_models])
             for m in resolved_models:
-                runs = await storage.list_runs(
-                    filters={"model_id": m["id"], "status": "completed"}, limit=1
-                )
-                m["_latest_run"] = runs[0] if runs else None
+                m["_latest_run"] = latest.get(m["id"])
 
             # Score row
             scores = []
@@ -68,7 +62,4 @@ def compare_cmd(ctx, models, suite, fmt):
 
             console.print(table)
 
-        finally:
-            await storage.close()
-
     run_sync(_compare())
@@ -1,13 +1,23 @@
 """voicelearn-eval export/import: VLEF format operations."""
 
 import json
+from pathlib import Path
 
 import click
-from rich.console import Console
 
-from ._helpers import get_initialized_storage, run_sync
+from ._console import console
 
-console = Console()
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+
+def _read_json(path: str) -> dict:
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 @click.command("export")
@@ -19,28 +29,26 @@ console = Console()
 @click.pass_context
 def export_cmd(ctx, run_id, export_all, model_id, fmt, output):
     """Export evaluation results."""
-    from voicelearn_eval.vlef.exporter import export_vlef
+
+    from voicelearn_eval.vlef.exporter import stream_vlef
+
+    from ._helpers import run_sync, storage_session
 
     async def _export():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
-            data = await export_vlef(
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
+            # Written chunk by chunk so the whole export is never held in memory
+            chunks = stream_vlef(
                 storage,
                 run_ids=[run_id] if run_id else None,
                 model_id=model_id,
                 export_all=export_all,
             )
-
-            with open(output, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(output, "wb") as f:
+                async for chunk in chunks:
+                    f.write(chunk)
 
             console.print(f"[green]Exported to:[/green] {output}")
 
-        finally:
-            await storage.close()
-
     run_sync(_export())
 
 
@@ -50,15 +58,14 @@ def export_cmd(ctx, run_id, export_all, model_id, fmt, output):
 @click.pass_context
 def import_cmd(ctx, file_path, merge):
     """Import evaluation results from VLEF format."""
+
     from voicelearn_eval.vlef.importer import import_vlef
 
+    from ._helpers import run_sync, storage_session
+
     async def _import():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
-            with open(file_path) as f:
-                data = json.load(f)
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
+            data = _read_json(file_path)
 
             summary = await import_vlef(storage, data, merge=merge)
             console.print(f"[green]Imported:[/green] {file_path}")
@@ -66,7 +73,4 @@ def import_cmd(ctx, file_path, merge):
             console.print(f"  Runs:    {summary.get('runs_imported', 0)}")
             console.print(f"  Skipped: {summary.get('skipped', 0)}")
 
-        finally:
-            await storage.close()
-
     run_sync(_import())
@@ -1,17 +1,10 @@
 """voicelearn-eval grade: Grade-level assessment."""
 
-import json
+import asyncio
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from voicelearn_eval.grade_levels.scorer import compute_grade_level_rating
-from voicelearn_eval.grade_levels.tiers import TIER_LABELS, TIER_ORDER
-
-from ._helpers import get_initialized_storage, run_sync
-
-console = Console()
+from ._console import console
 
 
 @click.command("grade")
@@ -23,23 +16,30 @@ console = Console()
 def grade_cmd(ctx, model, threshold, run_id, fmt):
     """Show grade-level assessment for a model."""
 
+    from rich.table import Table
+
+    from voicelearn_eval.grade_levels.scorer import compute_grade_level_rating
+    from voicelearn_eval.grade_levels.tiers import TIER_LABELS, TIER_ORDER
+
+    from ._helpers import print_json, resolve_model, run_sync, storage_session
+
     async def _grade():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
-            # Resolve model
-            model_data = await storage.get_model(model)
-            if not model_data:
-                model_data = await storage.get_model_by_slug(model)
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
+            results = None
+            if run_id:
+                # The run and its results don't depend on the model lookup
+                model_data, run, results = await asyncio.gather(
+                    resolve_model(ctx, storage, model), storage.get_run(run_id), storage.get_results_for_run(run_id)
+                )
+            else:
+                model_data = await resolve_model(ctx, storage, model)
+                run = None
+
             if not model_data:
                 console.print(f"[red]Error: Model not found: {model}[/red]")
                 raise SystemExit(4)
 
-            # Get run
-            if run_id:
-                run = await storage.get_run(run_id)
-            else:
+            if not run_id:
                 # Get latest completed run for this model
                 runs = await storage.list_runs(
                     filters={"model_id": model_data["id"], "status": "completed"},
@@ -53,7 +53,8 @@ def grade_cmd(ctx, model, threshold, run_id, fmt):
                 raise SystemExit(1)
 
             # Get task results
-            results = await storage.get_results_for_run(run["id"])
+            if results is None:
+                results = await storage.get_results_for_run(run["id"])
             if not results:
                 console.print(f"[red]Error: No results found for run {run['id']}[/red]")
                 raise SystemExit(1)
@@ -67,7 +68,7 @@ def grade_cmd(ctx, model, threshold, run_id, fmt):
             )
 
             if fmt == "json":
-                console.print(json.dumps(rating.to_dict(), indent=2))
+                print_json(console, rating.to_dict())
                 return
 
             # Display table
@@ -113,7 +114,4 @@ def grade_cmd(ctx, model, threshold, run_id, fmt):
             if rating.overall_education_score is not None:
                 console.print(f"  Overall Education Score: {rating.overall_education_score:.1f}%")
 
-        finally:
-            await storage.close()
-
     run_sync(_grade())
@@ -1,14 +1,16 @@
 """voicelearn-eval list: List resources."""
 
-import json
-
 import click
-from rich.console import Console
-from rich.table import Table
 
-from ._helpers import get_initialized_storage, get_plugin_registry, run_sync
+from ._console import console
 
-console = Console()
+_STATUS_STYLE = {
+    "completed": "[green]completed[/green]",
+    "running": "[blue]running[/blue]",
+    "failed": "[red]failed[/red]",
+    "pending": "[dim]pending[/dim]",
+    "cancelled": "[yellow]cancelled[/yellow]",
+}
 
 
 @click.group("list")
@@ -26,18 +28,19 @@ def list_cmd(ctx):
 def list_models(ctx, model_type, fmt, limit):
     """List registered models."""
 
+    from rich.table import Table
+
+    from ._helpers import print_json, run_sync, storage_session
+
     async def _list():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             filters = {}
             if model_type:
                 filters["model_type"] = model_type
             models = await storage.list_models(filters=filters, limit=limit)
 
             if fmt == "json":
-                console.print(json.dumps(models, indent=2))
+                print_json(console, models)
                 return
 
             table = Table(title="Registered Models")
@@ -66,8 +69,6 @@ def list_models(ctx, model_type, fmt, limit):
                 console.print("[dim]No models registered. Use 'voicelearn-eval model add' to register one.[/dim]")
             else:
                 console.print(table)
-        finally:
-            await storage.close()
 
     run_sync(_list())
 
@@ -79,18 +80,19 @@ def list_models(ctx, model_type, fmt, limit):
 def list_suites(ctx, model_type, fmt):
     """List benchmark suites."""
 
+    from rich.table import Table
+
+    from ._helpers import print_json, run_sync, storage_session
+
     async def _list():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             filters = {}
             if model_type:
                 filters["model_type"] = model_type
             suites = await storage.list_suites(filters=filters)
 
             if fmt == "json":
-                console.print(json.dumps(suites, indent=2))
+                print_json(console, suites)
                 return
 
             table = Table(title="Benchmark Suites")
@@ -112,8 +114,6 @@ def list_suites(ctx, model_type, fmt):
                 )
 
             console.print(table)
-        finally:
-            await storage.close()
 
     run_sync(_list())
 
@@ -127,11 +127,12 @@ def list_suites(ctx, model_type, fmt):
 def list_runs(ctx, status, model_id, limit, fmt):
     """List evaluation runs."""
 
+    from rich.table import Table
+
+    from ._helpers import print_json, run_sync, storage_session
+
     async def _list():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             filters = {}
             if status:
                 filters["status"] = status
@@ -140,7 +141,7 @@ def list_runs(ctx, status, model_id, limit, fmt):
             runs = await storage.list_runs(filters=filters, limit=limit)
 
             if fmt == "json":
-                console.print(json.dumps(runs, indent=2))
+                print_json(console, runs)
                 return
 
             table = Table(title="Evaluation Runs")
@@ -152,13 +153,8 @@ def list_runs(ctx, status, model_id, limit, fmt):
             table.add_column("Created")
 
             for r in runs:
-                status_style = {
-                    "completed": "[green]completed[/green]",
-                    "running": "[blue]running[/blue]",
-                    "failed": "[red]failed[/red]",
-                    "pending": "[dim]pending[/dim]",
-                    "cancelled": "[yellow]cancelled[/yellow]",
-                }.get(r.get("status", ""), r.get("status", ""))
+                run_status = r.get("status", "")
+                status_style = _STATUS_STYLE.get(run_status, run_status)
 
                 score = f"{r['overall_score']:.1f}" if r.get("overall_score") is not None else "-"
                 created = r.get("created_at", "")[:19]
@@ -176,8 +172,6 @@ def list_runs(ctx, status, model_id, limit, fmt):
                 console.print("[dim]No runs found. Use 'voicelearn-eval run' to start one.[/dim]")
             else:
                 console.print(table)
-        finally:
-            await storage.close()
 
     run_sync(_list())
 
@@ -187,11 +181,16 @@ def list_runs(ctx, status, model_id, limit, fmt):
 @click.pass_context
 def list_benchmarks(ctx, fmt):
     """List all available benchmarks from all plugins."""
+
+    from rich.table import Table
+
+    from ._helpers import get_plugin_registry, print_json
+
     registry = get_plugin_registry()
     benchmarks = registry.get_all_benchmarks()
 
     if fmt == "json":
-        console.print(json.dumps(benchmarks, indent=2))
+        print_json(console, benchmarks)
         return
 
     table = Table(title="Available Benchmarks")
@@ -215,6 +214,11 @@ def list_benchmarks(ctx, fmt):
 @click.pass_context
 def list_plugins(ctx):
     """List installed evaluation plugins."""
+
+    from rich.table import Table
+
+    from ._helpers import get_plugin_registry
+
     registry = get_plugin_registry()
     plugins = registry.get_all_plugins()
 
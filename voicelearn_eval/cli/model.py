@@ -1,22 +1,73 @@
 """voicelearn-eval model: Model registry management."""
 
+import asyncio
+import functools
 import re
 
 import click
-from rich.console import Console
 
-from ._helpers import get_initialized_storage, run_sync
+from ._console import console
 
-console = Console()
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Seconds to wait on the Hub before giving up on an import
+_HF_TIMEOUT = 10.0
 
 
 def _slugify(name: str) -> str:
     """Convert name to a URL-friendly slug."""
     slug = name.lower().strip()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    slug = _SLUG_RE.sub("-", slug)
     return slug.strip("-")
 
 
+@functools.lru_cache(maxsize=256)
+def _fetch_hf_model_info(repo_id: str):
+    """Fetch Hub metadata for a repo, memoized for the life of the process."""
+    from huggingface_hub import HfApi
+
+    return HfApi().model_info(repo_id, timeout=_HF_TIMEOUT)
+
+
+def _hf_model_data(model_info, repo_id: str, model_type: str, deployment_target: str) -> dict:
+    """Build a model record from Hub metadata."""
+    name = model_info.id.split("/")[-1]
+    model_data = {
+        "name": name,
+        "slug": _slugify(name),
+        "model_type": model_type,
+        "source_type": "huggingface",
+        "source_uri": repo_id,
+        "deployment_target": deployment_target,
+        "model_family": repo_id.split("/")[0] if "/" in repo_id else None,
+        "tags": list(model_info.tags) if model_info.tags else [],
+        "languages": (
+            list(model_info.languages)
+            if hasattr(model_info, "languages") and model_info.languages
+            else []
+        ),
+    }
+
+    # Try to extract parameter count
+    if hasattr(model_info, "safetensors") and model_info.safetensors:
+        params = model_info.safetensors.get("total", 0)
+        if params:
+            model_data["parameter_count_b"] = round(params / 1e9, 2)
+    return model_data
+
+
+# Listing fields _hf_model_data reads; model_info returns them by default,
+# but list_models only with expand (which excludes full and cardData)
+_HF_LISTING_EXPAND = ["safetensors", "tags"]
+
+
+def _list_hf_author_models(author: str, search: str | None, limit: int) -> list:
+    """List an author's Hub repos, with the metadata a record needs, in one request."""
+    from huggingface_hub import HfApi
+
+    return list(HfApi().list_models(author=author, search=search, limit=limit, expand=_HF_LISTING_EXPAND))
+
+
 @click.group("model")
 @click.pass_context
 def model_cmd(ctx):
@@ -46,11 +97,10 @@ def add_model(ctx, name, model_type, source_type, uri, deployment_target, family
               context_window, reference):
     """Register a new model for evaluation."""
 
+    from ._helpers import forget_models, run_sync, storage_session
+
     async def _add():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             slug = _slugify(name)
 
             # Check for duplicate
@@ -76,13 +126,11 @@ def add_model(ctx, name, model_type, source_type, uri, deployment_target, family
             }
 
             model_id = await storage.create_model(model_data)
+            forget_models(ctx)
             console.print(f"[green]Model registered:[/green] {name}")
             console.print(f"  ID:   {model_id}")
             console.print(f"  Slug: {slug}")
 
-        finally:
-            await storage.close()
-
     run_sync(_add())
 
 
@@ -97,43 +145,19 @@ def add_model(ctx, name, model_type, source_type, uri, deployment_target, family
 def import_hf(ctx, repo_id, model_type, deployment_target):
     """Import a model from HuggingFace Hub."""
 
+    from ._helpers import forget_models, run_sync, storage_session
+
     async def _import():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             try:
-                from huggingface_hub import HfApi
-
-                api = HfApi()
-                model_info = api.model_info(repo_id)
-
-                name = model_info.modelId.split("/")[-1]
-                slug = _slugify(name)
-
-                model_data = {
-                    "name": name,
-                    "slug": slug,
-                    "model_type": model_type,
-                    "source_type": "huggingface",
-                    "source_uri": repo_id,
-                    "deployment_target": deployment_target,
-                    "model_family": repo_id.split("/")[0] if "/" in repo_id else None,
-                    "tags": list(model_info.tags) if model_info.tags else [],
-                    "languages": (
-                        list(model_info.languages)
-                        if hasattr(model_info, "languages") and model_info.languages
-                        else []
-                    ),
-                }
-
-                # Try to extract parameter count
-                if hasattr(model_info, "safetensors") and model_info.safetensors:
-                    params = model_info.safetensors.get("total", 0)
-                    if params:
-                        model_data["parameter_count_b"] = round(params / 1e9, 2)
+                # Blocking HTTP call; keep it off the event loop
+                model_info = await asyncio.to_thread(_fetch_hf_model_info, repo_id)
+
+                model_data = _hf_model_data(model_info, repo_id, model_type, deployment_target)
+                name = model_data["name"]
 
                 model_id = await storage.create_model(model_data)
+                forget_models(ctx)
                 console.print(f"[green]Imported from HuggingFace:[/green] {repo_id}")
                 console.print(f"  ID:   {model_id}")
                 console.print(f"  Name: {name}")
@@ -142,8 +166,53 @@ def import_hf(ctx, repo_id, model_type, deployment_target):
                 console.print("[red]huggingface-hub not installed. Run: pip install huggingface-hub[/red]")
                 raise SystemExit(1)
 
-        finally:
-            await storage.close()
+    run_sync(_import())
+
+
+@model_cmd.command("import-hf-org")
+@click.option("--author", required=True, help="HuggingFace user or organization")
+@click.option("--type", "model_type", required=True, type=click.Choice(["llm", "stt", "tts"]))
+@click.option(
+    "--target", "deployment_target", default="server",
+    type=click.Choice(["on-device", "server", "cloud-api"]),
+)
+@click.option("--search", help="Only repos whose name contains this text")
+@click.option("--limit", default=100, type=int, help="Maximum repos to import")
+@click.pass_context
+def import_hf_org(ctx, author, model_type, deployment_target, search, limit):
+    """Import all of an author's models from HuggingFace Hub.
+
+    Metadata for every repo comes from a single listing request rather
+    than one request per repo.
+    """
+
+    from ._helpers import forget_models, run_sync, storage_session
+
+    async def _import():
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
+            try:
+                listing = await asyncio.to_thread(_list_hf_author_models, author, search, limit)
+            except ImportError:
+                console.print("[red]huggingface-hub not installed. Run: pip install huggingface-hub[/red]")
+                raise SystemExit(1)
+
+            # One query for all collision checks; includes removed models,
+            # whose slugs are still taken
+            slugs = await storage.list_model_slugs()
+            imported = skipped = 0
+            for model_info in listing:
+                model_data = _hf_model_data(model_info, model_info.id, model_type, deployment_target)
+                if model_data["slug"] in slugs:
+                    skipped += 1
+                    continue
+                slugs.add(model_data["slug"])
+                await storage.create_model(model_data)
+                imported += 1
+                console.print(f"[green]Imported:[/green] {model_info.id}")
+
+            if imported:
+                forget_models(ctx)
+            console.print(f"\n{imported} imported, {skipped} skipped (already registered)")
 
     run_sync(_import())
 
@@ -155,14 +224,11 @@ def import_hf(ctx, repo_id, model_type, deployment_target):
 def remove_model(ctx, model_id, force):
     """Remove a model from the registry (soft delete)."""
 
+    from ._helpers import forget_models, resolve_model, run_sync, storage_session
+
     async def _remove():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
-            model = await storage.get_model(model_id)
-            if not model:
-                model = await storage.get_model_by_slug(model_id)
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
+            model = await resolve_model(ctx, storage, model_id)
             if not model:
                 console.print(f"[red]Model not found: {model_id}[/red]")
                 raise SystemExit(4)
@@ -172,11 +238,9 @@ def remove_model(ctx, model_id, force):
                     return
 
             await storage.delete_model(model["id"])
+            forget_models(ctx)
             console.print(f"[green]Removed:[/green] {model['name']}")
 
-        finally:
-            await storage.close()
-
     run_sync(_remove())
 
 
@@ -186,14 +250,11 @@ def remove_model(ctx, model_id, force):
 def model_info(ctx, model_id):
     """Show detailed model information."""
 
+    from ._helpers import resolve_model, run_sync, storage_session
+
     async def _info():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
-            model = await storage.get_model(model_id)
-            if not model:
-                model = await storage.get_model_by_slug(model_id)
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
+            model = await resolve_model(ctx, storage, model_id)
             if not model:
                 console.print(f"[red]Model not found: {model_id}[/red]")
                 raise SystemExit(4)
@@ -213,7 +274,4 @@ def model_info(ctx, model_id):
             console.print(f"  Reference:  {'Yes' if model.get('is_reference') else 'No'}")
             console.print(f"  Created:    {model.get('created_at', '-')}")
 
-        finally:
-            await storage.close()
-
     run_sync(_info())
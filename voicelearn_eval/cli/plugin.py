@@ -1,9 +1,8 @@
 """voicelearn-eval plugin: Plugin management."""
 
 import click
-from rich.console import Console
 
-console = Console()
+from ._console import console
 
 
 @click.group("plugin")
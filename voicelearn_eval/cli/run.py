@@ -1,11 +1,14 @@
 """voicelearn-eval run: Execute evaluations."""
 
+import asyncio
+
 import click
-from rich.console import Console
 
-from ._helpers import get_orchestrator, run_sync
+from ._console import console
+
 
-console = Console()
+async def _none():
+    return None
 
 
 @click.command("run")
@@ -23,31 +26,28 @@ console = Console()
 @click.pass_context
 def run_cmd(ctx, model, suite_slug, benchmark, gpu, batch_size, output, output_format, ci, timeout, quiet, priority):
     """Run an evaluation on a model."""
+
+    from ._helpers import orchestrator_session, resolve_model, run_sync
+
     if not suite_slug and not benchmark:
         console.print("[red]Error: Specify --suite or --benchmark[/red]")
         raise SystemExit(3)
 
     async def _run():
-        orchestrator, storage, config = await get_orchestrator(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-
-        try:
-            # Resolve model: try ID first, then slug
-            model_data = await storage.get_model(model)
-            if not model_data:
-                model_data = await storage.get_model_by_slug(model)
+        async with orchestrator_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (
+            orchestrator, storage, config
+        ):
+            # Resolve model (ID first, then slug) and suite together
+            model_data, suite = await asyncio.gather(
+                resolve_model(ctx, storage, model),
+                storage.get_suite_by_slug(suite_slug) if suite_slug else _none(),
+            )
             if not model_data:
                 console.print(f"[red]Error: Model not found: {model}[/red]")
                 raise SystemExit(4)
-
-            # Resolve suite
-            suite = None
-            if suite_slug:
-                suite = await storage.get_suite_by_slug(suite_slug)
-                if not suite:
-                    console.print(f"[red]Error: Suite not found: {suite_slug}[/red]")
-                    raise SystemExit(3)
+            if suite_slug and not suite:
+                console.print(f"[red]Error: Suite not found: {suite_slug}[/red]")
+                raise SystemExit(3)
 
             if not suite:
                 console.print("[red]Error: No suite specified[/red]")
@@ -74,8 +74,7 @@ def run_cmd(ctx, model, suite_slug, benchmark, gpu, batch_size, output, output_f
             )
 
             # Get results
-            run_data = await storage.get_run(run_id)
-            results = await storage.get_results_for_run(run_id)
+            run_data, results = await asyncio.gather(storage.get_run(run_id), storage.get_results_for_run(run_id))
 
             if not quiet:
                 console.print("\n[green]Evaluation complete![/green]")
@@ -100,7 +99,4 @@ def run_cmd(ctx, model, suite_slug, benchmark, gpu, batch_size, output, output_f
                         console.print(f"\n[red]CI FAIL: Score {score:.1f} < threshold {config.ci_min_score}[/red]")
                     raise SystemExit(1)
 
-        finally:
-            await storage.close()
-
     run_sync(_run())
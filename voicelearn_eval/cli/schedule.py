@@ -1,9 +1,8 @@
 """voicelearn-eval schedule: Recurring evaluations."""
 
 import click
-from rich.console import Console
 
-console = Console()
+from ._console import console
 
 
 @click.group("schedule")
@@ -17,13 +16,10 @@ def schedule_cmd(ctx):
 @click.pass_context
 def schedule_list(ctx):
     """List all schedules."""
-    from ._helpers import get_initialized_storage, run_sync
+    from ._helpers import run_sync, storage_session
 
     async def _list():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             schedules = await storage.list_schedules()
             if not schedules:
                 console.print("[dim]No schedules configured.[/dim]")
@@ -47,9 +43,6 @@ def schedule_list(ctx):
                 )
             console.print(table)
 
-        finally:
-            await storage.close()
-
     run_sync(_list())
 
 
@@ -61,13 +54,10 @@ def schedule_list(ctx):
 @click.pass_context
 def schedule_create(ctx, name, suite, cron, model_id):
     """Create a recurring evaluation schedule."""
-    from ._helpers import get_initialized_storage, run_sync
+    from ._helpers import run_sync, storage_session
 
     async def _create():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             suite_data = await storage.get_suite_by_slug(suite)
             if not suite_data:
                 console.print(f"[red]Suite not found: {suite}[/red]")
@@ -82,7 +72,4 @@ def schedule_create(ctx, name, suite, cron, model_id):
             })
             console.print(f"[green]Schedule created:[/green] {name} (ID: {schedule_id[:8]})")
 
-        finally:
-            await storage.close()
-
     run_sync(_create())
@@ -1,9 +1,8 @@
 """voicelearn-eval serve: Start API + web dashboard."""
 
 import click
-from rich.console import Console
 
-console = Console()
+from ._console import console
 
 
 @click.command("serve")
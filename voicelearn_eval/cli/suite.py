@@ -1,9 +1,8 @@
 """voicelearn-eval suite: Benchmark suite management."""
 
 import click
-from rich.console import Console
 
-console = Console()
+from ._console import console
 
 
 @click.group("suite")
@@ -26,13 +25,10 @@ def suite_list(ctx):
 @click.pass_context
 def suite_info(ctx, suite_slug):
     """Show suite details and tasks."""
-    from ._helpers import get_initialized_storage, run_sync
+    from ._helpers import run_sync, storage_session
 
     async def _info():
-        storage, _ = await get_initialized_storage(
-            ctx.obj.get("config_path"), ctx.obj.get("db_path")
-        )
-        try:
+        async with storage_session(ctx.obj.get("config_path"), ctx.obj.get("db_path")) as (storage, _):
             suite = await storage.get_suite_by_slug(suite_slug)
             if not suite:
                 console.print(f"[red]Suite not found: {suite_slug}[/red]")
@@ -65,7 +61,4 @@ def suite_info(ctx, suite_slug):
                     )
                 console.print(table)
 
-        finally:
-            await storage.close()
-
     run_sync(_info())
@@ -1,14 +1,27 @@
 """Configuration loading and management."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 DEFAULT_DATA_DIR = Path.home() / ".voicelearn-eval"
 DEFAULT_DB_PATH = DEFAULT_DATA_DIR / "data.db"
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int) -> dict:
+    """Parse a config file once per modification time. Treat the result as read-only."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 @dataclass
 class AppConfig:
     """Application configuration."""
@@ -28,8 +41,7 @@ class AppConfig:
 
     @classmethod
     def from_yaml(cls, path: Path) -> "AppConfig":
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _parse_yaml(str(path), path.stat().st_mtime_ns)
         config = cls()
         for key, value in data.items():
             if hasattr(config, key):
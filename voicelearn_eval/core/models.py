@@ -1,10 +1,18 @@
 """Core data models for the evaluation system."""
 
+import functools
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
 
+@functools.cache
+def _field_names(cls: type) -> frozenset[str]:
+    """Dataclass field names of ``cls``, computed once per class."""
+    return frozenset(cls.__dataclass_fields__)
+
+
 class ModelCategory(str, Enum):
     LLM = "llm"
     STT = "stt"
@@ -35,7 +43,7 @@ class RunStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelSpec:
     """Specification of a model to evaluate."""
 
@@ -111,15 +119,14 @@ class ModelSpec:
             d["deployment_target"] = DeploymentTarget(d["deployment_target"])
         for list_field in ("education_tiers", "subjects", "languages", "tags"):
             if list_field in d and isinstance(d[list_field], str):
-                import json
                 d[list_field] = json.loads(d[list_field]) if d[list_field] else []
         # Filter to only valid fields
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         d = {k: v for k, v in d.items() if k in valid_fields}
         return cls(**d)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkTask:
     """A single evaluation task within a suite."""
 
@@ -151,17 +158,15 @@ class BenchmarkTask:
 
     @classmethod
     def from_dict(cls, data: dict) -> "BenchmarkTask":
-        import json
-
         d = dict(data)
         if "config" in d and isinstance(d["config"], str):
             d["config"] = json.loads(d["config"]) if d["config"] else {}
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         d = {k: v for k, v in d.items() if k in valid_fields}
         return cls(**d)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkSuite:
     """Collection of evaluation tasks."""
 
@@ -197,15 +202,13 @@ class BenchmarkSuite:
 
     @classmethod
     def from_dict(cls, data: dict) -> "BenchmarkSuite":
-        import json
-
         d = dict(data)
         for json_field in ("config", "default_params"):
             if json_field in d and isinstance(d[json_field], str):
                 d[json_field] = json.loads(d[json_field]) if d[json_field] else {}
         # Handle tasks separately
         tasks_data = d.pop("tasks", [])
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         d = {k: v for k, v in d.items() if k in valid_fields}
         suite = cls(**d)
         if tasks_data and isinstance(tasks_data[0], dict):
@@ -213,7 +216,7 @@ class BenchmarkSuite:
         return suite
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalTaskResult:
     """Result from a single benchmark task."""
 
@@ -261,17 +264,15 @@ class EvalTaskResult:
 
     @classmethod
     def from_dict(cls, data: dict) -> "EvalTaskResult":
-        import json
-
         d = dict(data)
         if "metrics" in d and isinstance(d["metrics"], str):
             d["metrics"] = json.loads(d["metrics"]) if d["metrics"] else {}
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         d = {k: v for k, v in d.items() if k in valid_fields}
         return cls(**d)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalRun:
     """A complete evaluation run."""
 
@@ -328,8 +329,6 @@ class EvalRun:
 
     @classmethod
     def from_dict(cls, data: dict) -> "EvalRun":
-        import json
-
         d = dict(data)
         if "status" in d and isinstance(d["status"], str):
             d["status"] = RunStatus(d["status"])
@@ -337,7 +336,7 @@ class EvalRun:
             if json_field in d and isinstance(d[json_field], str):
                 d[json_field] = json.loads(d[json_field]) if d[json_field] else None
         results_data = d.pop("results", [])
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         d = {k: v for k, v in d.items() if k in valid_fields}
         run = cls(**d)
         if results_data and isinstance(results_data[0], dict):
@@ -345,7 +344,7 @@ class EvalRun:
         return run
 
 
-@dataclass
+@dataclass(slots=True)
 class GradeLevelRating:
     """Grade-level capability assessment for a model."""
 
@@ -371,12 +370,12 @@ class GradeLevelRating:
     @classmethod
     def from_dict(cls, data: dict) -> "GradeLevelRating":
         d = dict(data)
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         d = {k: v for k, v in d.items() if k in valid_fields}
         return cls(**d)
 
 
-@dataclass
+@dataclass(slots=True)
 class VLEFExport:
     """Voice Learning Eval Format: portable evaluation results."""
 
@@ -403,6 +402,6 @@ class VLEFExport:
 
     @classmethod
     def from_dict(cls, data: dict) -> "VLEFExport":
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = _field_names(cls)
         d = {k: v for k, v in data.items() if k in valid_fields}
         return cls(**d)
@@ -1,10 +1,15 @@
 """Pydantic schemas for API request/response validation."""
 
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class ModelCreate(BaseModel):
+class _RequestBody(BaseModel):
+    # Reject unknown fields before any storage work, and keep bodies read-only
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class ModelCreate(_RequestBody):
     name: str
     model_type: str  # llm, stt, tts, vad, embeddings
     source_type: str  # huggingface, local, api, ollama
@@ -27,7 +32,7 @@ class ModelCreate(BaseModel):
     is_reference: bool = False
 
 
-class ModelUpdate(BaseModel):
+class ModelUpdate(_RequestBody):
     name: str | None = None
     deployment_target: str | None = None
     model_family: str | None = None
@@ -44,13 +49,13 @@ class ModelUpdate(BaseModel):
     is_reference: bool | None = None
 
 
-class HuggingFaceImport(BaseModel):
+class HuggingFaceImport(_RequestBody):
     repo_id: str
     model_type: str
     deployment_target: str = "server"
 
 
-class RunCreate(BaseModel):
+class RunCreate(_RequestBody):
     model_id: str
     suite_id: str
     config: dict | None = None
@@ -58,7 +63,7 @@ class RunCreate(BaseModel):
     triggered_by: str = "manual"
 
 
-class SuiteCreate(BaseModel):
+class SuiteCreate(_RequestBody):
     name: str
     model_type: str
     description: str | None = None
@@ -67,7 +72,7 @@ class SuiteCreate(BaseModel):
     default_params: dict | None = None
 
 
-class SuiteUpdate(BaseModel):
+class SuiteUpdate(_RequestBody):
     name: str | None = None
     description: str | None = None
     config: dict | None = None
@@ -75,7 +80,7 @@ class SuiteUpdate(BaseModel):
     is_active: bool | None = None
 
 
-class BaselineCreate(BaseModel):
+class BaselineCreate(_RequestBody):
     name: str
     description: str | None = None
     model_id: str
@@ -83,13 +88,13 @@ class BaselineCreate(BaseModel):
     suite_id: str
 
 
-class ShareCreate(BaseModel):
+class ShareCreate(_RequestBody):
     report_type: str  # run, comparison, model_card
     report_config: dict
     expires_in_days: int | None = 30
 
 
-class CustomTestSetCreate(BaseModel):
+class CustomTestSetCreate(_RequestBody):
     name: str
     description: str | None = None
     model_type: str
@@ -97,7 +102,7 @@ class CustomTestSetCreate(BaseModel):
     tags: list[str] = Field(default_factory=list)
 
 
-class ExportRequest(BaseModel):
+class ExportRequest(_RequestBody):
     run_ids: list[str] | None = None
     model_id: str | None = None
     format: str = "vlef"  # vlef, json, csv
@@ -1,10 +1,16 @@
 """Grade-level scoring: tier scores, pass/fail, and overall education score."""
 
+import functools
+import json
 
 from voicelearn_eval.core.models import GradeLevelRating
 
 from .tiers import DEFAULT_THRESHOLD, TIER_ORDER, TIER_WEIGHTS
 
+# Tier keys (enum values) in order, with their overall-score weights.
+_TIER_KEYS = tuple(tier.value for tier in TIER_ORDER)
+_WEIGHTED_TIER_KEYS = tuple((tier.value, TIER_WEIGHTS.get(tier, 1.0)) for tier in TIER_ORDER)
+
 
 def calculate_tier_score(
     task_results: list[dict], tier: str
@@ -14,33 +20,25 @@ def calculate_tier_score(
     Returns (score, task_breakdown) where score is 0-100 and
     task_breakdown is a list of {task_name, score, weight} dicts.
     """
-    tier_tasks = [
-        r for r in task_results
-        if r.get("education_tier") == tier and r.get("score") is not None
-    ]
-
-    if not tier_tasks:
-        return 0.0, []
-
-    total_weight = sum(t.get("weight", 1.0) for t in tier_tasks)
-    if total_weight == 0:
-        return 0.0, []
-
-    weighted_sum = sum(
-        t["score"] * t.get("weight", 1.0) for t in tier_tasks
-    )
-    score = weighted_sum / total_weight
-
-    breakdown = [
-        {
+    total_weight = 0.0
+    weighted_sum = 0.0
+    breakdown = []
+    for t in task_results:
+        if t.get("education_tier") != tier or t.get("score") is None:
+            continue
+        weight = t.get("weight", 1.0)
+        total_weight += weight
+        weighted_sum += t["score"] * weight
+        breakdown.append({
             "task_name": t.get("task_name", t.get("name", "Unknown")),
             "score": t["score"],
-            "weight": t.get("weight", 1.0),
-        }
-        for t in tier_tasks
-    ]
+            "weight": weight,
+        })
+
+    if not breakdown or total_weight == 0:
+        return 0.0, []
 
-    return score, breakdown
+    return weighted_sum / total_weight, breakdown
 
 
 def assess_tier(score: float, threshold: float = DEFAULT_THRESHOLD) -> bool:
@@ -57,12 +55,11 @@ def get_max_passing_tier(
     Sequential: model must pass all lower tiers to earn a higher tier.
     """
     max_tier = None
-    for tier in TIER_ORDER:
-        tier_key = tier.value
-        if tier_key in tier_scores and assess_tier(tier_scores[tier_key], threshold):
-            max_tier = tier_key
-        else:
+    for tier_key in _TIER_KEYS:
+        score = tier_scores.get(tier_key)
+        if score is None or score < threshold:
             break  # Must pass sequentially
+        max_tier = tier_key
     return max_tier
 
 
@@ -75,11 +72,10 @@ def calculate_overall_education_score(tier_scores: dict[str, float]) -> float:
     total_weight = 0.0
     weighted_sum = 0.0
 
-    for tier in TIER_ORDER:
-        tier_key = tier.value
-        if tier_key in tier_scores:
-            weight = TIER_WEIGHTS.get(tier, 1.0)
-            weighted_sum += tier_scores[tier_key] * weight
+    for tier_key, weight in _WEIGHTED_TIER_KEYS:
+        score = tier_scores.get(tier_key)
+        if score is not None:
+            weighted_sum += score * weight
             total_weight += weight
 
     if total_weight == 0:
@@ -108,8 +104,7 @@ def compute_grade_level_rating(
     tier_scores = {}
     tier_details = {}
 
-    for tier in TIER_ORDER:
-        tier_key = tier.value
+    for tier_key in _TIER_KEYS:
         score, breakdown = calculate_tier_score(task_results, tier_key)
         if breakdown:  # Only include tiers that had tasks
             tier_scores[tier_key] = score
@@ -127,3 +122,25 @@ def compute_grade_level_rating(
         threshold=threshold,
         overall_education_score=overall,
     )
+
+
+def stored_grade_level(run: dict) -> dict | None:
+    """Return the grade-level rating saved in a run's ``overall_metrics``, if any.
+
+    Storage hands ``overall_metrics`` back as JSON text; decoded values are
+    cached by that text, so unchanged runs are parsed once. Treat the
+    returned dict as read-only.
+    """
+    metrics = run.get("overall_metrics")
+    if isinstance(metrics, str):
+        return _grade_level_from_json(metrics)
+    return metrics.get("grade_level") if metrics else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _grade_level_from_json(raw: str) -> dict | None:
+    try:
+        metrics = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return metrics.get("grade_level") if isinstance(metrics, dict) else None
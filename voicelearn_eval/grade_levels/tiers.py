@@ -2,12 +2,12 @@
 
 from voicelearn_eval.core.models import EducationTier
 
-TIER_ORDER = [
+TIER_ORDER = (
     EducationTier.ELEMENTARY,
     EducationTier.HIGH_SCHOOL,
     EducationTier.UNDERGRADUATE,
     EducationTier.GRADUATE,
-]
+)
 
 TIER_LABELS = {
     EducationTier.ELEMENTARY: "Elementary (Gr 5-8)",
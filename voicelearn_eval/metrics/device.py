@@ -6,10 +6,12 @@ to assess model suitability for different deployment targets.
 
 from __future__ import annotations
 
+import array
+import functools
 import os
 import platform
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 
@@ -85,7 +87,16 @@ class DeviceMetrics:
 
 
 def get_platform_info() -> dict:
-    """Collect static system information."""
+    """Collect static system information.
+
+    The probe runs once per process; each call returns a fresh copy so callers
+    may mutate or serialize it freely.
+    """
+    return dict(_platform_info())
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> dict:
     info: dict = {
         "system": platform.system(),
         "machine": platform.machine(),
@@ -120,20 +131,32 @@ def get_platform_info() -> dict:
     return info
 
 
-def _take_snapshot() -> DeviceSnapshot:
-    """Take a single resource snapshot."""
-    snap = DeviceSnapshot(timestamp=time.monotonic())
-
+def _current_process():
+    """Return a psutil handle for this process, or None if psutil is missing."""
     try:
         import psutil
 
-        proc = psutil.Process()
-        snap.cpu_percent = proc.cpu_percent(interval=None)
-        mem_info = proc.memory_info()
-        snap.memory_rss_mb = round(mem_info.rss / (1024**2), 2)
-        snap.memory_percent = proc.memory_percent()
+        return psutil.Process()
     except ImportError:
-        pass
+        return None
+
+
+def _take_snapshot(proc=None) -> DeviceSnapshot:
+    """Take a single resource snapshot.
+
+    Pass the same psutil ``proc`` across calls: ``cpu_percent(interval=None)``
+    reports usage since the previous call on that object.
+    """
+    snap = DeviceSnapshot(timestamp=time.monotonic())
+
+    if proc is None:
+        proc = _current_process()
+    if proc is not None:
+        with proc.oneshot():
+            snap.cpu_percent = proc.cpu_percent(interval=None)
+            mem_info = proc.memory_info()
+            snap.memory_rss_mb = round(mem_info.rss / (1024**2), 2)
+            snap.memory_percent = proc.memory_percent()
 
     try:
         import torch
@@ -158,11 +181,10 @@ def _take_snapshot() -> DeviceSnapshot:
     return snap
 
 
-def _percentile(values: list[float], p: float) -> float:
-    """Calculate the p-th percentile of a list."""
-    if not values:
+def _percentile(sorted_vals: Sequence[float], p: float) -> float:
+    """Calculate the p-th percentile of an already sorted sequence."""
+    if not sorted_vals:
         return 0.0
-    sorted_vals = sorted(values)
     idx = (p / 100.0) * (len(sorted_vals) - 1)
     lower = int(idx)
     upper = min(lower + 1, len(sorted_vals) - 1)
@@ -174,7 +196,7 @@ def aggregate_snapshots(
     snapshots: list[DeviceSnapshot],
     wall_time: float,
     samples: int,
-    latencies_ms: list[float] | None = None,
+    latencies_ms: Sequence[float] | None = None,
 ) -> DeviceMetrics:
     """Aggregate a list of snapshots into summary metrics."""
     metrics = DeviceMetrics(
@@ -217,9 +239,10 @@ def aggregate_snapshots(
 
     if latencies_ms:
         metrics.latency_mean_ms = round(sum(latencies_ms) / len(latencies_ms), 2)
-        metrics.latency_p50_ms = round(_percentile(latencies_ms, 50), 2)
-        metrics.latency_p95_ms = round(_percentile(latencies_ms, 95), 2)
-        metrics.latency_p99_ms = round(_percentile(latencies_ms, 99), 2)
+        ordered = sorted(latencies_ms)
+        metrics.latency_p50_ms = round(_percentile(ordered, 50), 2)
+        metrics.latency_p95_ms = round(_percentile(ordered, 95), 2)
+        metrics.latency_p99_ms = round(_percentile(ordered, 99), 2)
 
     return metrics
 
@@ -240,51 +263,49 @@ class MetricsCollector:
     def __init__(self, interval: float = 1.0):
         self._interval = interval
         self._snapshots: list[DeviceSnapshot] = []
-        self._latencies: list[float] = []
+        self._latencies = array.array("d")  # unboxed doubles, ms
         self._samples = 0
         self._start: float = 0
         self._end: float = 0
         self._last_snap: float = 0
+        self._proc = None
 
     @contextmanager
     def session(self) -> Generator[None, None, None]:
         """Context manager for the overall collection session."""
         self._snapshots = []
-        self._latencies = []
+        self._latencies = array.array("d")
         self._samples = 0
         self._start = time.monotonic()
         self._last_snap = self._start
 
-        # Initial snapshot
-        try:
-            import psutil  # noqa: F401
-
-            psutil.Process().cpu_percent(interval=None)  # prime CPU measurement
-        except ImportError:
-            pass
-        self._snapshots.append(_take_snapshot())
+        # Initial snapshot; one cached process handle keeps cpu_percent deltas valid
+        self._proc = _current_process()
+        if self._proc is not None:
+            self._proc.cpu_percent(interval=None)  # prime CPU measurement
+        self._snapshots.append(_take_snapshot(self._proc))
 
         try:
             yield
         finally:
-            self._snapshots.append(_take_snapshot())
+            self._snapshots.append(_take_snapshot(self._proc))
             self._end = time.monotonic()
 
     @contextmanager
     def measure_sample(self) -> Generator[None, None, None]:
         """Time a single sample / inference call."""
-        t0 = time.monotonic()
+        t0 = time.perf_counter_ns()
         try:
             yield
         finally:
-            t1 = time.monotonic()
-            self._latencies.append((t1 - t0) * 1000)  # ms
+            self._latencies.append((time.perf_counter_ns() - t0) / 1e6)  # ms
             self._samples += 1
 
             # Periodic resource snapshot
-            if t1 - self._last_snap >= self._interval:
-                self._snapshots.append(_take_snapshot())
-                self._last_snap = t1
+            now = time.monotonic()
+            if now - self._last_snap >= self._interval:
+                self._snapshots.append(_take_snapshot(self._proc))
+                self._last_snap = now
 
     def results(self) -> DeviceMetrics:
         """Aggregate collected data into DeviceMetrics."""
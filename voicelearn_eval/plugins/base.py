@@ -1,6 +1,7 @@
 """Plugin system: hook specs, base class, and registry."""
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -145,6 +146,11 @@ class BaseEvalPlugin(ABC):
         return result
 
 
+def _type_key(plugin_type: EvalPluginType | str) -> str:
+    # Enum members hash by name, so index by the plain string value
+    return plugin_type.value if isinstance(plugin_type, Enum) else plugin_type
+
+
 class PluginRegistry:
     """Discovers and manages evaluation plugins."""
 
@@ -152,6 +158,10 @@ class PluginRegistry:
         self._manager = pluggy.PluginManager(PROJECT_NAME)
         self._manager.add_hookspecs(EvalHookSpec)
         self._plugins: dict[str, BaseEvalPlugin] = {}
+        # Lookup indexes, built lazily and reset whenever a plugin is registered
+        self._benchmarks: list[dict] | None = None
+        self._by_benchmark: dict[str, BaseEvalPlugin] = {}
+        self._by_type: dict[str, list[BaseEvalPlugin]] = {}
 
     def discover_plugins(self) -> None:
         """Discover plugins from entry points."""
@@ -168,11 +178,13 @@ class PluginRegistry:
                     self._plugins[info.plugin_id] = plugin
                 except Exception:
                     continue
+        self._benchmarks = None
 
     def register(self, plugin: BaseEvalPlugin) -> None:
         """Manually register a plugin."""
         info = plugin.get_plugin_info()
         self._plugins[info.plugin_id] = plugin
+        self._benchmarks = None
         try:
             self._manager.register(plugin)
         except ValueError:
@@ -182,14 +194,31 @@ class PluginRegistry:
         """Get a plugin by ID."""
         return self._plugins.get(plugin_id)
 
+    def _ensure_index(self) -> None:
+        """Build the benchmark and type indexes if a registration invalidated them."""
+        if self._benchmarks is not None:
+            return
+        benchmarks = []
+        by_benchmark: dict[str, BaseEvalPlugin] = {}
+        by_type: dict[str, list[BaseEvalPlugin]] = defaultdict(list)
+        for plugin in self._plugins.values():
+            if hasattr(plugin, "plugin_type"):
+                by_type[_type_key(plugin.plugin_type)].append(plugin)
+            try:
+                supported = plugin.get_supported_benchmarks()
+            except Exception:
+                continue
+            benchmarks.extend(supported)
+            for bench in supported:
+                by_benchmark.setdefault(bench.get("id"), plugin)
+        self._benchmarks = benchmarks
+        self._by_benchmark = by_benchmark
+        self._by_type = dict(by_type)
+
     def get_plugins_for_type(self, plugin_type: str) -> list[BaseEvalPlugin]:
         """Get all plugins for a model type."""
-        return [
-            p
-            for p in self._plugins.values()
-            if hasattr(p, "plugin_type")
-            and (p.plugin_type == plugin_type or p.plugin_type.value == plugin_type)
-        ]
+        self._ensure_index()
+        return list(self._by_type.get(_type_key(plugin_type), ()))
 
     def get_all_plugins(self) -> dict[str, BaseEvalPlugin]:
         """Get all registered plugins."""
@@ -197,26 +226,16 @@ class PluginRegistry:
 
     def get_all_benchmarks(self) -> list[dict]:
         """Get all benchmarks from all plugins."""
-        benchmarks = []
-        for plugin in self._plugins.values():
-            try:
-                benchmarks.extend(plugin.get_supported_benchmarks())
-            except Exception:
-                continue
-        return benchmarks
+        self._ensure_index()
+        return list(self._benchmarks)
 
     def find_plugin_for_benchmark(self, benchmark_id: str) -> BaseEvalPlugin | None:
         """Find which plugin handles a specific benchmark."""
-        for plugin in self._plugins.values():
-            try:
-                for bench in plugin.get_supported_benchmarks():
-                    if bench.get("id") == benchmark_id:
-                        return plugin
-            except Exception:
-                continue
-        return None
+        self._ensure_index()
+        return self._by_benchmark.get(benchmark_id)
 
     def find_plugin_for_model_type(self, model_type: str) -> BaseEvalPlugin | None:
         """Find the first plugin that handles a model type."""
-        plugins = self.get_plugins_for_type(model_type)
+        self._ensure_index()
+        plugins = self._by_type.get(_type_key(model_type))
         return plugins[0] if plugins else None
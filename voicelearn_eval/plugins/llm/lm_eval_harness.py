@@ -1,5 +1,6 @@
 """LLM evaluation plugin wrapping EleutherAI lm-evaluation-harness."""
 
+import importlib.util
 import logging
 from collections.abc import Callable
 
@@ -13,12 +14,9 @@ from voicelearn_eval.plugins.base import (
 
 logger = logging.getLogger(__name__)
 
-try:
-    import lm_eval
-
-    LM_EVAL_AVAILABLE = True
-except ImportError:
-    LM_EVAL_AVAILABLE = False
+# Probe without importing: lm_eval pulls in torch/transformers, which would
+# add seconds to every process start that only registers this plugin.
+LM_EVAL_AVAILABLE = importlib.util.find_spec("lm_eval") is not None
 
 
 class LMEvalHarnessPlugin(BaseEvalPlugin):
@@ -106,6 +104,8 @@ class LMEvalHarnessPlugin(BaseEvalPlugin):
         progress_callback: Callable | None = None,
     ) -> list[dict]:
         """Run actual lm-eval evaluation."""
+        import lm_eval
+
         results = []
         model_type, model_args = self._determine_model_args(model_spec)
 
@@ -5,10 +5,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_SUBSCRIBER_QUEUE_SIZE = 100
+
 
 class DownloadService:
     """Manages model weight downloads from HuggingFace Hub."""
@@ -18,6 +21,7 @@ class DownloadService:
         self.ws_manager = ws_manager
         self.cache_dir = cache_dir or Path.home() / ".cache" / "huggingface" / "hub"
         self._active: dict[str, threading.Event] = {}  # model_id -> cancel_event
+        self._subscribers: set[asyncio.Queue] = set()
 
     async def reset_stale_downloads(self) -> None:
         """Reset any 'downloading' states left from a previous crash."""
@@ -126,14 +130,39 @@ class DownloadService:
             "is_active": model_id in self._active,
         }
 
+    async def subscribe(self, idle_timeout: float | None = None) -> AsyncIterator[dict | None]:
+        """Yield download progress events as they are broadcast.
+
+        With ``idle_timeout``, yields ``None`` whenever that many seconds pass
+        without an event, so callers can send keepalives. Each subscriber gets
+        its own bounded queue; events for a subscriber that falls too far
+        behind are dropped rather than stalling downloads.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), idle_timeout)
+                except TimeoutError:
+                    yield None
+        finally:
+            self._subscribers.discard(queue)
+
     async def _broadcast(self, model_id: str, percent: float, message: str) -> None:
-        """Broadcast download progress via WebSocket."""
+        """Broadcast download progress via WebSocket and to stream subscribers."""
+        event = {
+            "type": "download_progress",
+            "model_id": model_id,
+            "percent": percent,
+            "message": message,
+        }
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.debug("Dropping download event for a slow subscriber")
         try:
-            await self.ws_manager.broadcast({
-                "type": "download_progress",
-                "model_id": model_id,
-                "percent": percent,
-                "message": message,
-            })
+            await self.ws_manager.broadcast(event)
         except Exception:
             pass  # Don't fail download if broadcast fails
@@ -28,11 +28,27 @@ class BaseStorage(ABC):
     async def get_model_by_slug(self, slug: str) -> dict | None:
         """Get a model by slug."""
 
+    @abstractmethod
+    async def get_model_by_id_or_slug(self, key: str) -> dict | None:
+        """Get a model by ID, or by slug if no ID matches, in one query."""
+
+    @abstractmethod
+    async def list_model_slugs(self) -> set[str]:
+        """Get every slug in use, including removed models (slugs stay reserved)."""
+
+    @abstractmethod
+    async def get_models_by_ids(self, model_ids: list[str]) -> dict[str, dict]:
+        """Get active models for several IDs at once, keyed by ID (missing IDs are omitted)."""
+
     @abstractmethod
     async def list_models(
         self, filters: dict | None = None, limit: int = 20, offset: int = 0
     ) -> list[dict]:
-        """List models with optional filtering."""
+        """List models with optional filtering, newest first.
+
+        ``filters["after"]`` takes a ``(created_at, id)`` cursor and returns
+        only rows that sort after it.
+        """
 
     @abstractmethod
     async def count_models(self, filters: dict | None = None) -> int:
@@ -43,8 +59,8 @@ class BaseStorage(ABC):
         """Update model fields."""
 
     @abstractmethod
-    async def delete_model(self, model_id: str) -> None:
-        """Soft-delete a model."""
+    async def delete_model(self, model_id: str) -> bool:
+        """Soft-delete a model. Returns False if no active model had that ID."""
 
     # --- Benchmark Suites ---
 
@@ -52,6 +68,11 @@ class BaseStorage(ABC):
     async def create_suite(self, suite: dict) -> str:
         """Create a benchmark suite. Returns suite ID."""
 
+    @abstractmethod
+    async def create_suites(self, suites: list[dict]) -> list[str]:
+        """Create several suites and their nested ``tasks`` in one transaction.
+        Returns suite IDs in input order."""
+
     @abstractmethod
     async def get_suite(self, suite_id: str) -> dict | None:
         """Get a suite by ID, including its tasks."""
@@ -60,6 +81,10 @@ class BaseStorage(ABC):
     async def get_suite_by_slug(self, slug: str) -> dict | None:
         """Get a suite by slug."""
 
+    @abstractmethod
+    async def get_suites_by_ids(self, suite_ids: list[str]) -> dict[str, dict]:
+        """Get active suites (without tasks) for several IDs at once, keyed by ID."""
+
     @abstractmethod
     async def list_suites(self, filters: dict | None = None) -> list[dict]:
         """List benchmark suites."""
@@ -72,6 +97,16 @@ class BaseStorage(ABC):
     async def delete_suite(self, suite_id: str) -> None:
         """Delete a custom suite."""
 
+    @abstractmethod
+    async def update_suite_if_editable(self, suite_id: str, updates: dict) -> dict | None:
+        """Update a custom suite with one guarded statement and return it with its
+        tasks. Returns None (writing nothing) if the suite is missing or built-in."""
+
+    @abstractmethod
+    async def delete_suite_if_editable(self, suite_id: str) -> bool:
+        """Delete a custom suite with one guarded statement. Returns False if the
+        suite is missing or built-in."""
+
     # --- Benchmark Tasks ---
 
     @abstractmethod
@@ -96,7 +131,19 @@ class BaseStorage(ABC):
     async def list_runs(
         self, filters: dict | None = None, limit: int = 20, offset: int = 0
     ) -> list[dict]:
-        """List runs with optional filtering."""
+        """List runs with optional filtering.
+
+        ``filters["after"]`` takes a ``(created_at, id)`` cursor and returns
+        only rows that sort after it; it requires the default newest-first order.
+        ``filters["group_by_model"]`` selects the same rows but returns them
+        ordered by ``model_id``, then ``completed_at`` ascending.
+        """
+
+    @abstractmethod
+    async def get_latest_completed_runs(
+        self, model_ids: list[str], suite_id: str | None = None
+    ) -> dict[str, dict]:
+        """Get the newest completed run for each model, keyed by model ID."""
 
     @abstractmethod
     async def count_runs(self, filters: dict | None = None) -> int:
@@ -107,8 +154,8 @@ class BaseStorage(ABC):
         """Update run fields (status, progress, scores, etc)."""
 
     @abstractmethod
-    async def delete_run(self, run_id: str) -> None:
-        """Delete a run and its results."""
+    async def delete_run(self, run_id: str) -> bool:
+        """Delete a run and its results. Returns False if no run had that ID."""
 
     # --- Task Results ---
 
@@ -116,10 +163,18 @@ class BaseStorage(ABC):
     async def create_task_result(self, result: dict) -> str:
         """Create a task result. Returns result ID."""
 
+    @abstractmethod
+    async def create_task_results(self, results: list[dict]) -> list[str]:
+        """Create several task results in one transaction. Returns result IDs in input order."""
+
     @abstractmethod
     async def get_results_for_run(self, run_id: str) -> list[dict]:
         """Get all task results for a run."""
 
+    @abstractmethod
+    async def get_results_for_runs(self, run_ids: list[str]) -> dict[str, list[dict]]:
+        """Get task results for several runs, keyed by run ID."""
+
     # --- Baselines ---
 
     @abstractmethod
@@ -137,8 +192,8 @@ class BaseStorage(ABC):
         """Get a baseline by ID."""
 
     @abstractmethod
-    async def delete_baseline(self, baseline_id: str) -> None:
-        """Delete a baseline."""
+    async def delete_baseline(self, baseline_id: str) -> bool:
+        """Delete a baseline. Returns False if no active baseline had that ID."""
 
     # --- Queue ---
 
@@ -204,6 +259,14 @@ class BaseStorage(ABC):
     async def increment_share_views(self, token: str) -> None:
         """Increment view count for a shared report."""
 
+    @abstractmethod
+    async def fetch_and_bump_share(self, token: str, now_ts: int) -> dict | None:
+        """Count a view of an unexpired shared report and return it.
+
+        Returns None, without counting a view, if the report is missing,
+        inactive, or expired at ``now_ts``.
+        """
+
     @abstractmethod
     async def list_shared_reports(self) -> list[dict]:
         """List all shared reports."""
@@ -211,3 +274,13 @@ class BaseStorage(ABC):
     @abstractmethod
     async def delete_shared_report(self, report_id: str) -> None:
         """Delete a shared report."""
+
+    # --- Metadata ---
+
+    @abstractmethod
+    async def get_meta(self, key: str) -> str | None:
+        """Get a stored metadata value, or None if unset."""
+
+    @abstractmethod
+    async def set_meta(self, key: str, value: str) -> None:
+        """Store a metadata value, replacing any previous one."""
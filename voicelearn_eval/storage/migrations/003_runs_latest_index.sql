@@ -0,0 +1,2 @@
+-- Serve "latest completed run per model" lookups from one index
+CREATE INDEX IF NOT EXISTS idx_eval_runs_model_status_created ON eval_runs(model_id, status, created_at DESC);
@@ -0,0 +1,3 @@
+-- Match the (created_at, id) keyset used by cursor pagination
+CREATE INDEX IF NOT EXISTS idx_eval_runs_created_id ON eval_runs(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_eval_models_created_id ON eval_models(created_at DESC, id DESC);
@@ -0,0 +1,5 @@
+-- Older migration runners skipped a statement that followed a leading
+-- comment, so databases that applied 002 before the runner fix lack the
+-- download_status column; re-run 002's statements (no-ops if applied)
+ALTER TABLE eval_models ADD COLUMN download_status TEXT NOT NULL DEFAULT 'none';
+CREATE INDEX IF NOT EXISTS idx_eval_models_download_status ON eval_models(download_status);
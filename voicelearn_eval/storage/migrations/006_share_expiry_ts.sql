@@ -0,0 +1,5 @@
+-- Unix-time expiry so shared-report reads compare integers instead of parsing ISO text
+ALTER TABLE eval_shared_reports ADD COLUMN expires_at_ts INTEGER;
+UPDATE eval_shared_reports SET expires_at_ts = CAST(strftime('%s', expires_at) AS INTEGER)
+    WHERE expires_at IS NOT NULL AND expires_at_ts IS NULL;
+CREATE INDEX IF NOT EXISTS idx_eval_shared_token_expiry ON eval_shared_reports(share_token, expires_at_ts);
@@ -0,0 +1,6 @@
+-- Key/value settings the application keeps about the database itself
+CREATE TABLE IF NOT EXISTS eval_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
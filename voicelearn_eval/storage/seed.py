@@ -1,5 +1,6 @@
 """Seed built-in benchmark suites on first initialization."""
 
+import hashlib
 
 from .base import BaseStorage
 
@@ -130,21 +131,35 @@ BUILTIN_SUITES = [
 ]
 
 
+# Seeding only ever adds suites by slug, so the slug set identifies what a
+# database has already been seeded with.
+BUILTIN_SEED_VERSION = hashlib.sha256(
+    ",".join(sorted(s["slug"] for s in BUILTIN_SUITES)).encode()
+).hexdigest()[:16]
+_SEED_VERSION_KEY = "builtin_seed_version"
+
+
 async def seed_builtin_suites(storage: BaseStorage) -> None:
-    """Insert predefined benchmark suites if they don't exist."""
+    """Insert predefined benchmark suites if they don't exist.
+
+    Skipped after a single lookup when the database was already seeded with
+    the current set of built-in suites.
+    """
+    if await storage.get_meta(_SEED_VERSION_KEY) == BUILTIN_SEED_VERSION:
+        return
+
+    existing = {s["slug"] for s in await storage.list_suites()}
+    missing = []
     for suite_data in BUILTIN_SUITES:
-        existing = await storage.get_suite_by_slug(suite_data["slug"])
-        if existing:
+        if suite_data["slug"] in existing:
             continue
-
         # Copy to avoid mutating the global
-        suite_dict = dict(suite_data)
-        tasks = suite_dict.pop("tasks", [])
-        suite_id = await storage.create_suite(suite_dict)
+        tasks = [
+            {"config": {}, **task, "order_index": i}
+            for i, task in enumerate(suite_data.get("tasks", []))
+        ]
+        missing.append({**suite_data, "tasks": tasks})
 
-        for i, task in enumerate(tasks):
-            task["suite_id"] = suite_id
-            task["order_index"] = i
-            if "config" not in task:
-                task["config"] = {}
-            await storage.create_task(task)
+    if missing:
+        await storage.create_suites(missing)
+    await storage.set_meta(_SEED_VERSION_KEY, BUILTIN_SEED_VERSION)
@@ -1,14 +1,21 @@
 """SQLite storage implementation."""
 
+import functools
 import json
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import aiosqlite
 
 from .base import BaseStorage
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 
 def _generate_id() -> str:
     return str(uuid.uuid4())
@@ -21,34 +28,159 @@ def _now() -> str:
 def _json_dumps(obj) -> str | None:
     if obj is None:
         return None
+    if isinstance(obj, bytes):
+        return obj.decode()  # already encoded by the caller
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(obj)
 
 
-def _json_loads(s) -> any | None:
+def _json_loads(s) -> Any | None:
     if s is None:
         return None
     if isinstance(s, (dict, list)):
         return s
+    if orjson is not None:
+        return orjson.loads(s)
     return json.loads(s)
 
 
+def _placeholders(n: int) -> str:
+    return ", ".join("?" * n)
+
+
+@functools.lru_cache(maxsize=256)
+def _update_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build (once per table/column set) an ``UPDATE ... WHERE id = ?`` statement."""
+    set_clause = ", ".join(f"{c} = ?" for c in columns)
+    return f"UPDATE {table} SET {set_clause} WHERE id = ?"
+
+
 def _row_to_dict(row: aiosqlite.Row) -> dict:
     return dict(row)
 
 
+# WAL with synchronous=NORMAL only fsyncs at checkpoints; temp tables and a
+# 64 MB page cache stay in RAM and reads go through a 256 MB mmap window.
+_DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "temp_store": "MEMORY",
+    "cache_size": "-64000",
+    "mmap_size": "268435456",
+}
+
+
+_INSERT_SUITE = """INSERT INTO eval_benchmark_suites (id, name, slug, description, model_type,
+   config, default_params, category, is_builtin, is_active, created_by,
+   created_at, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_INSERT_TASK = """INSERT INTO eval_benchmark_tasks (id, suite_id, name, description, task_type,
+   config, weight, education_tier, subject, order_index, created_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+_INSERT_TASK_RESULT = """INSERT INTO eval_task_results (id, run_id, task_id, score, raw_score,
+   raw_metric_name, metrics, latency_ms, throughput, memory_peak_mb,
+   gpu_memory_peak_mb, sample_audio_path, sample_text, status, error_message,
+   started_at, completed_at, duration_seconds, created_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _suite_row(suite_id: str, suite: dict, now: str) -> tuple:
+    return (
+        suite_id,
+        suite["name"],
+        suite.get("slug", suite["name"].lower().replace(" ", "_")),
+        suite.get("description"),
+        suite["model_type"],
+        _json_dumps(suite.get("config", {})),
+        _json_dumps(suite.get("default_params")),
+        suite.get("category"),
+        suite.get("is_builtin", False),
+        True,
+        suite.get("created_by"),
+        now,
+        now,
+    )
+
+
+def _task_row(task_id: str, task: dict, now: str) -> tuple:
+    return (
+        task_id,
+        task["suite_id"],
+        task["name"],
+        task.get("description"),
+        task["task_type"],
+        _json_dumps(task.get("config", {})),
+        task.get("weight", 1.0),
+        task.get("education_tier"),
+        task.get("subject"),
+        task.get("order_index", 0),
+        now,
+    )
+
+
+def _task_result_row(result_id: str, result: dict, now: str) -> tuple:
+    return (
+        result_id,
+        result["run_id"],
+        result["task_id"],
+        result.get("score"),
+        result.get("raw_score"),
+        result.get("raw_metric_name"),
+        _json_dumps(result.get("metrics", {})),
+        result.get("latency_ms"),
+        result.get("throughput"),
+        result.get("memory_peak_mb"),
+        result.get("gpu_memory_peak_mb"),
+        result.get("sample_audio_path"),
+        result.get("sample_text"),
+        result.get("status", "completed"),
+        result.get("error_message"),
+        result.get("started_at"),
+        result.get("completed_at"),
+        result.get("duration_seconds"),
+        now,
+    )
+
+
+# Prepared statements kept per connection (sqlite3 defaults to 128). Filtered
+# listings and IN (...) batches produce many distinct SQL strings.
+_STATEMENT_CACHE_SIZE = 1024
+
+
 class SQLiteStorage(BaseStorage):
-    """SQLite-based storage backend."""
+    """SQLite-based storage backend.
 
-    def __init__(self, db_path: Path):
+    ``db_path`` may be a filesystem path or a ``file:`` URI (e.g.
+    ``file:name?mode=memory&cache=shared`` for an in-memory database).
+    ``pragmas`` are applied after the defaults and can override them.
+    """
+
+    def __init__(self, db_path: Path | str, pragmas: dict[str, str] | None = None):
         self.db_path = db_path
+        self.pragmas = pragmas or {}
         self._db: aiosqlite.Connection | None = None
 
+    @property
+    def _is_uri(self) -> bool:
+        return isinstance(self.db_path, str) and self.db_path.startswith("file:")
+
     async def initialize(self) -> None:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db = await aiosqlite.connect(str(self.db_path))
+        if self._db is not None:
+            return  # Already connected; keep the warm connection and page cache
+        if self._is_uri:
+            self._db = await aiosqlite.connect(self.db_path, uri=True, cached_statements=_STATEMENT_CACHE_SIZE)
+        else:
+            self.db_path = Path(self.db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = await aiosqlite.connect(str(self.db_path), cached_statements=_STATEMENT_CACHE_SIZE)
         self._db.row_factory = aiosqlite.Row
-        await self._db.execute("PRAGMA journal_mode=WAL")
-        await self._db.execute("PRAGMA foreign_keys=ON")
+        for name, value in {**_DEFAULT_PRAGMAS, **self.pragmas}.items():
+            await self._db.execute(f"PRAGMA {name}={value}")
         await self._run_migrations()
 
     async def _run_migrations(self) -> None:
@@ -89,8 +221,11 @@ class SQLiteStorage(BaseStorage):
                 continue
             sql = sql_file.read_text()
             for statement in sql.split(";"):
-                statement = statement.strip()
-                if statement and not statement.startswith("--"):
+                # Drop comment lines so a statement preceded by a comment still runs
+                statement = "\n".join(
+                    line for line in statement.splitlines() if not line.lstrip().startswith("--")
+                ).strip()
+                if statement:
                     try:
                         await self._db.execute(statement)
                     except Exception:
@@ -163,6 +298,29 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return _row_to_dict(row) if row else None
 
+    async def get_model_by_id_or_slug(self, key: str) -> dict | None:
+        cursor = await self._db.execute(
+            """SELECT * FROM eval_models WHERE (id = ? OR slug = ?) AND is_active = TRUE
+               ORDER BY id = ? DESC LIMIT 1""",
+            (key, key, key),
+        )
+        row = await cursor.fetchone()
+        return _row_to_dict(row) if row else None
+
+    async def list_model_slugs(self) -> set[str]:
+        cursor = await self._db.execute("SELECT slug FROM eval_models")
+        return {row[0] for row in await cursor.fetchall()}
+
+    async def get_models_by_ids(self, model_ids: list[str]) -> dict[str, dict]:
+        ids = list(dict.fromkeys(model_ids))
+        if not ids:
+            return {}
+        cursor = await self._db.execute(
+            f"SELECT * FROM eval_models WHERE id IN ({_placeholders(len(ids))}) AND is_active = TRUE",
+            ids,
+        )
+        return {row["id"]: _row_to_dict(row) for row in await cursor.fetchall()}
+
     async def list_models(
         self, filters: dict | None = None, limit: int = 20, offset: int = 0
     ) -> list[dict]:
@@ -184,7 +342,11 @@ class SQLiteStorage(BaseStorage):
             if "search" in filters:
                 query += " AND (name LIKE ? OR slug LIKE ?)"
                 params.extend([f"%{filters['search']}%"] * 2)
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+            if "after" in filters:
+                # Keyset cursor: (created_at, id) of the last row already seen
+                query += " AND (created_at, id) < (?, ?)"
+                params.extend(filters["after"])
+        query += " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         cursor = await self._db.execute(query, params)
         rows = await cursor.fetchall()
@@ -209,49 +371,45 @@ class SQLiteStorage(BaseStorage):
         for key in ("education_tiers", "subjects", "languages", "tags"):
             if key in updates and isinstance(updates[key], list):
                 updates[key] = _json_dumps(updates[key])
-        set_clause = ", ".join(f"{k} = ?" for k in updates)
         values = list(updates.values()) + [model_id]
-        await self._db.execute(
-            f"UPDATE eval_models SET {set_clause} WHERE id = ?", values
-        )
+        await self._db.execute(_update_sql("eval_models", tuple(updates)), values)
         await self._db.commit()
 
-    async def delete_model(self, model_id: str) -> None:
-        await self._db.execute(
-            "UPDATE eval_models SET is_active = FALSE, updated_at = ? WHERE id = ?",
+    async def delete_model(self, model_id: str) -> bool:
+        cursor = await self._db.execute(
+            "UPDATE eval_models SET is_active = FALSE, updated_at = ? WHERE id = ? AND is_active = TRUE",
             (_now(), model_id),
         )
         await self._db.commit()
+        return cursor.rowcount > 0
 
     # --- Benchmark Suites ---
 
     async def create_suite(self, suite: dict) -> str:
         suite_id = suite.get("id") or _generate_id()
-        now = _now()
-        await self._db.execute(
-            """INSERT INTO eval_benchmark_suites (id, name, slug, description, model_type,
-               config, default_params, category, is_builtin, is_active, created_by,
-               created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                suite_id,
-                suite["name"],
-                suite.get("slug", suite["name"].lower().replace(" ", "_")),
-                suite.get("description"),
-                suite["model_type"],
-                _json_dumps(suite.get("config", {})),
-                _json_dumps(suite.get("default_params")),
-                suite.get("category"),
-                suite.get("is_builtin", False),
-                True,
-                suite.get("created_by"),
-                now,
-                now,
-            ),
-        )
+        await self._db.execute(_INSERT_SUITE, _suite_row(suite_id, suite, _now()))
         await self._db.commit()
         return suite_id
 
+    async def create_suites(self, suites: list[dict]) -> list[str]:
+        now = _now()
+        suite_rows = []
+        task_rows = []
+        for suite in suites:
+            suite_id = suite.get("id") or _generate_id()
+            suite_rows.append(_suite_row(suite_id, suite, now))
+            for task in suite.get("tasks", []):
+                task = {**task, "suite_id": suite_id}
+                task_rows.append(_task_row(task.get("id") or _generate_id(), task, now))
+        try:
+            await self._db.executemany(_INSERT_SUITE, suite_rows)
+            await self._db.executemany(_INSERT_TASK, task_rows)
+        except Exception:
+            await self._db.rollback()
+            raise
+        await self._db.commit()
+        return [row[0] for row in suite_rows]
+
     async def get_suite(self, suite_id: str) -> dict | None:
         cursor = await self._db.execute(
             "SELECT * FROM eval_benchmark_suites WHERE id = ? AND is_active = TRUE",
@@ -276,6 +434,16 @@ class SQLiteStorage(BaseStorage):
         suite["tasks"] = await self.get_tasks_for_suite(suite["id"])
         return suite
 
+    async def get_suites_by_ids(self, suite_ids: list[str]) -> dict[str, dict]:
+        ids = list(dict.fromkeys(suite_ids))
+        if not ids:
+            return {}
+        cursor = await self._db.execute(
+            f"SELECT * FROM eval_benchmark_suites WHERE id IN ({_placeholders(len(ids))}) AND is_active = TRUE",
+            ids,
+        )
+        return {row["id"]: _row_to_dict(row) for row in await cursor.fetchall()}
+
     async def list_suites(self, filters: dict | None = None) -> list[dict]:
         query = "SELECT * FROM eval_benchmark_suites WHERE is_active = TRUE"
         params: list = []
@@ -309,11 +477,8 @@ class SQLiteStorage(BaseStorage):
         for key in ("config", "default_params"):
             if key in updates and isinstance(updates[key], dict):
                 updates[key] = _json_dumps(updates[key])
-        set_clause = ", ".join(f"{k} = ?" for k in updates)
         values = list(updates.values()) + [suite_id]
-        await self._db.execute(
-            f"UPDATE eval_benchmark_suites SET {set_clause} WHERE id = ?", values
-        )
+        await self._db.execute(_update_sql("eval_benchmark_suites", tuple(updates)), values)
         await self._db.commit()
 
     async def delete_suite(self, suite_id: str) -> None:
@@ -323,28 +488,38 @@ class SQLiteStorage(BaseStorage):
         )
         await self._db.commit()
 
+    async def update_suite_if_editable(self, suite_id: str, updates: dict) -> dict | None:
+        updates["updated_at"] = _now()
+        for key in ("config", "default_params"):
+            if key in updates and isinstance(updates[key], dict):
+                updates[key] = _json_dumps(updates[key])
+        set_clause = ", ".join(f"{c} = ?" for c in updates)
+        # Guarding on is_builtin makes the check part of the write. rowcount is
+        # used instead of RETURNING, which older bundled SQLite builds lack
+        cursor = await self._db.execute(
+            f"""UPDATE eval_benchmark_suites SET {set_clause}
+                WHERE id = ? AND is_builtin = FALSE AND is_active = TRUE""",
+            list(updates.values()) + [suite_id],
+        )
+        await self._db.commit()
+        if cursor.rowcount == 0:
+            return None
+        return await self.get_suite(suite_id)
+
+    async def delete_suite_if_editable(self, suite_id: str) -> bool:
+        cursor = await self._db.execute(
+            """UPDATE eval_benchmark_suites SET is_active = FALSE, updated_at = ?
+               WHERE id = ? AND is_builtin = FALSE AND is_active = TRUE""",
+            (_now(), suite_id),
+        )
+        await self._db.commit()
+        return cursor.rowcount > 0
+
     # --- Benchmark Tasks ---
 
     async def create_task(self, task: dict) -> str:
         task_id = task.get("id") or _generate_id()
-        await self._db.execute(
-            """INSERT INTO eval_benchmark_tasks (id, suite_id, name, description, task_type,
-               config, weight, education_tier, subject, order_index, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                task_id,
-                task["suite_id"],
-                task["name"],
-                task.get("description"),
-                task["task_type"],
-                _json_dumps(task.get("config", {})),
-                task.get("weight", 1.0),
-                task.get("education_tier"),
-                task.get("subject"),
-                task.get("order_index", 0),
-                _now(),
-            ),
-        )
+        await self._db.execute(_INSERT_TASK, _task_row(task_id, task, _now()))
         await self._db.commit()
         return task_id
 
@@ -409,10 +584,16 @@ class SQLiteStorage(BaseStorage):
             if "triggered_by" in filters:
                 query += " AND triggered_by = ?"
                 params.append(filters["triggered_by"])
-        sort = "created_at DESC"
+            if "after" in filters:
+                # Keyset cursor: (created_at, id) of the last row already seen
+                if filters.get("sort", "newest") != "newest":
+                    raise ValueError("Cursor pagination requires newest-first ordering")
+                query += " AND (created_at, id) < (?, ?)"
+                params.extend(filters["after"])
+        sort = "created_at DESC, id DESC"
         if filters and "sort" in filters:
             sort_map = {
-                "newest": "created_at DESC",
+                "newest": "created_at DESC, id DESC",
                 "oldest": "created_at ASC",
                 "score_high": "overall_score DESC",
                 "score_low": "overall_score ASC",
@@ -420,10 +601,38 @@ class SQLiteStorage(BaseStorage):
             sort = sort_map.get(filters["sort"], sort)
         query += f" ORDER BY {sort} LIMIT ? OFFSET ?"
         params.extend([limit, offset])
+        if filters and filters.get("group_by_model"):
+            # Same page of rows, handed back grouped per model, oldest completion first
+            query = f"SELECT * FROM ({query}) ORDER BY model_id, completed_at ASC"
         cursor = await self._db.execute(query, params)
         rows = await cursor.fetchall()
         return [_row_to_dict(r) for r in rows]
 
+    async def get_latest_completed_runs(
+        self, model_ids: list[str], suite_id: str | None = None
+    ) -> dict[str, dict]:
+        ids = list(dict.fromkeys(model_ids))
+        if not ids:
+            return {}
+        where = f"model_id IN ({_placeholders(len(ids))}) AND status = 'completed'"
+        params: list = list(ids)
+        if suite_id:
+            where += " AND suite_id = ?"
+            params.append(suite_id)
+        # Same ordering as list_runs' default, ranked per model in one scan
+        cursor = await self._db.execute(
+            f"""SELECT * FROM eval_runs WHERE id IN (
+                   SELECT id FROM (
+                       SELECT id, ROW_NUMBER() OVER (
+                           PARTITION BY model_id ORDER BY created_at DESC, id DESC
+                       ) AS rn
+                       FROM eval_runs WHERE {where}
+                   ) WHERE rn = 1
+               )""",
+            params,
+        )
+        return {row["model_id"]: _row_to_dict(row) for row in await cursor.fetchall()}
+
     async def count_runs(self, filters: dict | None = None) -> int:
         query = "SELECT COUNT(*) FROM eval_runs WHERE 1=1"
         params: list = []
@@ -443,54 +652,36 @@ class SQLiteStorage(BaseStorage):
         for key in ("overall_metrics", "run_config", "run_params", "hardware_info", "software_info"):
             if key in updates and isinstance(updates[key], dict):
                 updates[key] = _json_dumps(updates[key])
-        set_clause = ", ".join(f"{k} = ?" for k in updates)
         values = list(updates.values()) + [run_id]
-        await self._db.execute(
-            f"UPDATE eval_runs SET {set_clause} WHERE id = ?", values
-        )
+        await self._db.execute(_update_sql("eval_runs", tuple(updates)), values)
         await self._db.commit()
 
-    async def delete_run(self, run_id: str) -> None:
+    async def delete_run(self, run_id: str) -> bool:
         await self._db.execute("DELETE FROM eval_task_results WHERE run_id = ?", (run_id,))
         await self._db.execute("DELETE FROM eval_queue WHERE run_id = ?", (run_id,))
-        await self._db.execute("DELETE FROM eval_runs WHERE id = ?", (run_id,))
+        cursor = await self._db.execute("DELETE FROM eval_runs WHERE id = ?", (run_id,))
         await self._db.commit()
+        return cursor.rowcount > 0
 
     # --- Task Results ---
 
     async def create_task_result(self, result: dict) -> str:
         result_id = result.get("id") or _generate_id()
-        await self._db.execute(
-            """INSERT INTO eval_task_results (id, run_id, task_id, score, raw_score,
-               raw_metric_name, metrics, latency_ms, throughput, memory_peak_mb,
-               gpu_memory_peak_mb, sample_audio_path, sample_text, status, error_message,
-               started_at, completed_at, duration_seconds, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                result_id,
-                result["run_id"],
-                result["task_id"],
-                result.get("score"),
-                result.get("raw_score"),
-                result.get("raw_metric_name"),
-                _json_dumps(result.get("metrics", {})),
-                result.get("latency_ms"),
-                result.get("throughput"),
-                result.get("memory_peak_mb"),
-                result.get("gpu_memory_peak_mb"),
-                result.get("sample_audio_path"),
-                result.get("sample_text"),
-                result.get("status", "completed"),
-                result.get("error_message"),
-                result.get("started_at"),
-                result.get("completed_at"),
-                result.get("duration_seconds"),
-                _now(),
-            ),
-        )
+        await self._db.execute(_INSERT_TASK_RESULT, _task_result_row(result_id, result, _now()))
         await self._db.commit()
         return result_id
 
+    async def create_task_results(self, results: list[dict]) -> list[str]:
+        now = _now()
+        rows = [_task_result_row(result.get("id") or _generate_id(), result, now) for result in results]
+        try:
+            await self._db.executemany(_INSERT_TASK_RESULT, rows)
+        except Exception:
+            await self._db.rollback()
+            raise
+        await self._db.commit()
+        return [row[0] for row in rows]
+
     async def get_results_for_run(self, run_id: str) -> list[dict]:
         cursor = await self._db.execute(
             """SELECT r.*, t.name as task_name, t.education_tier, t.subject, t.task_type
@@ -503,6 +694,23 @@ class SQLiteStorage(BaseStorage):
         rows = await cursor.fetchall()
         return [_row_to_dict(r) for r in rows]
 
+    async def get_results_for_runs(self, run_ids: list[str]) -> dict[str, list[dict]]:
+        ids = list(dict.fromkeys(run_ids))
+        if not ids:
+            return {}
+        cursor = await self._db.execute(
+            f"""SELECT r.*, t.name as task_name, t.education_tier, t.subject, t.task_type
+               FROM eval_task_results r
+               JOIN eval_benchmark_tasks t ON r.task_id = t.id
+               WHERE r.run_id IN ({_placeholders(len(ids))})
+               ORDER BY t.order_index""",
+            ids,
+        )
+        by_run: dict[str, list[dict]] = {run_id: [] for run_id in ids}
+        for row in await cursor.fetchall():
+            by_run[row["run_id"]].append(_row_to_dict(row))
+        return by_run
+
     # --- Baselines ---
 
     async def create_baseline(self, baseline: dict) -> str:
@@ -551,11 +759,13 @@ class SQLiteStorage(BaseStorage):
         row = await cursor.fetchone()
         return _row_to_dict(row) if row else None
 
-    async def delete_baseline(self, baseline_id: str) -> None:
-        await self._db.execute(
-            "UPDATE eval_baselines SET is_active = FALSE WHERE id = ?", (baseline_id,)
+    async def delete_baseline(self, baseline_id: str) -> bool:
+        cursor = await self._db.execute(
+            "UPDATE eval_baselines SET is_active = FALSE WHERE id = ? AND is_active = TRUE",
+            (baseline_id,),
         )
         await self._db.commit()
+        return cursor.rowcount > 0
 
     # --- Queue ---
 
@@ -592,11 +802,8 @@ class SQLiteStorage(BaseStorage):
         return [_row_to_dict(r) for r in rows]
 
     async def update_queue_item(self, item_id: str, updates: dict) -> None:
-        set_clause = ", ".join(f"{k} = ?" for k in updates)
         values = list(updates.values()) + [item_id]
-        await self._db.execute(
-            f"UPDATE eval_queue SET {set_clause} WHERE id = ?", values
-        )
+        await self._db.execute(_update_sql("eval_queue", tuple(updates)), values)
         await self._db.commit()
 
     # --- Schedules ---
@@ -631,11 +838,8 @@ class SQLiteStorage(BaseStorage):
         return [_row_to_dict(r) for r in rows]
 
     async def update_schedule(self, schedule_id: str, updates: dict) -> None:
-        set_clause = ", ".join(f"{k} = ?" for k in updates)
         values = list(updates.values()) + [schedule_id]
-        await self._db.execute(
-            f"UPDATE eval_schedules SET {set_clause} WHERE id = ?", values
-        )
+        await self._db.execute(_update_sql("eval_schedules", tuple(updates)), values)
         await self._db.commit()
 
     async def delete_schedule(self, schedule_id: str) -> None:
@@ -698,8 +902,8 @@ class SQLiteStorage(BaseStorage):
         token = report.get("share_token") or _generate_id()
         await self._db.execute(
             """INSERT INTO eval_shared_reports (id, share_token, report_type, report_config,
-               is_active, expires_at, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+               is_active, expires_at, expires_at_ts, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
             (
                 report_id,
                 token,
@@ -707,6 +911,7 @@ class SQLiteStorage(BaseStorage):
                 _json_dumps(report["report_config"]),
                 True,
                 report.get("expires_at"),
+                report.get("expires_at_ts"),
                 _now(),
             ),
         )
@@ -728,6 +933,22 @@ class SQLiteStorage(BaseStorage):
         )
         await self._db.commit()
 
+    async def fetch_and_bump_share(self, token: str, now_ts: int) -> dict | None:
+        cursor = await self._db.execute(
+            """UPDATE eval_shared_reports SET view_count = view_count + 1
+               WHERE share_token = ? AND is_active = TRUE
+                 AND (expires_at_ts IS NULL OR expires_at_ts >= ?)""",
+            (token, now_ts),
+        )
+        await self._db.commit()
+        # The guarded UPDATE only matches a live share; rowcount stands in for
+        # RETURNING, as in update_suite_if_editable
+        if cursor.rowcount == 0:
+            return None
+        cursor = await self._db.execute("SELECT * FROM eval_shared_reports WHERE share_token = ?", (token,))
+        row = await cursor.fetchone()
+        return _row_to_dict(row) if row else None
+
     async def list_shared_reports(self) -> list[dict]:
         cursor = await self._db.execute(
             "SELECT * FROM eval_shared_reports WHERE is_active = TRUE ORDER BY created_at DESC"
@@ -740,3 +961,17 @@ class SQLiteStorage(BaseStorage):
             "UPDATE eval_shared_reports SET is_active = FALSE WHERE id = ?", (report_id,)
         )
         await self._db.commit()
+
+    # --- Metadata ---
+
+    async def get_meta(self, key: str) -> str | None:
+        cursor = await self._db.execute("SELECT value FROM eval_meta WHERE key = ?", (key,))
+        row = await cursor.fetchone()
+        return row["value"] if row else None
+
+    async def set_meta(self, key: str, value: str) -> None:
+        await self._db.execute(
+            "INSERT OR REPLACE INTO eval_meta (key, value, updated_at) VALUES (?, ?, ?)",
+            (key, value, _now()),
+        )
+        await self._db.commit()
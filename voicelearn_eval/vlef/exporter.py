@@ -1,47 +1,51 @@
 """Export evaluation results to VLEF (Voice Learning Eval Format)."""
 
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from voicelearn_eval.core.models import VLEFExport
 from voicelearn_eval.storage.base import BaseStorage
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
 
-async def export_vlef(
-    storage: BaseStorage,
-    run_ids: list[str] | None = None,
-    model_id: str | None = None,
-    export_all: bool = False,
-) -> dict:
-    """Export evaluation results to VLEF format.
+# Runs whose results are loaded per query while streaming an export
+_STREAM_BATCH = 50
 
-    Args:
-        storage: Storage backend
-        run_ids: Specific run IDs to export
-        model_id: Export all runs for a model
-        export_all: Export everything
 
-    Returns:
-        VLEF dict ready for JSON serialization
-    """
-    runs = []
-    models_seen = set()
-    suites_seen = set()
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
 
-    # Gather runs
+
+async def _gather_runs(
+    storage: BaseStorage,
+    run_ids: list[str] | None,
+    model_id: str | None,
+    export_all: bool,
+) -> list[dict]:
     if run_ids:
+        runs = []
         for rid in run_ids:
             run = await storage.get_run(rid)
             if run:
                 runs.append(run)
-    elif model_id:
-        runs = await storage.list_runs(filters={"model_id": model_id}, limit=1000)
-    elif export_all:
-        runs = await storage.list_runs(limit=1000)
-    else:
-        runs = await storage.list_runs(limit=100)
-
-    # Gather related models and suites
+        return runs
+    if model_id:
+        return await storage.list_runs(filters={"model_id": model_id}, limit=1000)
+    if export_all:
+        return await storage.list_runs(limit=1000)
+    return await storage.list_runs(limit=100)
+
+
+async def _gather_related(storage: BaseStorage, runs: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Return the models and suites (with tasks) referenced by ``runs``."""
+    models_seen = set()
+    suites_seen = set()
     model_dicts = []
     suite_dicts = []
 
@@ -61,27 +65,29 @@ async def export_vlef(
                 suite_dicts.append(s)
                 suites_seen.add(sid)
 
-    # Get results for each run
-    run_dicts = []
-    for run in runs:
-        results = await storage.get_results_for_run(run["id"])
-        run_dict = dict(run)
-        run_dict["results"] = results
-        # Parse JSON fields
-        for key in ("overall_metrics", "run_config", "run_params", "hardware_info", "software_info"):
-            if key in run_dict and isinstance(run_dict[key], str):
-                try:
-                    run_dict[key] = json.loads(run_dict[key])
-                except (json.JSONDecodeError, TypeError):
-                    pass
-        run_dicts.append(run_dict)
+    return model_dicts, suite_dicts
+
+
+def _run_record(run: dict, results: list[dict]) -> dict:
+    run_dict = dict(run)
+    run_dict["results"] = results
+    # Parse JSON fields
+    for key in ("overall_metrics", "run_config", "run_params", "hardware_info", "software_info"):
+        if key in run_dict and isinstance(run_dict[key], str):
+            try:
+                run_dict[key] = json.loads(run_dict[key])
+            except (json.JSONDecodeError, TypeError):
+                pass
+    return run_dict
 
+
+def _export_envelope(runs: list[dict], models: list[dict], suites: list[dict]) -> dict:
     export = VLEFExport(
         format_version="1.0",
         exported_at=datetime.utcnow().isoformat(),
-        runs=run_dicts,
-        models=model_dicts,
-        suites=suite_dicts,
+        runs=runs,
+        models=models,
+        suites=suites,
         environment={
             "tool": "voicelearn-eval",
             "version": "0.1.0",
@@ -91,5 +97,66 @@ async def export_vlef(
             "url": "https://github.com/UnaMentis/edu-voice-ai-eval",
         },
     )
-
     return export.to_dict()
+
+
+async def export_vlef(
+    storage: BaseStorage,
+    run_ids: list[str] | None = None,
+    model_id: str | None = None,
+    export_all: bool = False,
+) -> dict:
+    """Export evaluation results to VLEF format.
+
+    Args:
+        storage: Storage backend
+        run_ids: Specific run IDs to export
+        model_id: Export all runs for a model
+        export_all: Export everything
+
+    Returns:
+        VLEF dict ready for JSON serialization
+    """
+    runs = await _gather_runs(storage, run_ids, model_id, export_all)
+    model_dicts, suite_dicts = await _gather_related(storage, runs)
+
+    # Get results for each run
+    run_dicts = []
+    for run in runs:
+        results = await storage.get_results_for_run(run["id"])
+        run_dicts.append(_run_record(run, results))
+
+    return _export_envelope(run_dicts, model_dicts, suite_dicts)
+
+
+async def stream_vlef(
+    storage: BaseStorage,
+    run_ids: list[str] | None = None,
+    model_id: str | None = None,
+    export_all: bool = False,
+) -> AsyncIterator[bytes]:
+    """Yield the same VLEF document as :func:`export_vlef`, as JSON byte chunks.
+
+    Run results, the bulk of an export, are loaded and serialized a batch of
+    runs at a time, so memory stays bounded however many runs are exported.
+    """
+    runs = await _gather_runs(storage, run_ids, model_id, export_all)
+    model_dicts, suite_dicts = await _gather_related(storage, runs)
+    envelope = _export_envelope([], model_dicts, suite_dicts)
+
+    sep = b"{"
+    for key, value in envelope.items():
+        yield sep + _dumps(key) + b":"
+        sep = b","
+        if key != "runs":
+            yield _dumps(value)
+            continue
+        yield b"["
+        for start in range(0, len(runs), _STREAM_BATCH):
+            batch = runs[start:start + _STREAM_BATCH]
+            results_by_run = await storage.get_results_for_runs([run["id"] for run in batch])
+            for i, run in enumerate(batch):
+                chunk = _dumps(_run_record(run, results_by_run[run["id"]]))
+                yield chunk if start + i == 0 else b"," + chunk
+        yield b"]"
+    yield b"}"
@@ -64,7 +64,8 @@ async def import_vlef(
 
             for result in results:
                 result["run_id"] = run_id
-                await storage.create_task_result(result)
-                summary["results_imported"] += 1
+            if results:
+                await storage.create_task_results(results)
+                summary["results_imported"] += len(results)
 
     return summary
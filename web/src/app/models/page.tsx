@@ -158,7 +158,7 @@ function MyModelsTab() {
   const [hfModelType, setHfModelType] = useState("llm");
   const [submitting, setSubmitting] = useState(false);
 
-  // Download polling
+  // Models with a download in progress
   const [downloadingIds, setDownloadingIds] = useState<Set<string>>(new Set());
 
   const fetchModels = useCallback(async () => {
@@ -186,11 +186,32 @@ function MyModelsTab() {
     fetchModels();
   }, [fetchModels]);
 
-  // Poll for download progress
+  // Follow download progress over one SSE stream; poll only if it is unavailable
   useEffect(() => {
     if (downloadingIds.size === 0) return;
-    const timer = setInterval(fetchModels, 3000);
-    return () => clearInterval(timer);
+    let timer: ReturnType<typeof setInterval> | undefined;
+    const startPolling = () => {
+      if (!timer) timer = setInterval(fetchModels, 3000);
+    };
+    const unsubscribe = api.subscribeDownloads({
+      onEvent: (event) => {
+        setModels((prev) =>
+          prev.map((m) =>
+            m.id === event.model_id ? { ...m, download_progress: event.percent } : m
+          )
+        );
+        // Events mark a download starting or finishing; reload to pick up its status
+        fetchModels();
+      },
+      // Catch up on anything that finished before (or while) connecting
+      onOpen: fetchModels,
+      onClosed: startPolling,
+    });
+    if (!unsubscribe) startPolling();
+    return () => {
+      unsubscribe?.();
+      if (timer) clearInterval(timer);
+    };
   }, [downloadingIds.size, fetchModels]);
 
   async function handleAddModel(e: React.FormEvent) {
@@ -17,14 +17,14 @@ export default function OverviewPage() {
     async function fetchData() {
       try {
         const [modelsRes, runsRes, suitesRes] = await Promise.all([
-          api.listModels(),
-          api.listRuns({ limit: "10" }),
+          api.listModels({ with_total: "true" }),
+          api.listRuns({ limit: "10", with_total: "true" }),
           api.listSuites(),
         ]);
         setModels(modelsRes.items);
-        setTotalModels(modelsRes.total);
+        setTotalModels(modelsRes.total ?? 0);
         setRuns(runsRes.items);
-        setTotalRuns(runsRes.total);
+        setTotalRuns(runsRes.total ?? 0);
         setSuites(suitesRes.items);
       } catch (err) {
         setError(err instanceof Error ? err.message : "Failed to load data");
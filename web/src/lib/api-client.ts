@@ -10,6 +10,7 @@ import type {
   TaskResult,
   PaginatedResponse,
   HuggingFaceSearchResult,
+  DownloadProgressEvent,
 } from "@/types/evaluation";
 
 const BASE = "/api/eval";
@@ -101,6 +102,27 @@ export const api = {
       method: "POST",
     }),
 
+  /**
+   * Subscribe to download progress for all models over one Server-Sent
+   * Events stream. `onOpen` fires on every (re)connect; the browser retries
+   * dropped connections itself, and `onClosed` fires only once it gives up.
+   * Returns an unsubscribe function, or null where EventSource is unavailable.
+   */
+  subscribeDownloads: (handlers: {
+    onEvent: (event: DownloadProgressEvent) => void;
+    onOpen?: () => void;
+    onClosed?: () => void;
+  }): (() => void) | null => {
+    if (typeof EventSource === "undefined") return null;
+    const source = new EventSource(`${BASE}/models/downloads/stream`);
+    source.onmessage = (msg) => handlers.onEvent(JSON.parse(msg.data) as DownloadProgressEvent);
+    source.onopen = () => handlers.onOpen?.();
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) handlers.onClosed?.();
+    };
+    return () => source.close();
+  },
+
   // ── Suites ───────────────────────────────────────────────
 
   listSuites: () =>
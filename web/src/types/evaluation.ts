@@ -127,7 +127,20 @@ export interface HuggingFaceSearchResult {
 
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  /** Only present when the request passed `with_total=true`. */
+  total?: number;
   limit: number;
   offset: number;
+  has_more: boolean;
+  /** Pass back as `after` to fetch the next page; null on the last page. */
+  next_cursor: string | null;
+}
+
+// ── Download progress stream event ───────────────────────────
+
+export interface DownloadProgressEvent {
+  type: "download_progress";
+  model_id: string;
+  percent: number;
+  message: string;
 }